@@ -5,11 +5,14 @@ A REST API server for the ghost-blog-smart library with comprehensive blog manag
 Enhanced with better error handling and validation.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from functools import wraps
 import os
+import json
+import queue
 import logging
+import threading
 from datetime import datetime
 from werkzeug.exceptions import BadRequest, Unauthorized, NotFound, InternalServerError
 
@@ -27,7 +30,10 @@ from ghost_blog_smart import (
     batch_get_post_details,
     find_posts_by_date_pattern,
     GhostBlogSmart,
+    warm_up_gemini,
 )
+from ghost_blog_smart.main_functions import GEMINI_FLASH_MODEL
+from ghost_blog_smart.job_queue import get_job_queue
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -42,6 +48,17 @@ logger = logging.getLogger(__name__)
 # Configuration
 API_KEY_HEADER = "X-API-Key"
 REQUIRED_API_KEY = os.environ.get("FLASK_API_KEY")
+# Seconds between keep-alive comments on idle SSE streams
+SSE_HEARTBEAT_SECONDS = float(os.environ.get("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Optionally prepare the shared Gemini client in the background at worker start,
+# so the first AI request does not pay client setup and TLS handshake
+if os.environ.get("GEMINI_WARMUP", "false").lower() == "true" and os.environ.get(
+    "GEMINI_API_KEY"
+):
+    threading.Thread(
+        target=warm_up_gemini, args=([GEMINI_FLASH_MODEL],), daemon=True
+    ).start()
 
 # ============================================================================
 # AUTHENTICATION & MIDDLEWARE
@@ -78,10 +95,8 @@ def validate_json():
     return request.get_json() or {}
 
 
-def standardize_response(
-    success=True, data=None, error=None, message=None, status_code=200
-):
-    """Standardize API response format"""
+def standardize_body(success=True, data=None, error=None, message=None):
+    """Build the standard response body (shared by JSON and SSE responses)"""
     response = {"success": success, "timestamp": datetime.utcnow().isoformat() + "Z"}
 
     if success:
@@ -94,7 +109,59 @@ def standardize_response(
         if message:
             response["message"] = message
 
-    return jsonify(response), status_code
+    return response
+
+
+def standardize_response(
+    success=True, data=None, error=None, message=None, status_code=200
+):
+    """Standardize API response format"""
+    return jsonify(standardize_body(success, data, error, message)), status_code
+
+
+def format_sse(event, data):
+    """Serialize one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def add_server_timing(response, timings):
+    """Attach stage timings (seconds) to a response as a Server-Timing header"""
+    if timings:
+        flask_response, status_code = response
+        flask_response.headers["Server-Timing"] = ", ".join(
+            f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items()
+        )
+        return flask_response, status_code
+    return response
+
+
+def wants_async(data):
+    """
+    True if the client opted into async mode, via "async": true in the body
+    or a 'Prefer: respond-async' header. Removes the 'async' field from data.
+    """
+    flag = data.pop("async", None)
+    if flag is not None:
+        return str(flag).lower() in ("true", "1", "yes")
+    return "respond-async" in request.headers.get("Prefer", "").lower()
+
+
+def enqueue_job(kind, func, data):
+    """
+    Run func(**data) on the background job queue and answer 202 Accepted
+    with the job ID; the result is available from /api/jobs/<job_id>
+    """
+    job_id = get_job_queue().submit(
+        kind, lambda: safe_call_ghost_function(func, **data), params=data
+    )
+    status_url = f"/api/jobs/{job_id}"
+    flask_response, status_code = standardize_response(
+        data={"job_id": job_id, "status": "queued", "status_url": status_url},
+        message="Job accepted",
+        status_code=202,
+    )
+    flask_response.headers["Location"] = status_url
+    return flask_response, status_code
 
 
 def safe_call_ghost_function(func, **kwargs):
@@ -113,6 +180,7 @@ def safe_call_ghost_function(func, **kwargs):
                     "success": False,
                     "message": result.get("message", "Operation failed"),
                     "error": result.get("error"),
+                    "timings": result.get("timings"),
                 }
         else:
             # Handle non-dict responses
@@ -152,6 +220,8 @@ def root():
                 "health": "/health",
                 "posts": "/api/posts",
                 "smart_create": "/api/smart-create",
+                "smart_create_stream": "/api/smart-create/stream",
+                "jobs": "/api/jobs/<job_id>",
                 "documentation": "See README.md for full API documentation",
             },
             "improvements": [
@@ -218,17 +288,26 @@ def create_post():
         # Add credentials
         data.update(_extract_ghost_credentials())
 
+        if wants_async(data):
+            return enqueue_job("create_post", create_ghost_blog_post, data)
+
         # Call ghost_blog_smart function
         result = safe_call_ghost_function(create_ghost_blog_post, **data)
 
         if result.get("success"):
-            return standardize_response(data=result.get("data"))
+            return add_server_timing(
+                standardize_response(data=result.get("data")),
+                result["data"].get("timings"),
+            )
         else:
-            return standardize_response(
-                success=False,
-                error="Blog post creation failed",
-                message=result.get("message", "Unknown error"),
-                status_code=400,
+            return add_server_timing(
+                standardize_response(
+                    success=False,
+                    error="Blog post creation failed",
+                    message=result.get("message", "Unknown error"),
+                    status_code=400,
+                ),
+                result.get("timings"),
             )
 
     except Exception as e:
@@ -241,48 +320,68 @@ def create_post():
         )
 
 
+def _parse_smart_create_request():
+    """
+    Validate a smart-create request body
+
+    Returns:
+        tuple: (data with credentials added, None) or (None, error response)
+    """
+    data = validate_json()
+
+    # Required field validation
+    if "user_input" not in data:
+        return None, standardize_response(
+            success=False,
+            error="Missing required field",
+            message="user_input is required",
+            status_code=400,
+        )
+
+    # Sanitize input
+    data["user_input"] = str(data["user_input"]).strip()
+
+    if not data["user_input"]:
+        return None, standardize_response(
+            success=False,
+            error="Empty user input",
+            message="user_input cannot be empty",
+            status_code=400,
+        )
+
+    # Add credentials
+    data.update(_extract_ghost_credentials())
+    return data, None
+
+
+def _smart_create_body(result):
+    """Response body for a smart gateway result"""
+    if result.get("success"):
+        return standardize_body(data=result.get("data"))
+    return standardize_body(
+        success=False,
+        error="Smart blog creation failed",
+        message=result.get("message", "Unknown error"),
+    )
+
+
 @app.route("/api/smart-create", methods=["POST"])
 @require_api_key
 def smart_create_post():
     """Create blog post using AI-powered smart gateway"""
     try:
-        data = validate_json()
+        data, error_response = _parse_smart_create_request()
+        if error_response:
+            return error_response
 
-        # Required field validation
-        if "user_input" not in data:
-            return standardize_response(
-                success=False,
-                error="Missing required field",
-                message="user_input is required",
-                status_code=400,
-            )
-
-        # Sanitize input
-        data["user_input"] = str(data["user_input"]).strip()
-
-        if not data["user_input"]:
-            return standardize_response(
-                success=False,
-                error="Empty user input",
-                message="user_input cannot be empty",
-                status_code=400,
-            )
-
-        # Add credentials
-        data.update(_extract_ghost_credentials())
+        if wants_async(data):
+            return enqueue_job("smart_create", smart_blog_gateway, data)
 
         # Call smart gateway
         result = safe_call_ghost_function(smart_blog_gateway, **data)
 
-        if result.get("success"):
-            return standardize_response(data=result.get("data"))
-        else:
-            return standardize_response(
-                success=False,
-                error="Smart blog creation failed",
-                message=result.get("message", "Unknown error"),
-                status_code=400,
-            )
+        status_code = 200 if result.get("success") else 400
+        return jsonify(_smart_create_body(result)), status_code
 
     except Exception as e:
         logger.error(f"Error in smart create: {str(e)}")
@@ -294,6 +393,79 @@ def smart_create_post():
         )
 
 
+@app.route("/api/smart-create/stream", methods=["POST"])
+@require_api_key
+def smart_create_stream():
+    """
+    Smart create with Server-Sent Events progress
+
+    Emits 'accepted' immediately, then 'route' and 'stage' (started/finished)
+    events as the gateway runs, and finally a 'result' event carrying the same
+    body /api/smart-create would return. Idle periods send keep-alive comments.
+    """
+    try:
+        data, error_response = _parse_smart_create_request()
+        if error_response:
+            return error_response
+    except Exception as e:
+        logger.error(f"Error in smart create stream: {str(e)}")
+        return standardize_response(
+            success=False,
+            error="Internal server error",
+            message=str(e),
+            status_code=500,
+        )
+
+    # The stream supplies its own progress callback
+    data.pop("progress_callback", None)
+    events = queue.Queue()
+
+    def progress(event, payload):
+        # Called from the gateway thread and its image worker thread
+        events.put((event, payload))
+
+    def run_gateway():
+        # The stream only ends on None, so it is queued whatever happens here
+        try:
+            result = safe_call_ghost_function(
+                smart_blog_gateway, progress_callback=progress, **data
+            )
+            events.put(("result", _smart_create_body(result)))
+        except Exception as e:
+            logger.error(f"Error in smart create stream: {str(e)}")
+            events.put(
+                (
+                    "result",
+                    standardize_body(
+                        success=False, error="Internal server error", message=str(e)
+                    ),
+                )
+            )
+        finally:
+            events.put(None)
+
+    # The gateway runs to completion even if the client disconnects
+    threading.Thread(target=run_gateway, daemon=True).start()
+
+    def stream():
+        yield format_sse("accepted", standardize_body(message="Smart create started"))
+        while True:
+            try:
+                item = events.get(timeout=SSE_HEARTBEAT_SECONDS)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            if item is None:
+                break
+            yield format_sse(*item)
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ============================================================================
 # BLOG RETRIEVAL ENDPOINTS
 # ============================================================================
@@ -557,6 +729,9 @@ def update_post_image(post_id):
         data["post_id"] = str(post_id).strip()
         data.update(_extract_ghost_credentials())
 
+        if wants_async(data):
+            return enqueue_job("update_post_image", update_ghost_post_image, data)
+
         result = safe_call_ghost_function(update_ghost_post_image, **data)
 
         if result.get("success"):
@@ -810,6 +985,36 @@ def search_by_date_pattern():
         )
 
 
+# ============================================================================
+# JOB ENDPOINTS
+# ============================================================================
+
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+@require_api_key
+def get_job(job_id):
+    """Status and result of a job started in async mode"""
+    try:
+        job = get_job_queue().get(str(job_id).strip())
+        if job is None:
+            return standardize_response(
+                success=False,
+                error="Job not found",
+                message=f"No job with ID {job_id}",
+                status_code=404,
+            )
+        return standardize_response(data=job)
+
+    except Exception as e:
+        logger.error(f"Error retrieving job: {str(e)}")
+        return standardize_response(
+            success=False,
+            error="Internal server error",
+            message=str(e),
+            status_code=500,
+        )
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
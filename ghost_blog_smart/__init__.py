@@ -1,7 +1,7 @@
 """
 Ghost Blog Smart - A powerful Python API for creating Ghost CMS blog posts with AI-powered features
 
-This library supports two usage patterns:
+This library supports three usage patterns:
 
 1. Class-based (Recommended for code assistants):
    ```python
@@ -11,14 +11,22 @@ This library supports two usage patterns:
    result = client.create_post(title="My Post", content="Content...")
    ```
 
-2. Function-based (Direct):
+2. Async class-based (for asyncio services):
+   ```python
+   from ghost_blog_smart import AsyncGhostBlogSmart
+
+   async with AsyncGhostBlogSmart() as client:
+       result = await client.create_post(title="My Post", content="Content...")
+   ```
+
+3. Function-based (Direct):
    ```python
    from ghost_blog_smart import create_ghost_blog_post
 
    result = create_ghost_blog_post(title="My Post", content="Content...")
    ```
 
-Both approaches work with the same underlying functions and provide identical functionality.
+All approaches work with the same underlying functions and provide identical functionality.
 """
 
 __version__ = "1.0.16"
@@ -27,6 +35,7 @@ __email__ = "me@leowang.net"
 
 # Import the main client class
 from .client import GhostBlogSmart, create_client
+from .async_client import AsyncGhostBlogSmart
 
 # Import main functions for direct access
 from .main_functions import (
@@ -41,14 +50,51 @@ from .main_functions import (
 from .post_management import (
     get_ghost_post_details,
     get_ghost_posts_advanced,
+    iter_ghost_posts,
     get_posts_summary,
     batch_get_post_details,
+    batch_update_posts,
+    batch_delete_posts,
     find_posts_by_date_pattern,
 )
 
 from .smart_gateway import smart_blog_gateway
 
-from .clean_imagen_generator import CleanImagenGenerator
+from .ghost_http import (
+    configure_ghost_http,
+    get_ghost_session,
+    close_ghost_sessions,
+)
+
+from .ghost_ratelimit import configure_ghost_rate_limit
+
+from .ghost_auth import get_ghost_token, clear_ghost_token_cache
+
+from .concurrency import (
+    configure_batch_concurrency,
+    run_bounded,
+    run_post_operations,
+)
+
+from .gemini_client import (
+    GeminiModel,
+    get_gemini_client,
+    get_gemini_model,
+    warm_up_gemini,
+    clear_gemini_clients,
+)
+
+from .llm_cache import configure_llm_cache, get_llm_cache_stats
+from .image_cache import configure_image_cache, get_image_cache_stats
+from .image_optimizer import configure_image_optimizer
+from .image_store import configure_image_store, get_image_store, get_image_store_stats
+from .job_queue import JobQueue, configure_job_queue, get_job_queue
+
+from .clean_imagen_generator import (
+    CleanImagenGenerator,
+    get_image_generator,
+    clear_image_generators,
+)
 
 from .blog_post_refine_prompt import (
     BLOG_POST_REFINE_SYSTEM_PROMPT,
@@ -98,6 +144,7 @@ __all__ = [
     # Main client class (NEW - recommended)
     "GhostBlogSmart",
     "create_client",
+    "AsyncGhostBlogSmart",
     # Main functions (existing)
     "create_ghost_blog_post",
     "update_ghost_post",
@@ -108,11 +155,50 @@ __all__ = [
     # Post management
     "get_ghost_post_details",
     "get_ghost_posts_advanced",
+    "iter_ghost_posts",
     "get_posts_summary",
     "batch_get_post_details",
+    "batch_update_posts",
+    "batch_delete_posts",
     "find_posts_by_date_pattern",
-    # Classes
+    # Ghost HTTP transport
+    "configure_ghost_http",
+    "get_ghost_session",
+    "close_ghost_sessions",
+    "configure_ghost_rate_limit",
+    # Ghost authentication
+    "get_ghost_token",
+    "clear_ghost_token_cache",
+    # Batch concurrency
+    "configure_batch_concurrency",
+    "run_bounded",
+    "run_post_operations",
+    # Gemini client registry
+    "GeminiModel",
+    "get_gemini_client",
+    "get_gemini_model",
+    "warm_up_gemini",
+    "clear_gemini_clients",
+    # LLM response cache
+    "configure_llm_cache",
+    "get_llm_cache_stats",
+    # Image upload cache
+    "configure_image_cache",
+    "get_image_cache_stats",
+    # Image optimization
+    "configure_image_optimizer",
+    # Generated image store
+    "configure_image_store",
+    "get_image_store",
+    "get_image_store_stats",
+    # Background job queue
+    "JobQueue",
+    "configure_job_queue",
+    "get_job_queue",
+    # Image generators
     "CleanImagenGenerator",
+    "get_image_generator",
+    "clear_image_generators",
     # Smart Gateway
     "smart_blog_gateway",
     # Prompts
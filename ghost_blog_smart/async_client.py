@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+"""
+AsyncGhostBlogSmart Client Class
+asyncio counterpart of GhostBlogSmart for services running on an event loop.
+Ghost Admin API calls run natively on a pooled httpx.AsyncClient, so one loop can
+keep hundreds of Ghost requests in flight. They share the per-site rate limiter
+and retry policy of the sync transport (ghost_ratelimit, ghost_http), waiting
+with asyncio.sleep instead of blocking the loop. The AI pipelines (create, smart gateway,
+image update) are driven by blocking Gemini/Imagen SDKs and run on a bounded
+thread pool so they never block the loop.
+"""
+
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, AsyncIterator
+from dotenv import load_dotenv
+
+from .main_functions import (
+    create_ghost_blog_post,
+    update_ghost_post_image,
+    _build_post_update_fields,
+    _summarize_post_updates,
+    _update_already_applied,
+    _update_conflict,
+)
+
+from .post_management import (
+    _build_posts_query_params,
+    _build_posts_listing_result,
+    _build_full_archive_data,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PREFETCH_WORKERS,
+    _build_post_details_params,
+    _enrich_post_details,
+    _chunk_post_ids,
+    _build_batch_details_params,
+    _collect_batch_details,
+)
+
+from .smart_gateway import smart_blog_gateway
+
+from .ghost_auth import get_ghost_token
+
+from .ghost_http import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUSES,
+    _http_config,
+    _site_key,
+    retry_delay,
+)
+
+from .ghost_ratelimit import (
+    _rate_config,
+    get_rate_limiter,
+    is_throttled,
+    parse_retry_after,
+)
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_AI_WORKERS = 8
+
+
+class AsyncGhostBlogSmart:
+    """
+    AsyncGhostBlogSmart Client - asyncio interface for Ghost CMS
+
+    Mirrors the GhostBlogSmart method names, but every method is a coroutine.
+
+    Usage:
+        async with AsyncGhostBlogSmart() as client:
+            result = await client.create_post(
+                title="My Blog Post",
+                content="This is the content of my blog post..."
+            )
+
+            details = await client.batch_get_post_details(["id1", "id2"])
+    """
+
+    def __init__(
+        self,
+        ghost_url: Optional[str] = None,
+        ghost_api_key: Optional[str] = None,
+        gemini_api_key: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        ai_workers: int = DEFAULT_AI_WORKERS,
+    ):
+        """
+        Initialize AsyncGhostBlogSmart client
+
+        Args:
+            ghost_url: Ghost blog URL (optional, defaults to GHOST_API_URL env var)
+            ghost_api_key: Ghost Admin API key (optional, defaults to GHOST_ADMIN_API_KEY env var)
+            gemini_api_key: Gemini API key (optional, defaults to GEMINI_API_KEY env var)
+            max_connections: Maximum concurrent connections in the HTTP pool
+            max_keepalive_connections: Idle keep-alive connections kept in the pool
+            timeout: Default Ghost request timeout in seconds
+            ai_workers: Threads available for concurrent AI pipelines
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for AsyncGhostBlogSmart. Install with: pip install httpx"
+            )
+
+        # Set up API credentials with fallback to environment variables
+        self.ghost_api_url = (
+            ghost_url or os.getenv("GHOST_API_URL") or os.getenv("GHOST_BLOG_URL")
+        )
+        self.ghost_admin_api_key = (
+            ghost_api_key
+            or os.getenv("GHOST_ADMIN_API_KEY")
+            or os.getenv("GHOST_BLOG_ADMIN_API_KEY")
+        )
+        self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
+
+        # Validate required credentials
+        if not self.ghost_api_url:
+            raise ValueError(
+                "Ghost API URL is required. Set GHOST_API_URL environment variable or pass ghost_url parameter."
+            )
+        if not self.ghost_admin_api_key:
+            raise ValueError(
+                "Ghost Admin API Key is required. Set GHOST_ADMIN_API_KEY environment variable or pass ghost_api_key parameter."
+            )
+
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+        # Connection errors and timeouts, retried like requests' in ghost_http
+        self._transport_errors = (httpx.TransportError,)
+        self._ai_executor = ThreadPoolExecutor(
+            max_workers=ai_workers, thread_name_prefix="ghost-blog-smart-ai"
+        )
+
+    # ============================================================================
+    # INTERNAL HELPERS
+    # ============================================================================
+
+    def _prepare_kwargs(self, **kwargs) -> Dict[str, Any]:
+        """Prepare kwargs with API credentials for function calls"""
+        result = kwargs.copy()
+        result.setdefault("ghost_api_url", self.ghost_api_url)
+        result.setdefault("ghost_admin_api_key", self.ghost_admin_api_key)
+        if self.gemini_api_key:
+            result.setdefault("gemini_api_key", self.gemini_api_key)
+        return result
+
+    @staticmethod
+    def _headers(admin_key: str) -> Dict[str, str]:
+        """Ghost Admin API headers (raises ValueError on a malformed key)"""
+        return {
+            "Authorization": f"Ghost {get_ghost_token(admin_key)}",
+            "Content-Type": "application/json",
+        }
+
+    async def _send_paced(self, limiter, method: str, url: str, kwargs):
+        """Send one request under the site's rate limiter, waiting out throttling"""
+        if limiter is None:
+            return await self._http.request(method, url, **kwargs)
+
+        attempt = 0
+        while True:
+            wait = limiter.try_acquire()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = limiter.try_acquire()
+            response = await self._http.request(method, url, **kwargs)
+
+            if not is_throttled(response):
+                limiter.reward()
+                return response
+
+            limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+            if attempt >= _rate_config["throttle_retries"]:
+                return response
+            attempt += 1
+
+    async def _request(self, method: str, url: str, **kwargs):
+        """
+        Async counterpart of ghost_http.ghost_request
+
+        Paced by the same per-site token bucket as sync calls; idempotent
+        requests hitting a transport error or a 5xx are retried with
+        full-jitter backoff.
+        """
+        retries = _http_config["retries"] if method.upper() in IDEMPOTENT_METHODS else 0
+        limiter = get_rate_limiter(_site_key(url))
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_paced(limiter, method, url, kwargs)
+                if response.status_code not in RETRYABLE_STATUSES or attempt >= retries:
+                    return response
+                # Throttled 503s were already waited out by _send_paced
+                if limiter is not None and is_throttled(response):
+                    return response
+            except self._transport_errors:
+                if attempt >= retries:
+                    raise
+
+            await asyncio.sleep(retry_delay(attempt))
+            attempt += 1
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking library function on the AI thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._ai_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    # ============================================================================
+    # BLOG POST CREATION METHODS
+    # ============================================================================
+
+    async def create_post(self, title: str, content: str, **kwargs) -> Dict[str, Any]:
+        """
+        Create a new blog post
+
+        Args:
+            title: Blog post title
+            content: Blog post content (markdown or plain text)
+            **kwargs: Additional parameters (excerpt, tags, status, etc.)
+
+        Returns:
+            Dict with success status, URL, and post ID
+        """
+        params = self._prepare_kwargs(title=title, content=content, **kwargs)
+        return await self._run_blocking(create_ghost_blog_post, **params)
+
+    async def smart_create_post(self, user_input: str, **kwargs) -> Dict[str, Any]:
+        """
+        Create a blog post using AI-powered smart gateway
+
+        Args:
+            user_input: Raw content, ideas, or complete blog post
+            **kwargs: Additional parameters (status, preferred_language, etc.)
+
+        Returns:
+            Dict with success status, URL, and post ID
+        """
+        params = self._prepare_kwargs(**kwargs)
+        return await self._run_blocking(smart_blog_gateway, user_input, **params)
+
+    # ============================================================================
+    # BLOG POST MANAGEMENT METHODS
+    # ============================================================================
+
+    async def get_posts(self, **kwargs) -> Dict[str, Any]:
+        """
+        Get list of blog posts
+
+        Args:
+            **kwargs: Query parameters (limit, page, status)
+
+        Returns:
+            Dict with success status, posts list and pagination meta
+        """
+        params = self._prepare_kwargs(**kwargs)
+        try:
+            query = {
+                "limit": params.get("limit", 15),
+                "page": params.get("page", 1),
+                "include": "tags,authors",
+                "formats": "html,mobiledoc",
+            }
+            status = params.get("status", "all")
+            if status != "all":
+                query["filter"] = f"status:{status}"
+
+            response = await self._request(
+                "GET",
+                f"{params['ghost_api_url']}/ghost/api/admin/posts/",
+                headers=self._headers(params["ghost_admin_api_key"]),
+                params=query,
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return {
+                    "success": True,
+                    "posts": data.get("posts", []),
+                    "meta": data.get("meta", {}),
+                }
+            return {
+                "success": False,
+                "message": f"Failed to get posts: {response.status_code}",
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error getting posts: {str(e)}"}
+
+    async def get_posts_advanced(self, **kwargs) -> Dict[str, Any]:
+        """
+        Get posts with advanced filtering options (same options as get_ghost_posts_advanced)
+
+        Args:
+            **kwargs: Advanced filter parameters
+
+        Returns:
+            Dict with success status and filtered posts
+        """
+        params = self._prepare_kwargs(**kwargs)
+        try:
+            if params.get("get_all"):
+                return await self._fetch_all_posts_parallel(params)
+
+            response = await self._request(
+                "GET",
+                f"{params['ghost_api_url']}/ghost/api/admin/posts/",
+                headers=self._headers(params["ghost_admin_api_key"]),
+                params=_build_posts_query_params(params),
+            )
+
+            if response.status_code == 200:
+                return _build_posts_listing_result(response.json())
+            return {
+                "success": False,
+                "message": f"Failed to get posts: {response.status_code}",
+                "error": response.text,
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error getting posts: {str(e)}"}
+
+    async def _fetch_all_posts_parallel(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch page 1, then the remaining pages concurrently, merged in page order"""
+        page_size = max(1, int(params.get("page_size", DEFAULT_PAGE_SIZE)))
+        max_workers = max(1, int(params.get("max_workers", DEFAULT_PREFETCH_WORKERS)))
+
+        query_kwargs = {
+            k: v for k, v in params.items() if k not in ("get_all", "limit", "page")
+        }
+        base_params = _build_posts_query_params(query_kwargs)
+        base_params["limit"] = page_size
+        url = f"{params['ghost_api_url']}/ghost/api/admin/posts/"
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch_page(page):
+            async with semaphore:
+                response = await self._request(
+                    "GET",
+                    url,
+                    headers=self._headers(params["ghost_admin_api_key"]),
+                    params={**base_params, "page": page},
+                )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to get posts page {page}: "
+                    f"{response.status_code} {response.text}"
+                )
+            return response.json()
+
+        first_page = await fetch_page(1)
+        pages = first_page.get("meta", {}).get("pagination", {}).get("pages") or 1
+        other_pages = await asyncio.gather(
+            *(fetch_page(page) for page in range(2, pages + 1))
+        )
+        return _build_posts_listing_result(
+            _build_full_archive_data(first_page, list(other_pages))
+        )
+
+    async def iter_posts(
+        self, page_size: int = 100, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream posts one at a time, paging through the whole archive
+
+        Args:
+            page_size: Posts fetched per request
+            **kwargs: Advanced filter parameters (same as get_posts_advanced)
+
+        Yields:
+            Post objects, one page in memory at a time
+
+        Raises:
+            RuntimeError: If Ghost returns a non-200 response
+        """
+        params = self._prepare_kwargs(**kwargs)
+        query_kwargs = {
+            k: v for k, v in params.items() if k not in ("get_all", "limit", "page")
+        }
+        query = _build_posts_query_params(query_kwargs)
+        query["limit"] = max(1, int(page_size))
+
+        page = 1
+        while True:
+            query["page"] = page
+            response = await self._request(
+                "GET",
+                f"{params['ghost_api_url']}/ghost/api/admin/posts/",
+                headers=self._headers(params["ghost_admin_api_key"]),
+                params=query,
+            )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to get posts page {page}: {response.status_code} {response.text}"
+                )
+
+            data = response.json()
+            posts = data.get("posts", [])
+            for post in posts:
+                yield post
+
+            pagination = data.get("meta", {}).get("pagination", {})
+            if not posts or not pagination.get("next"):
+                break
+            page = pagination["next"]
+
+    async def get_post_details(self, post_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific post
+
+        Args:
+            post_id: The Ghost post ID
+            **kwargs: Options for included content (same as get_ghost_post_details)
+
+        Returns:
+            Dict with success status and complete post details
+        """
+        if not post_id or str(post_id).strip() == "":
+            return {"success": False, "message": "Post ID is required"}
+
+        params = self._prepare_kwargs(**kwargs)
+        try:
+            response = await self._request(
+                "GET",
+                f"{params['ghost_api_url']}/ghost/api/admin/posts/{post_id}/",
+                headers=self._headers(params["ghost_admin_api_key"]),
+                params=_build_post_details_params(params),
+            )
+
+            if response.status_code == 200:
+                posts = response.json().get("posts", [])
+                if not posts:
+                    return {"success": False, "message": f"Post not found: {post_id}"}
+                return {"success": True, "post": _enrich_post_details(posts[0])}
+            elif response.status_code == 404:
+                return {"success": False, "message": f"Post not found: {post_id}"}
+            return {
+                "success": False,
+                "message": f"Failed to get post details: {response.status_code}",
+                "error": response.text,
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Error getting post details: {str(e)}",
+            }
+
+    # ============================================================================
+    # BLOG POST UPDATE METHODS
+    # ============================================================================
+
+    async def update_post(self, post_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Update various properties of a blog post
+
+        Args:
+            post_id: The ID of the post to update
+            **kwargs: Fields to update (title, content, status, featured, etc.)
+
+        Returns:
+            Dict with success status and update info
+        """
+        params = self._prepare_kwargs(**kwargs)
+        api_url = params["ghost_api_url"]
+        post_url = f"{api_url}/ghost/api/admin/posts/{post_id}/"
+        try:
+            headers = self._headers(params["ghost_admin_api_key"])
+
+            # Get current post for updated_at (Ghost optimistic locking)
+            get_response = await self._request("GET", post_url, headers=headers)
+            if get_response.status_code != 200:
+                return {"success": False, "message": f"Post not found: {post_id}"}
+            current_post = get_response.json()["posts"][0]
+
+            update_fields = _build_post_update_fields(params)
+            update_fields["updated_at"] = current_post["updated_at"]
+
+            response = await self._request(
+                "PUT", post_url, headers=headers, json={"posts": [update_fields]}
+            )
+
+            updated_post = None
+            if response.status_code == 200:
+                updated_post = response.json()["posts"][0]
+            elif response.status_code == 409:
+                # Same rule as update_ghost_post: a collision is only success
+                # when it was our own retried PUT that landed first
+                refreshed = await self._request(
+                    "GET",
+                    post_url,
+                    headers=headers,
+                    params={"formats": "html"} if "html" in update_fields else None,
+                )
+                if refreshed.status_code == 200:
+                    post = refreshed.json()["posts"][0]
+                    if _update_already_applied(post, update_fields):
+                        updated_post = post
+                if updated_post is None:
+                    return _update_conflict(post_id)
+
+            if updated_post is not None:
+                updates = _summarize_post_updates(params)
+                update_summary = ", ".join(updates)
+                return {
+                    "success": True,
+                    "message": f"Post updated successfully ({update_summary})",
+                    "post_id": updated_post["id"],
+                    "status": updated_post["status"],
+                    "featured": updated_post.get("featured", False),
+                    "url": f"{api_url}/{updated_post['slug']}",
+                    "updates": updates,
+                }
+            return {
+                "success": False,
+                "message": f"Failed to update post: {response.status_code} - {response.text}",
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error updating post: {str(e)}"}
+
+    async def update_post_image(self, post_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Update the feature image of a blog post
+
+        Args:
+            post_id: The ID of the post to update
+            **kwargs: Image update parameters
+
+        Returns:
+            Dict with success status and image info
+        """
+        params = self._prepare_kwargs(**kwargs)
+        return await self._run_blocking(update_ghost_post_image, post_id, **params)
+
+    async def delete_post(self, post_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Delete a blog post
+
+        Args:
+            post_id: The ID of the post to delete
+            **kwargs: Additional parameters
+
+        Returns:
+            Dict with success status
+        """
+        params = self._prepare_kwargs(**kwargs)
+        try:
+            response = await self._request(
+                "DELETE",
+                f"{params['ghost_api_url']}/ghost/api/admin/posts/{post_id}/",
+                headers=self._headers(params["ghost_admin_api_key"]),
+            )
+
+            if response.status_code == 204:
+                return {
+                    "success": True,
+                    "message": "Post deleted successfully",
+                    "post_id": post_id,
+                }
+            elif response.status_code == 404:
+                return {"success": False, "message": f"Post not found: {post_id}"}
+            return {
+                "success": False,
+                "message": f"Failed to delete post: {response.status_code}",
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Error deleting post: {str(e)}"}
+
+    # ============================================================================
+    # BATCH OPERATIONS
+    # ============================================================================
+
+    async def batch_get_post_details(
+        self, post_ids: List[str], max_concurrency: int = 10, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Get details for multiple posts, one id:[...] filter query per chunk of IDs
+
+        Args:
+            post_ids: List of post IDs to fetch
+            max_concurrency: Maximum chunk requests in flight at once
+            **kwargs: Options for included content (include_content)
+
+        Returns:
+            Dict with details for all requested posts
+        """
+        if not post_ids or not isinstance(post_ids, list):
+            return {
+                "success": False,
+                "message": "post_ids must be a non-empty list",
+                "posts": {},
+                "failed": [],
+            }
+
+        valid_post_ids = [pid for pid in post_ids if pid and str(pid).strip()]
+        if not valid_post_ids:
+            return {
+                "success": False,
+                "message": "No valid post IDs provided",
+                "posts": {},
+                "failed": [
+                    {"id": "invalid", "error": "All post IDs were empty or invalid"}
+                ],
+            }
+
+        params = self._prepare_kwargs(**kwargs)
+        include_content = params.get("include_content", False)
+        url = f"{params['ghost_api_url']}/ghost/api/admin/posts/"
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_chunk(chunk):
+            async with semaphore:
+                return await self._request(
+                    "GET",
+                    url,
+                    headers=self._headers(params["ghost_admin_api_key"]),
+                    params=_build_batch_details_params(chunk, include_content),
+                )
+
+        chunks = _chunk_post_ids(valid_post_ids)
+        responses = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        results = {"success": True, "posts": {}, "failed": []}
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                error = f"Exception: {str(response)}"
+            elif response.status_code != 200:
+                error = f"Failed to get post: {response.status_code}"
+            else:
+                _collect_batch_details(results, chunk, response.json().get("posts", []))
+                continue
+            results["failed"].extend({"id": pid, "error": error} for pid in chunk)
+
+        results["total_fetched"] = len(results["posts"])
+        results["total_failed"] = len(results["failed"])
+        results["total_requested"] = len(valid_post_ids)
+        return results
+
+    # ============================================================================
+    # LIFECYCLE
+    # ============================================================================
+
+    async def aclose(self):
+        """Close the HTTP connection pool and the AI thread pool"""
+        await self._http.aclose()
+        self._ai_executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncGhostBlogSmart":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @property
+    def is_configured(self) -> bool:
+        """Check if client is properly configured"""
+        return bool(self.ghost_api_url and self.ghost_admin_api_key)
+
+    @property
+    def has_ai_features(self) -> bool:
+        """Check if AI features are available (requires Gemini API key)"""
+        return bool(self.gemini_api_key)
+
+    def __repr__(self) -> str:
+        """String representation of the client"""
+        status = "configured" if self.is_configured else "not configured"
+        ai_status = (
+            "with AI features" if self.has_ai_features else "without AI features"
+        )
+        return f"AsyncGhostBlogSmart(status={status}, {ai_status})"
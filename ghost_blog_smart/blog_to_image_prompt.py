@@ -4,6 +4,8 @@ System prompt for converting blog info to feature image descriptions
 Uses only title, excerpt, and first paragraph for efficient token usage
 """
 
+from .blog_post_refine_prompt import get_refine_prompt_with_language
+
 BLOG_TO_IMAGE_SYSTEM_PROMPT = """You are an expert at creating focused, eye-catching feature image descriptions for blog posts.
 
 ## YOUR MISSION: FIND THE ONE NOUN
@@ -168,6 +170,37 @@ def generate_blog_image_prompt(blog_content: str, title: str = "") -> str:
     return full_prompt
 
 
+def get_format_and_image_prompt(target_language: str = None) -> str:
+    """
+    Get the system prompt for formatting a post and describing its feature image
+    in one structured call
+
+    Args:
+        target_language: Target language for the formatted post (None keeps the
+                         original language)
+
+    Returns:
+        System prompt asking for a JSON object with 'formatted_content' (the refined
+        markdown post) and 'image_prompt' (the feature image description)
+    """
+    return f"""You have TWO tasks for the same blog post. Return ONE JSON object with the fields
+"formatted_content" and "image_prompt".
+
+# TASK 1 - formatted_content
+
+{get_refine_prompt_with_language(target_language)}
+
+# TASK 2 - image_prompt
+
+{BLOG_TO_IMAGE_SYSTEM_PROMPT}
+
+# OUTPUT
+
+- "formatted_content": the ready-to-publish markdown blog post from TASK 1
+- "image_prompt": the feature image description from TASK 2, based on the blog title,
+  excerpt and opening of the post"""
+
+
 # Example usage
 if __name__ == "__main__":
     example_blog = """
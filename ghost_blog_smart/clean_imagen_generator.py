@@ -7,13 +7,14 @@ Clean implementation with automatic fallback between providers
 import os
 import time
 import json
+import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import logging
+import threading
 from pathlib import Path
 import sys
 
-from google import genai
 from google.genai import types
 from PIL import Image
 import io
@@ -25,11 +26,36 @@ from .blog_to_image_prompt import BLOG_TO_IMAGE_SYSTEM_PROMPT
 # Import Replicate Flux generator for fallback
 from .replicate_flux_generator import ReplicateFluxGenerator
 
+from .gemini_client import get_gemini_client
+from .image_store import get_image_directory
+
 # Model configuration constants
 IMAGE_MODEL = "imagen-4.0-generate-001"  # Latest stable Imagen model
 TEXT_MODEL = "gemini-2.5-flash"  # Model for prompt optimization
 
 
+# Pillow format -> file extension for generated images
+IMAGE_EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp", "GIF": ".gif"}
+
+
+def image_header_info(image_bytes: bytes) -> Tuple[int, int, str, str]:
+    """
+    Read width, height, file extension and MIME type from encoded image bytes
+
+    Image.open only parses the header; pixel data is never decoded.
+
+    Returns:
+        tuple: (width, height, extension, mime_type)
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return (
+            image.size[0],
+            image.size[1],
+            IMAGE_EXTENSIONS.get(image.format, ".png"),
+            Image.MIME.get(image.format, "image/png"),
+        )
+
+
 class CleanImagenGenerator:
     """
     Hybrid Image Generator with Google Imagen and Replicate Flux support
@@ -65,8 +91,8 @@ class CleanImagenGenerator:
             else None
         )
 
-        # Initialize client
-        self.client = genai.Client(api_key=self.api_key)
+        # Shared client for this API key
+        self.client = get_gemini_client(self.api_key)
 
         # Use specified model or default
         self.model_name = model_name or IMAGE_MODEL
@@ -77,13 +103,14 @@ class CleanImagenGenerator:
 
         # Default configuration
         self.default_config = {
-            "output_directory": "./generated_images",
+            "output_directory": get_image_directory(),
             "save_metadata": True,
             "image_prefix": "imagen_",
         }
 
-        # Statistics
+        # Statistics (instances are shared across threads by get_image_generator)
         self.generation_count = 0
+        self._stats_lock = threading.Lock()
 
         self.logger.info(f"✅ Initialized with model: {self.model_name}")
 
@@ -130,6 +157,7 @@ class CleanImagenGenerator:
         output_directory: Optional[str] = None,
         image_prefix: str = "blog_feature_",
         prefer_flux: bool = False,
+        save_to_disk: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate images with hybrid Google Imagen + Replicate Flux support
@@ -143,6 +171,9 @@ class CleanImagenGenerator:
             output_directory: Output directory
             image_prefix: Filename prefix
             prefer_flux: Whether to prefer Replicate Flux over Google Imagen (when available)
+            save_to_disk: Write images (and metadata) to output_directory. When
+                False nothing touches the filesystem: each result carries the
+                encoded image in 'image_bytes' and 'filepath' is None
 
         Returns:
             Generation result dictionary with provider information
@@ -161,7 +192,8 @@ class CleanImagenGenerator:
 
         # Use configuration
         output_dir = output_directory or self.default_config["output_directory"]
-        os.makedirs(output_dir, exist_ok=True)
+        if save_to_disk:
+            os.makedirs(output_dir, exist_ok=True)
 
         # Optimize prompt if requested
         final_prompt = self.optimize_prompt(prompt) if optimize_prompt else prompt
@@ -175,12 +207,19 @@ class CleanImagenGenerator:
         if use_flux_first:
             self.logger.info("🚀 Trying Replicate Flux first (user preference)...")
             flux_result = self._generate_with_flux(
-                final_prompt, aspect_ratio, number_of_images, output_dir, image_prefix
+                final_prompt,
+                aspect_ratio,
+                number_of_images,
+                output_dir,
+                image_prefix,
+                save_to_disk,
             )
             if flux_result["success"]:
                 return flux_result
             else:
-                self.logger.warning(f"⚠️ Flux generation failed: {flux_result['error']}")
+                self.logger.warning(
+                    f"⚠️ Flux generation failed: {flux_result['error']}"
+                )
                 self.logger.info("🔄 Falling back to Google Imagen...")
 
         # Try Google Imagen
@@ -192,6 +231,7 @@ class CleanImagenGenerator:
             output_dir,
             image_prefix,
             prompt,
+            save_to_disk,
         )
         if imagen_result["success"]:
             return imagen_result
@@ -205,7 +245,12 @@ class CleanImagenGenerator:
             self.logger.warning(f"⚠️ Google Imagen failed: {imagen_result['error']}")
             self.logger.info("🔄 Falling back to Replicate Flux...")
             flux_result = self._generate_with_flux(
-                final_prompt, aspect_ratio, number_of_images, output_dir, image_prefix
+                final_prompt,
+                aspect_ratio,
+                number_of_images,
+                output_dir,
+                image_prefix,
+                save_to_disk,
             )
             if flux_result["success"]:
                 return flux_result
@@ -227,6 +272,7 @@ class CleanImagenGenerator:
         output_dir: str,
         image_prefix: str,
         original_prompt: str,
+        save_to_disk: bool = True,
     ) -> Dict[str, Any]:
         """Generate images using Google Imagen"""
         try:
@@ -253,22 +299,29 @@ class CleanImagenGenerator:
 
             # Process results
             results = []
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Random suffix: concurrent generations in the same second must not
+            # overwrite each other's files
+            timestamp = (
+                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            )
 
             for i, generated_image in enumerate(response.generated_images):
-                # Open image
-                image = Image.open(io.BytesIO(generated_image.image.image_bytes))
+                # The API returns encoded bytes: write them as-is and read the
+                # size and format from the header, without decoding pixels
+                image_bytes = generated_image.image.image_bytes
+                width, height, extension, mime_type = image_header_info(image_bytes)
 
                 # Generate filename
                 if number_of_images > 1:
-                    filename = f"{image_prefix}{timestamp}_{i+1:03d}.png"
+                    filename = f"{image_prefix}{timestamp}_{i+1:03d}{extension}"
                 else:
-                    filename = f"{image_prefix}{timestamp}.png"
-
-                filepath = os.path.abspath(os.path.join(output_dir, filename))
+                    filename = f"{image_prefix}{timestamp}{extension}"
 
-                # Save image
-                image.save(filepath)
+                filepath = None
+                if save_to_disk:
+                    filepath = os.path.abspath(os.path.join(output_dir, filename))
+                    with open(filepath, "wb") as f:
+                        f.write(image_bytes)
 
                 # Result information
                 result = {
@@ -276,9 +329,9 @@ class CleanImagenGenerator:
                     "filename": filename,
                     "original_prompt": original_prompt,
                     "final_prompt": final_prompt,
-                    "image_size": image.size,
-                    "width": image.size[0],
-                    "height": image.size[1],
+                    "image_size": (width, height),
+                    "width": width,
+                    "height": height,
                     "aspect_ratio": aspect_ratio,
                     "generation_time": time.time() - start_time,
                     "model": self.model_name,
@@ -286,18 +339,22 @@ class CleanImagenGenerator:
                 }
 
                 # Save metadata
-                if self.default_config["save_metadata"]:
-                    metadata_path = filepath.replace(".png", "_metadata.json")
+                if save_to_disk and self.default_config["save_metadata"]:
+                    metadata_path = os.path.splitext(filepath)[0] + "_metadata.json"
                     with open(metadata_path, "w", encoding="utf-8") as f:
                         json.dump(result, f, indent=2, ensure_ascii=False, default=str)
 
+                if not save_to_disk:
+                    result["image_bytes"] = image_bytes
+                    result["mime_type"] = mime_type
+
                 results.append(result)
                 self.logger.info(
-                    f"✅ Image saved: {filename} ({image.size[0]}x{image.size[1]})"
+                    f"✅ Image {'saved' if save_to_disk else 'ready'}: {filename} ({width}x{height})"
                 )
 
             generation_time = time.time() - start_time
-            self.generation_count += len(results)
+            self._count_generated(len(results))
 
             self.logger.info(
                 f"🎉 Successfully generated {len(results)} image(s) with Google Imagen in {generation_time:.1f}s"
@@ -322,6 +379,7 @@ class CleanImagenGenerator:
         number_of_images: int,
         output_dir: str,
         image_prefix: str,
+        save_to_disk: bool = True,
     ) -> Dict[str, Any]:
         """Generate images using Replicate Flux"""
         try:
@@ -331,11 +389,12 @@ class CleanImagenGenerator:
                 number_of_images=number_of_images,
                 output_directory=output_dir,
                 image_prefix=image_prefix,
+                save_to_disk=save_to_disk,
             )
 
             if flux_result["success"]:
                 # Update generation count
-                self.generation_count += len(flux_result["results"])
+                self._count_generated(len(flux_result["results"]))
 
                 # Add provider information
                 flux_result["provider"] = "Replicate Flux"
@@ -352,11 +411,70 @@ class CleanImagenGenerator:
             self.logger.error(f"Replicate Flux generation failed: {e}")
             return {"success": False, "error": str(e), "provider": "Replicate Flux"}
 
+    def _count_generated(self, count: int):
+        with self._stats_lock:
+            self.generation_count += count
+
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics"""
         return {"total_generated": self.generation_count, "model_used": self.model_name}
 
 
+# (gemini key, replicate key, model) -> CleanImagenGenerator
+_generators: Dict[Tuple[str, Optional[str], str], CleanImagenGenerator] = {}
+_generators_lock = threading.Lock()
+
+
+def get_image_generator(
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
+    replicate_api_key: Optional[str] = None,
+) -> CleanImagenGenerator:
+    """
+    Get the shared generator for (gemini key, replicate key, model)
+
+    The first call for a key combination builds the generator (Gemini client,
+    Replicate client, logging); later calls return the same warm instance.
+    Generators hold no per-request state, so one instance serves concurrent
+    requests.
+
+    Args:
+        api_key: Gemini API key (default: GEMINI_API_KEY env var)
+        model_name: Imagen model (default: IMAGE_MODEL)
+        replicate_api_key: Replicate API key (default: REPLICATE_API_TOKEN env var)
+
+    Returns:
+        CleanImagenGenerator
+
+    Raises:
+        ValueError: If no Gemini API key is available
+    """
+    api_key = api_key or os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY is required")
+    replicate_api_key = replicate_api_key or os.getenv("REPLICATE_API_TOKEN") or None
+    key = (api_key, replicate_api_key, model_name or IMAGE_MODEL)
+
+    generator = _generators.get(key)
+    if generator is not None:
+        return generator
+
+    with _generators_lock:
+        generator = _generators.get(key)
+        if generator is None:
+            generator = CleanImagenGenerator(
+                api_key=api_key, model_name=key[2], replicate_api_key=replicate_api_key
+            )
+            _generators[key] = generator
+        return generator
+
+
+def clear_image_generators():
+    """Drop all shared generators (e.g. after rotating API keys)"""
+    with _generators_lock:
+        _generators.clear()
+
+
 def main():
     """Usage example"""
 
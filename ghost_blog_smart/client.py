@@ -6,7 +6,7 @@ This allows code assistants to use the library in the expected way.
 """
 
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from dotenv import load_dotenv
 
 # Import all the existing functions
@@ -22,14 +22,17 @@ from .main_functions import (
 from .post_management import (
     get_ghost_post_details,
     get_ghost_posts_advanced,
+    iter_ghost_posts,
     get_posts_summary,
     batch_get_post_details,
+    batch_update_posts,
+    batch_delete_posts,
     find_posts_by_date_pattern,
 )
 
 from .smart_gateway import smart_blog_gateway
 
-from .clean_imagen_generator import CleanImagenGenerator
+from .clean_imagen_generator import CleanImagenGenerator, get_image_generator
 
 # Load environment variables
 load_dotenv()
@@ -189,6 +192,20 @@ class GhostBlogSmart:
         params = self._prepare_kwargs(**kwargs)
         return get_ghost_posts_advanced(**params)
 
+    def iter_posts(self, page_size: int = 100, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Stream posts one at a time, paging through the whole archive
+
+        Args:
+            page_size: Posts fetched per request
+            **kwargs: Advanced filter parameters (same as get_posts_advanced)
+
+        Returns:
+            Iterator yielding post objects
+        """
+        params = self._prepare_kwargs(**kwargs)
+        return iter_ghost_posts(page_size=page_size, **params)
+
     def get_post_details(self, post_id: str, **kwargs) -> Dict[str, Any]:
         """
         Get detailed information about a specific post
@@ -284,6 +301,34 @@ class GhostBlogSmart:
         params = self._prepare_kwargs(**kwargs)
         return batch_get_post_details(post_ids, **params)
 
+    def batch_update_posts(self, post_ids: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        Apply the same update to many posts concurrently
+
+        Args:
+            post_ids: List of post IDs to update
+            **kwargs: Fields to update (same as update_post), plus max_workers
+
+        Returns:
+            Dict with per-post results and failures
+        """
+        params = self._prepare_kwargs(**kwargs)
+        return batch_update_posts(post_ids, **params)
+
+    def batch_delete_posts(self, post_ids: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        Delete many posts concurrently
+
+        Args:
+            post_ids: List of post IDs to delete
+            **kwargs: Additional parameters (max_workers)
+
+        Returns:
+            Dict with per-post results and failures
+        """
+        params = self._prepare_kwargs(**kwargs)
+        return batch_delete_posts(post_ids, **params)
+
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
@@ -312,14 +357,14 @@ class GhostBlogSmart:
 
     def create_image_generator(self) -> CleanImagenGenerator:
         """
-        Create an image generator instance
+        Get an image generator for this client's Gemini key
 
         Returns:
-            CleanImagenGenerator instance
+            CleanImagenGenerator instance, shared with other callers using the same key
         """
         if not self.gemini_api_key:
             raise ValueError("Gemini API key is required for image generation")
-        return CleanImagenGenerator(api_key=self.gemini_api_key)
+        return get_image_generator(api_key=self.gemini_api_key)
 
     # ============================================================================
     # CONVENIENCE PROPERTIES
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Bounded Concurrency for Per-Post Operations
+Runs one operation over many items (post IDs, ID chunks) on a bounded thread pool.
+Calls against the same Ghost site share a per-host cap, so several batch jobs in
+one process cannot together flood a site. Results come back in input order and
+failures are reported per item instead of aborting the whole batch.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+from .ghost_http import _site_key
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_MAX_WORKERS = int(os.getenv("GHOST_BATCH_WORKERS", "8"))
+DEFAULT_MAX_PER_HOST = int(os.getenv("GHOST_MAX_CONCURRENCY_PER_HOST", "8"))
+
+_concurrency_config = {
+    "max_workers": DEFAULT_MAX_WORKERS,
+    "max_per_host": DEFAULT_MAX_PER_HOST,
+}
+
+# One semaphore per Ghost site (scheme://host[:port]), shared by all batches
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_lock = threading.Lock()
+
+
+def configure_batch_concurrency(
+    max_workers: Optional[int] = None, max_per_host: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Configure the shared batch executor
+
+    Args:
+        max_workers: Default worker threads per batch call
+        max_per_host: Maximum operations in flight per Ghost site across all batches
+
+    Returns:
+        dict: The active concurrency configuration
+    """
+    with _host_lock:
+        if max_workers is not None:
+            _concurrency_config["max_workers"] = max(1, int(max_workers))
+        if max_per_host is not None:
+            _concurrency_config["max_per_host"] = max(1, int(max_per_host))
+            # Caps are fixed at semaphore creation, so start over with the new size
+            _host_semaphores.clear()
+
+        return dict(_concurrency_config)
+
+
+def get_host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    Get the semaphore capping concurrent operations against a Ghost site
+
+    Args:
+        url: Any URL on the Ghost site (only scheme and host are used)
+
+    Returns:
+        threading.BoundedSemaphore shared by every batch targeting that site
+    """
+    key = _site_key(url)
+    with _host_lock:
+        semaphore = _host_semaphores.get(key)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(_concurrency_config["max_per_host"])
+            _host_semaphores[key] = semaphore
+        return semaphore
+
+
+def run_bounded(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    host: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run func over items on a bounded thread pool
+
+    A call counts as failed if it raises, or if it returns a result dict with
+    'success': False (the convention used throughout this package).
+
+    Args:
+        func: Callable taking one item
+        items: Items to process
+        max_workers: Worker threads for this call (default: configured max_workers)
+        host: Ghost site URL; when given, the per-host cap also applies
+
+    Returns:
+        list: One {'success', 'result', 'error'} dict per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = max_workers or _concurrency_config["max_workers"]
+    semaphore = get_host_semaphore(host) if host else None
+
+    def call(item):
+        try:
+            if semaphore is None:
+                result = func(item)
+            else:
+                with semaphore:
+                    result = func(item)
+        except Exception as e:
+            return {"success": False, "result": None, "error": str(e)}
+
+        if isinstance(result, dict) and result.get("success") is False:
+            error = result.get("message") or result.get("error") or "Unknown error"
+            return {"success": False, "result": result, "error": error}
+        return {"success": True, "result": result, "error": None}
+
+    if len(items) == 1:
+        return [call(items[0])]
+
+    with ThreadPoolExecutor(max_workers=min(max(1, int(workers)), len(items))) as pool:
+        # executor.map preserves input order
+        return list(pool.map(call, items))
+
+
+def run_post_operations(
+    func: Callable[[str], Dict[str, Any]],
+    post_ids: List[str],
+    max_workers: Optional[int] = None,
+    host: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a per-post operation over many post IDs concurrently
+
+    Args:
+        func: Callable taking a post ID and returning a result dict
+        post_ids: Post IDs to process
+        max_workers: Worker threads for this call
+        host: Ghost site URL used for the per-host cap
+
+    Returns:
+        dict: {
+            'success': True,
+            'posts': {post_id: result} for successful calls, in input order,
+            'failed': [{'id', 'error'}] for failed calls,
+            'total_requested', 'total_succeeded', 'total_failed'
+        }
+    """
+    outcomes = run_bounded(func, post_ids, max_workers=max_workers, host=host)
+
+    results = {"success": True, "posts": {}, "failed": []}
+    for post_id, outcome in zip(post_ids, outcomes):
+        if outcome["success"]:
+            results["posts"][post_id] = outcome["result"]
+        else:
+            results["failed"].append({"id": post_id, "error": outcome["error"]})
+
+    results["total_requested"] = len(post_ids)
+    results["total_succeeded"] = len(results["posts"])
+    results["total_failed"] = len(results["failed"])
+    return results
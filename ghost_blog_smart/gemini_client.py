@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Gemini Client Registry
+Shared, thread-safe google.genai clients and model handles.
+Each API key gets one genai.Client (its own credentials and connection pool,
+no global configure state), and each (api_key, model) pair gets one reusable
+GeminiModel handle. Safe to share across threads and gunicorn requests, so
+tenants with different keys never step on each other.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from google import genai
+from google.genai import types
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# api_key -> genai.Client
+_clients: Dict[str, genai.Client] = {}
+# (api_key, model) -> GeminiModel
+_models: Dict[Tuple[str, str], "GeminiModel"] = {}
+_registry_lock = threading.Lock()
+
+
+class GeminiModel:
+    """Reusable handle for one Gemini model on one API key"""
+
+    def __init__(self, client: genai.Client, model: str):
+        self.client = client
+        self.model = model
+
+    def generate_content(self, contents, **config):
+        """
+        Call generate_content on this model
+
+        Args:
+            contents: Prompt text or content parts
+            **config: GenerateContentConfig fields (temperature, top_p, ...)
+
+        Returns:
+            google.genai GenerateContentResponse
+        """
+        return self.client.models.generate_content(
+            model=self.model,
+            contents=contents,
+            config=types.GenerateContentConfig(**config) if config else None,
+        )
+
+    def generate_text(self, prompt: str, **config) -> str:
+        """Generate a response and return its text"""
+        return self.generate_content(prompt, **config).text
+
+    def __repr__(self) -> str:
+        return f"GeminiModel(model='{self.model}')"
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    api_key = api_key or os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "GEMINI_API_KEY is required - provide as parameter or set in environment"
+        )
+    return api_key
+
+
+def get_gemini_client(api_key: Optional[str] = None) -> genai.Client:
+    """
+    Get the shared genai.Client for an API key
+
+    Args:
+        api_key: Gemini API key (default: GEMINI_API_KEY env var)
+
+    Returns:
+        genai.Client, created once per key and reused afterwards
+
+    Raises:
+        ValueError: If no API key is available
+    """
+    api_key = _resolve_api_key(api_key)
+
+    client = _clients.get(api_key)
+    if client is not None:
+        return client
+
+    with _registry_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _clients[api_key] = client
+        return client
+
+
+def get_gemini_model(model: str, api_key: Optional[str] = None) -> GeminiModel:
+    """
+    Get the shared model handle for (api_key, model)
+
+    Args:
+        model: Gemini model name (e.g. 'gemini-2.5-flash')
+        api_key: Gemini API key (default: GEMINI_API_KEY env var)
+
+    Returns:
+        GeminiModel
+
+    Raises:
+        ValueError: If no API key is available
+    """
+    api_key = _resolve_api_key(api_key)
+    key = (api_key, model)
+
+    handle = _models.get(key)
+    if handle is not None:
+        return handle
+
+    client = get_gemini_client(api_key)
+    with _registry_lock:
+        handle = _models.get(key)
+        if handle is None:
+            handle = GeminiModel(client, model)
+            _models[key] = handle
+        return handle
+
+
+def warm_up_gemini(
+    models: Iterable[str], api_key: Optional[str] = None, ping: bool = True
+) -> Dict[str, bool]:
+    """
+    Create clients and model handles ahead of the first request
+
+    Args:
+        models: Model names to prepare
+        api_key: Gemini API key (default: GEMINI_API_KEY env var)
+        ping: Also fetch each model's metadata, which opens the connection
+              and validates the key without spending generation tokens
+
+    Returns:
+        dict: {model: True if ready, False if the ping failed}
+    """
+    status = {}
+    for model in models:
+        handle = get_gemini_model(model, api_key)
+        if not ping:
+            status[model] = True
+            continue
+        try:
+            handle.client.models.get(model=model)
+            status[model] = True
+        except Exception as e:
+            print(f"⚠️ Gemini warm-up failed for {model}: {str(e)}")
+            status[model] = False
+    return status
+
+
+def clear_gemini_clients():
+    """Drop all cached clients and model handles (e.g. after rotating keys)"""
+    with _registry_lock:
+        _models.clear()
+        _clients.clear()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Ghost Admin API Authentication
+Thread-safe cache of signed Ghost admin JWTs.
+Ghost tokens are valid for 5 minutes, so each admin key is parsed and signed
+once and the same token is handed out until shortly before it expires.
+"""
+
+import time
+import threading
+from typing import Dict, Tuple
+
+import jwt
+
+# Ghost rejects admin tokens with a lifetime over 5 minutes
+TOKEN_LIFETIME = 5 * 60
+# Re-sign this many seconds before expiry so in-flight requests never carry a stale token
+TOKEN_REFRESH_MARGIN = 30
+
+# admin_key -> (token, exp)
+_token_cache: Dict[str, Tuple[str, int]] = {}
+_token_lock = threading.Lock()
+
+
+def _sign_ghost_token(admin_key: str, iat: int) -> Tuple[str, int]:
+    """Parse an admin key and sign a fresh token, returning (token, exp)"""
+    if ":" not in admin_key:
+        raise ValueError("Invalid admin API key format")
+
+    key_id, secret = admin_key.split(":")
+    exp = iat + TOKEN_LIFETIME
+
+    header = {"alg": "HS256", "typ": "JWT", "kid": key_id}
+    payload = {"iat": iat, "exp": exp, "aud": "/admin/"}
+
+    token = jwt.encode(
+        payload, bytes.fromhex(secret), algorithm="HS256", headers=header
+    )
+    return token, exp
+
+
+def get_ghost_token(admin_key: str) -> str:
+    """
+    Get a signed Ghost admin JWT for an admin API key
+
+    Parameters:
+    - admin_key: Ghost admin API key ('id:secret')
+
+    Returns:
+    - str: Cached token, re-signed when it is close to expiry
+
+    Raises:
+    - ValueError: If the admin key is malformed
+    """
+    now = int(time.time())
+
+    cached = _token_cache.get(admin_key)
+    if cached and cached[1] - TOKEN_REFRESH_MARGIN > now:
+        return cached[0]
+
+    with _token_lock:
+        cached = _token_cache.get(admin_key)
+        if cached and cached[1] - TOKEN_REFRESH_MARGIN > now:
+            return cached[0]
+
+        token, exp = _sign_ghost_token(admin_key, now)
+        _token_cache[admin_key] = (token, exp)
+        return token
+
+
+def clear_ghost_token_cache():
+    """Drop all cached tokens (e.g. after rotating an admin key)"""
+    with _token_lock:
+        _token_cache.clear()
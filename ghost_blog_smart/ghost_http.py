@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Ghost Admin API Transport
+Shared HTTP layer for every Ghost Admin API call made by the library.
+Keeps one pooled keep-alive session per Ghost site so repeated calls reuse
+TCP/TLS connections instead of paying a new handshake on every request.
+Every request is paced by the per-site rate limiter in ghost_ratelimit, and
+transient failures on idempotent requests are retried with jittered backoff.
+"""
+
+import os
+import time
+import random
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+from .ghost_ratelimit import (
+    _rate_config,
+    get_rate_limiter,
+    is_throttled,
+    parse_retry_after,
+)
+
+# Load environment variables
+load_dotenv()
+
+# Default pool configuration (overridable via environment or configure_ghost_http)
+DEFAULT_POOL_CONNECTIONS = int(os.getenv("GHOST_HTTP_POOL_CONNECTIONS", "10"))
+DEFAULT_POOL_MAXSIZE = int(os.getenv("GHOST_HTTP_POOL_MAXSIZE", "20"))
+DEFAULT_TIMEOUT = float(os.getenv("GHOST_HTTP_TIMEOUT", "60"))
+
+# Retry policy for transient failures (overridable via environment or configure_ghost_http)
+DEFAULT_RETRIES = int(os.getenv("GHOST_HTTP_RETRIES", "3"))
+DEFAULT_BACKOFF = float(os.getenv("GHOST_HTTP_BACKOFF", "0.5"))
+DEFAULT_BACKOFF_MAX = float(os.getenv("GHOST_HTTP_BACKOFF_MAX", "8"))
+
+# Responses worth retrying: the server or a proxy in front of it hiccupped
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+RETRYABLE_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+# Methods safe to re-send without creating duplicates
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+_http_config = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "timeout": DEFAULT_TIMEOUT,
+    "retries": DEFAULT_RETRIES,
+    "backoff": DEFAULT_BACKOFF,
+    "backoff_max": DEFAULT_BACKOFF_MAX,
+}
+
+# One session per Ghost site (scheme://host[:port])
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _site_key(url: str) -> str:
+    """Return the scheme://host[:port] part of a URL, used as the pool key"""
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _build_session() -> requests.Session:
+    """Create a session with keep-alive connection pools of the configured size"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_http_config["pool_connections"],
+        pool_maxsize=_http_config["pool_maxsize"],
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_ghost_http(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+    backoff: Optional[float] = None,
+    backoff_max: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Configure the shared Ghost HTTP transport
+
+    Args:
+        pool_connections: Number of connection pools to cache per session
+        pool_maxsize: Maximum number of keep-alive connections per pool
+        timeout: Default request timeout in seconds (used when a call passes none)
+        retries: Times a transient failure is retried (0 disables retries)
+        backoff: Base delay in seconds for exponential backoff
+        backoff_max: Upper bound on a single backoff delay in seconds
+
+    Returns:
+        dict: The active transport configuration
+    """
+    with _sessions_lock:
+        if pool_connections is not None:
+            _http_config["pool_connections"] = int(pool_connections)
+        if pool_maxsize is not None:
+            _http_config["pool_maxsize"] = int(pool_maxsize)
+        if timeout is not None:
+            _http_config["timeout"] = float(timeout)
+        if retries is not None:
+            _http_config["retries"] = max(0, int(retries))
+        if backoff is not None:
+            _http_config["backoff"] = float(backoff)
+        if backoff_max is not None:
+            _http_config["backoff_max"] = float(backoff_max)
+
+        # Pool sizes are fixed at adapter creation, so drop existing sessions
+        if pool_connections is not None or pool_maxsize is not None:
+            for session in _sessions.values():
+                session.close()
+            _sessions.clear()
+
+        return dict(_http_config)
+
+
+def get_ghost_session(api_url: str) -> requests.Session:
+    """
+    Get the shared pooled session for a Ghost site
+
+    Args:
+        api_url: Any URL on the Ghost site (only scheme and host are used)
+
+    Returns:
+        requests.Session: Keep-alive session shared by all calls to that site
+    """
+    key = _site_key(api_url)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session()
+            _sessions[key] = session
+        return session
+
+
+def _rewind_files(files):
+    """Seek file objects in a multipart payload back to the start before a re-send"""
+    if not files:
+        return
+    values = files.values() if isinstance(files, dict) else (v for _, v in files)
+    for value in values:
+        fileobj = value[1] if isinstance(value, (tuple, list)) else value
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+
+
+def retry_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff delay for a 0-based retry attempt"""
+    ceiling = min(_http_config["backoff_max"], _http_config["backoff"] * (2**attempt))
+    return random.uniform(0, ceiling)
+
+
+def _send_paced(session, limiter, method: str, url: str, kwargs) -> requests.Response:
+    """Send one request under the site's rate limiter, waiting out throttling"""
+    if limiter is None:
+        return session.request(method, url, **kwargs)
+
+    attempt = 0
+    while True:
+        limiter.acquire()
+        response = session.request(method, url, **kwargs)
+
+        if not is_throttled(response):
+            limiter.reward()
+            return response
+
+        limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+        if attempt >= _rate_config["throttle_retries"]:
+            return response
+
+        attempt += 1
+        _rewind_files(kwargs.get("files"))
+
+
+def ghost_request(
+    method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+) -> requests.Response:
+    """
+    Send a request to the Ghost Admin API through the shared site session
+
+    Requests are paced by the site's adaptive rate limiter (on by default,
+    GHOST_RATE_LIMIT requests per second). Throttled responses (429, or 503
+    with Retry-After) are waited out and re-sent up to GHOST_RATE_LIMIT_RETRIES
+    times; if the site keeps refusing, the last throttled response is returned
+    as-is, without going through the 5xx retries below.
+
+    Idempotent requests that hit a connection error, a timeout or a 5xx
+    response that is not a throttle are retried with full-jitter exponential
+    backoff. POST is not retried unless the caller marks it idempotent
+    (e.g. image uploads). With the rate limiter disabled, a 503 is always
+    treated as a plain 5xx.
+
+    Args:
+        method: HTTP method ('GET', 'POST', 'PUT', 'DELETE')
+        url: Full request URL
+        idempotent: Whether the request is safe to re-send
+                    (default: True for GET/PUT/DELETE, False for POST)
+        **kwargs: Passed through to requests (headers, params, json, files, ...)
+
+    Returns:
+        requests.Response
+
+    Raises:
+        requests.RequestException: If the last attempt failed at the network level
+    """
+    kwargs.setdefault("timeout", _http_config["timeout"])
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    retries = _http_config["retries"] if idempotent else 0
+
+    session = get_ghost_session(url)
+    limiter = get_rate_limiter(_site_key(url))
+
+    attempt = 0
+    while True:
+        try:
+            response = _send_paced(session, limiter, method, url, kwargs)
+            if response.status_code not in RETRYABLE_STATUSES or attempt >= retries:
+                return response
+            # The limiter has already waited out and re-sent a throttled 503;
+            # another backoff round would repeat that whole cycle
+            if limiter is not None and is_throttled(response):
+                return response
+        except RETRYABLE_EXCEPTIONS:
+            if attempt >= retries:
+                raise
+
+        time.sleep(retry_delay(attempt))
+        attempt += 1
+        _rewind_files(kwargs.get("files"))
+
+
+def close_ghost_sessions():
+    """Close every pooled session (e.g. on worker shutdown)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Ghost Admin API Rate Limiting
+Adaptive token bucket per Ghost site, on by default and applied to every call
+made through ghost_http.ghost_request (and AsyncGhostBlogSmart). A throttled
+response (429, or 503 with Retry-After) pauses the site's bucket for the
+advertised delay and cuts its rate; each successful call nudges the rate back
+up. Bulk jobs therefore settle near the server's real capacity instead of
+failing with 429s. A request still throttled after throttle_retries re-sends
+is returned to the caller as-is.
+"""
+
+import os
+import time
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Requests per second per Ghost site; 0 disables rate limiting
+DEFAULT_RATE = float(os.getenv("GHOST_RATE_LIMIT", "10"))
+DEFAULT_BURST = int(os.getenv("GHOST_RATE_LIMIT_BURST", "10"))
+DEFAULT_MIN_RATE = float(os.getenv("GHOST_RATE_LIMIT_MIN", "0.5"))
+DEFAULT_MAX_RATE = float(os.getenv("GHOST_RATE_LIMIT_MAX", "50"))
+# Times a throttled request is re-sent before the 429 is returned to the caller
+DEFAULT_THROTTLE_RETRIES = int(os.getenv("GHOST_RATE_LIMIT_RETRIES", "5"))
+# Upper bound on a single Retry-After wait, in seconds
+DEFAULT_MAX_WAIT = float(os.getenv("GHOST_RATE_LIMIT_MAX_WAIT", "60"))
+
+# Additive increase per successful call, multiplicative decrease per throttle
+RATE_INCREASE = 0.5
+RATE_DECREASE = 0.5
+
+_rate_config = {
+    "rate": DEFAULT_RATE,
+    "burst": DEFAULT_BURST,
+    "min_rate": DEFAULT_MIN_RATE,
+    "max_rate": DEFAULT_MAX_RATE,
+    "throttle_retries": DEFAULT_THROTTLE_RETRIES,
+    "max_wait": DEFAULT_MAX_WAIT,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to throttling"""
+
+    def __init__(self, rate: float, burst: int, min_rate: float, max_rate: float):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = float(min_rate)
+        self.max_rate = max(float(max_rate), self.rate)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is free; otherwise return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Record a throttled response: pause the bucket and cut the rate"""
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate * RATE_DECREASE)
+            self.tokens = 0.0
+            self.updated = now
+            wait = retry_after if retry_after is not None else 1.0 / self.rate
+            self.blocked_until = max(self.blocked_until, now + wait)
+
+    def reward(self):
+        """Record a successful response: raise the rate back toward max_rate"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
+
+
+# One bucket per Ghost site (scheme://host[:port])
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def configure_ghost_rate_limit(
+    rate: Optional[float] = None,
+    burst: Optional[int] = None,
+    min_rate: Optional[float] = None,
+    max_rate: Optional[float] = None,
+    throttle_retries: Optional[int] = None,
+    max_wait: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Configure the per-site Ghost rate limiter
+
+    Args:
+        rate: Starting requests per second per Ghost site (0 disables limiting)
+        burst: Requests allowed back to back before pacing starts
+        min_rate: Floor the adaptive rate never drops below
+        max_rate: Ceiling the adaptive rate never climbs above
+        throttle_retries: Times a throttled request is re-sent before giving up
+        max_wait: Upper bound on a single Retry-After wait, in seconds
+
+    Returns:
+        dict: The active rate limit configuration
+    """
+    updates = {
+        "rate": rate,
+        "burst": burst,
+        "min_rate": min_rate,
+        "max_rate": max_rate,
+        "throttle_retries": throttle_retries,
+        "max_wait": max_wait,
+    }
+    with _buckets_lock:
+        for key, value in updates.items():
+            if value is not None:
+                _rate_config[key] = value
+        # Buckets pick up the new limits when they are next created
+        _buckets.clear()
+        return dict(_rate_config)
+
+
+def get_rate_limiter(site_key: str) -> Optional[TokenBucket]:
+    """
+    Get the token bucket for a Ghost site
+
+    Args:
+        site_key: scheme://host[:port] of the Ghost site
+
+    Returns:
+        TokenBucket, or None when rate limiting is disabled
+    """
+    if _rate_config["rate"] <= 0:
+        return None
+
+    bucket = _buckets.get(site_key)
+    if bucket is not None:
+        return bucket
+
+    with _buckets_lock:
+        bucket = _buckets.get(site_key)
+        if bucket is None:
+            bucket = TokenBucket(
+                _rate_config["rate"],
+                _rate_config["burst"],
+                _rate_config["min_rate"],
+                _rate_config["max_rate"],
+            )
+            _buckets[site_key] = bucket
+        return bucket
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or HTTP date)
+
+    Returns:
+        float: Seconds to wait, capped at max_wait, or None if absent/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(0.0, seconds), _rate_config["max_wait"])
+
+
+def is_throttled(response) -> bool:
+    """True if Ghost (or a proxy in front of it) asked us to slow down"""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 503 and bool(response.headers.get("Retry-After"))
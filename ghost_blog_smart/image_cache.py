@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Image Upload Cache
+Persistent map from image content (SHA-256 of the bytes) or source URL to the
+Ghost URL it was uploaded to, per Ghost site. A hit skips the upload POST, so
+reused brand images and re-run pipelines do not send the same bytes again.
+
+Enabled by default; disable with GHOST_IMAGE_CACHE=false or
+configure_image_cache(enabled=False). Cache failures (read-only home
+directory, locked database) never fail an upload - they count as misses.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from dotenv import load_dotenv
+
+from .sqlite_store import SQLiteStore, evict_expired_and_lru
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_IMAGE_CACHE_ENABLED = os.getenv("GHOST_IMAGE_CACHE", "true").lower() == "true"
+DEFAULT_IMAGE_CACHE_PATH = os.getenv(
+    "GHOST_IMAGE_CACHE_PATH",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "ghost_blog_smart", "images.sqlite3"
+    ),
+)
+DEFAULT_IMAGE_CACHE_TTL = float(os.getenv("GHOST_IMAGE_CACHE_TTL", str(30 * 24 * 3600)))
+DEFAULT_IMAGE_CACHE_MAX_ENTRIES = int(
+    os.getenv("GHOST_IMAGE_CACHE_MAX_ENTRIES", "10000")
+)
+
+# Bytes read per step when hashing local files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_image_cache_config = {
+    "enabled": DEFAULT_IMAGE_CACHE_ENABLED,
+    "path": DEFAULT_IMAGE_CACHE_PATH,
+    "ttl": DEFAULT_IMAGE_CACHE_TTL,
+    "max_entries": DEFAULT_IMAGE_CACHE_MAX_ENTRIES,
+}
+
+
+def digest_key(digest) -> str:
+    """Cache key for a hashlib SHA-256 object fed with the image bytes"""
+    return "sha256:" + digest.hexdigest()
+
+
+def content_key(data: bytes) -> str:
+    """Cache key for image bytes"""
+    return digest_key(hashlib.sha256(data))
+
+
+def file_key(path: str) -> str:
+    """Cache key for a local image file, hashed in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as image_file:
+        for chunk in iter(lambda: image_file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest_key(digest)
+
+
+def url_key(url: str) -> str:
+    """
+    Cache key for a remote image URL
+
+    Scheme and host are lowercased, default ports and fragments dropped; the
+    path and query are kept as-is since they identify the resource.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    return "url:" + urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+class ImageUploadCache(SQLiteStore):
+    """SQLite store of (site, key) -> Ghost image URL with TTL and LRU eviction"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS image_uploads ("
+        "site TEXT NOT NULL, key TEXT NOT NULL, url TEXT NOT NULL, "
+        "created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+        "PRIMARY KEY (site, key))",
+        "CREATE INDEX IF NOT EXISTS idx_image_uploads_accessed "
+        "ON image_uploads (accessed_at)",
+    )
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        super().__init__(path)
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, site: str, key: str) -> Optional[str]:
+        """Return the Ghost URL for key on site, or None on a miss"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT url, created_at FROM image_uploads "
+                    "WHERE site = ? AND key = ?",
+                    (site, key),
+                ).fetchone()
+
+                if row is None or now - row[1] > self.ttl:
+                    self.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE image_uploads SET accessed_at = ? "
+                    "WHERE site = ? AND key = ?",
+                    (now, site, key),
+                )
+                conn.commit()
+                self.hits += 1
+                return row[0]
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Image cache lookup failed: {str(e)}")
+            return None
+
+    def set(self, site: str, key: str, url: str):
+        """Remember that key was uploaded to site as url"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO image_uploads "
+                    "(site, key, url, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (site, key, url, now, now),
+                )
+                evict_expired_and_lru(
+                    conn, "image_uploads", self.ttl, self.max_entries, now
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Image cache update failed: {str(e)}")
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM image_uploads")
+            conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the current entry count"""
+        with self._lock:
+            entries = (
+                self._connection()
+                .execute("SELECT COUNT(*) FROM image_uploads")
+                .fetchone()
+            )[0]
+            lookups = self.hits + self.misses
+            return {
+                "enabled": _image_cache_config["enabled"],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "path": self.path,
+            }
+
+
+_image_cache: Optional[ImageUploadCache] = None
+_image_cache_lock = threading.Lock()
+
+
+def configure_image_cache(
+    enabled: Optional[bool] = None,
+    path: Optional[str] = None,
+    ttl: Optional[float] = None,
+    max_entries: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Configure the image upload cache
+
+    Args:
+        enabled: Turn caching on or off
+        path: SQLite database file (':memory:' for a process-local cache)
+        ttl: Seconds an entry stays valid
+        max_entries: Entries kept before least-recently-used ones are evicted
+
+    Returns:
+        dict: The active cache configuration
+    """
+    global _image_cache
+    with _image_cache_lock:
+        if enabled is not None:
+            _image_cache_config["enabled"] = bool(enabled)
+        if path is not None:
+            _image_cache_config["path"] = path
+        if ttl is not None:
+            _image_cache_config["ttl"] = float(ttl)
+        if max_entries is not None:
+            _image_cache_config["max_entries"] = int(max_entries)
+        # Rebuilt with the new settings on next use
+        _image_cache = None
+        return dict(_image_cache_config)
+
+
+def get_image_cache() -> Optional[ImageUploadCache]:
+    """Return the shared cache, or None when caching is disabled"""
+    global _image_cache
+    if not _image_cache_config["enabled"]:
+        return None
+    with _image_cache_lock:
+        if _image_cache is None:
+            _image_cache = ImageUploadCache(
+                _image_cache_config["path"],
+                _image_cache_config["ttl"],
+                _image_cache_config["max_entries"],
+            )
+        return _image_cache
+
+
+def get_image_cache_stats() -> Dict[str, Any]:
+    """Cache statistics (hits, misses, hit_rate, entries, ...)"""
+    cache = get_image_cache()
+    if cache is None:
+        return {"enabled": False, "hits": 0, "misses": 0, "hit_rate": 0.0}
+    return cache.stats()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Pre-upload Image Optimization
+Optional Pillow stage run before an image is uploaded to Ghost: downscale to a
+maximum width, re-encode as WebP or JPEG at a target quality and drop EXIF and
+other metadata. Full-size generated PNGs typically shrink several times over,
+which cuts upload time, Ghost storage and page weight.
+
+Encoding is CPU-bound, so it runs in a process pool and the calling thread
+only waits for the result. Disabled by default; enable with
+GHOST_IMAGE_OPTIMIZE=true or configure_image_optimizer(enabled=True).
+"""
+
+import io
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image, ImageOps
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_OPTIMIZE_ENABLED = os.getenv("GHOST_IMAGE_OPTIMIZE", "false").lower() == "true"
+DEFAULT_MAX_WIDTH = int(os.getenv("GHOST_IMAGE_MAX_WIDTH", "2000"))
+DEFAULT_FORMAT = os.getenv("GHOST_IMAGE_FORMAT", "webp").lower()
+DEFAULT_QUALITY = int(os.getenv("GHOST_IMAGE_QUALITY", "82"))
+DEFAULT_OPTIMIZE_WORKERS = int(os.getenv("GHOST_IMAGE_OPTIMIZE_WORKERS", "2"))
+
+# Output format -> (Pillow format, MIME type, file extension)
+OUTPUT_FORMATS = {
+    "webp": ("WEBP", "image/webp", ".webp"),
+    "jpeg": ("JPEG", "image/jpeg", ".jpg"),
+}
+
+_optimizer_config = {
+    "enabled": DEFAULT_OPTIMIZE_ENABLED,
+    "max_width": DEFAULT_MAX_WIDTH,
+    "format": DEFAULT_FORMAT,
+    "quality": DEFAULT_QUALITY,
+    "workers": DEFAULT_OPTIMIZE_WORKERS,
+}
+
+
+def optimize_image_bytes(
+    data: bytes, max_width: int, output_format: str, quality: int
+) -> Optional[Tuple[bytes, str, str]]:
+    """
+    Downscale, re-encode and strip metadata from an image
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Args:
+        data: Encoded image bytes
+        max_width: Images wider than this are scaled down (aspect ratio kept)
+        output_format: 'webp' or 'jpeg'
+        quality: Encoder quality (1-100)
+
+    Returns:
+        tuple: (bytes, mime_type, extension), or None when the original should
+               be uploaded unchanged (animated, unreadable, or not made smaller)
+    """
+    pil_format, mime_type, extension = OUTPUT_FORMATS[output_format]
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        if getattr(image, "is_animated", False):
+            return None
+        # Apply the EXIF rotation before the EXIF block is dropped
+        image = ImageOps.exif_transpose(image)
+    except Exception:
+        return None
+
+    resized = image.width > max_width
+    if resized:
+        height = max(1, round(image.height * max_width / image.width))
+        image = image.resize((max_width, height), Image.LANCZOS)
+
+    has_alpha = image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    if pil_format == "JPEG" or not has_alpha:
+        if has_alpha:
+            # JPEG has no alpha channel: flatten onto white
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.convert("RGBA").getchannel("A"))
+            image = background
+        else:
+            image = image.convert("RGB")
+    else:
+        image = image.convert("RGBA")
+
+    output = io.BytesIO()
+    # No exif/icc_profile arguments: metadata is not carried over
+    image.save(output, format=pil_format, quality=quality, optimize=True)
+    optimized = output.getvalue()
+
+    if not resized and len(optimized) >= len(data):
+        return None
+    return optimized, mime_type, extension
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool, _pool_pid
+    with _pool_lock:
+        # A pool inherited through fork is unusable, start a new one per process.
+        # Workers are spawned, not forked, since the caller runs other threads
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(
+                max_workers=_optimizer_config["workers"],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def configure_image_optimizer(
+    enabled: Optional[bool] = None,
+    max_width: Optional[int] = None,
+    output_format: Optional[str] = None,
+    quality: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Configure the pre-upload image optimizer
+
+    Args:
+        enabled: Turn optimization on or off
+        max_width: Maximum width in pixels
+        output_format: 'webp' or 'jpeg'
+        quality: Encoder quality (1-100)
+        workers: Processes in the optimization pool
+
+    Returns:
+        dict: The active optimizer configuration
+
+    Raises:
+        ValueError: If output_format is not supported
+    """
+    global _pool
+    if output_format is not None and output_format.lower() not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output_format '{output_format}' - use one of {list(OUTPUT_FORMATS)}"
+        )
+
+    with _pool_lock:
+        if enabled is not None:
+            _optimizer_config["enabled"] = bool(enabled)
+        if max_width is not None:
+            _optimizer_config["max_width"] = max(1, int(max_width))
+        if output_format is not None:
+            _optimizer_config["format"] = output_format.lower()
+        if quality is not None:
+            _optimizer_config["quality"] = min(100, max(1, int(quality)))
+        if workers is not None:
+            _optimizer_config["workers"] = max(1, int(workers))
+            # Pool size is fixed at creation
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+                _pool = None
+        return dict(_optimizer_config)
+
+
+def is_image_optimizer_enabled() -> bool:
+    """True if uploads should go through the optimizer"""
+    return _optimizer_config["enabled"]
+
+
+def optimize_image(data: bytes) -> Optional[Tuple[bytes, str, str]]:
+    """
+    Optimize image bytes for upload if the optimizer is enabled
+
+    Returns:
+        tuple: (bytes, mime_type, extension) to upload instead, or None to
+               upload the original (optimizer disabled or nothing gained)
+    """
+    if not is_image_optimizer_enabled():
+        return None
+
+    args = (
+        data,
+        _optimizer_config["max_width"],
+        _optimizer_config["format"],
+        _optimizer_config["quality"],
+    )
+    try:
+        return _get_pool().submit(optimize_image_bytes, *args).result()
+    except Exception as e:
+        print(f"⚠️ Image optimization failed, uploading original: {str(e)}")
+        return None
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Streaming Image Relay
+Pipes a remote image straight into a Ghost image upload. The download is read
+in chunks and each chunk is written into the multipart body as it arrives, so
+memory per upload stays at one chunk however large the remote image is. The
+part's content type comes from the download's headers, and images over the
+size limit are rejected before (or while) they are sent.
+"""
+
+import os
+import uuid
+import hashlib
+import mimetypes
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+import requests
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Largest remote image relayed to Ghost, in bytes
+DEFAULT_MAX_IMAGE_BYTES = int(os.getenv("GHOST_IMAGE_MAX_BYTES", str(10 * 1024 * 1024)))
+RELAY_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 10
+
+
+class ImageRelayError(ValueError):
+    """The remote image could not be relayed (download failed, not an image, too large)"""
+
+
+def _image_content_type(response: requests.Response, url: str) -> str:
+    """Content type from the response, falling back to the URL's extension"""
+    content_type = (
+        response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    )
+    if content_type.startswith("image/"):
+        return content_type
+    if content_type and content_type != "application/octet-stream":
+        raise ImageRelayError(f"URL did not return an image ({content_type}): {url}")
+
+    guessed, _ = mimetypes.guess_type(urlsplit(url).path)
+    return guessed if guessed and guessed.startswith("image/") else "image/jpeg"
+
+
+def _image_filename(url: str, content_type: str) -> str:
+    """Filename for the upload: the URL's basename, with an extension that fits"""
+    name = os.path.basename(unquote(urlsplit(url).path)) or "image"
+    name = name.replace('"', "").replace("\r", "").replace("\n", "")
+    if not mimetypes.guess_type(name)[0]:
+        name += mimetypes.guess_extension(content_type) or ".jpg"
+    return name
+
+
+class ImageRelay:
+    """
+    Re-iterable multipart/form-data body that streams a remote image
+
+    Pass it as data= with the headers from .headers. The first iteration uses
+    the download opened by the constructor; later iterations download again,
+    so the body stays valid when ghost_request re-sends after throttling or a
+    transient error. After a complete pass, .digest holds the SHA-256 of the
+    image bytes.
+
+    Raises:
+        ImageRelayError: If the download fails, is not an image or exceeds max_bytes
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = RELAY_CHUNK_SIZE,
+    ):
+        self.url = url
+        self.max_bytes = max_bytes or DEFAULT_MAX_IMAGE_BYTES
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        self.digest = None
+
+        self._response = self._download()
+        try:
+            self.content_type = _image_content_type(self._response, url)
+            self.filename = _image_filename(url, self.content_type)
+            self.image_length = self._declared_length(self._response)
+        except Exception:
+            self.close()
+            raise
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{self.filename}"\r\n'
+            f"Content-Type: {self.content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+    def _download(self) -> requests.Response:
+        response = requests.get(self.url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+        if response.status_code != 200:
+            response.close()
+            raise ImageRelayError(
+                f"Failed to download image from URL: {self.url} ({response.status_code})"
+            )
+        return response
+
+    def _declared_length(self, response: requests.Response) -> Optional[int]:
+        # Content-Length counts encoded bytes; only trust it for identity encoding
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        try:
+            length = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+        if length > self.max_bytes:
+            raise ImageRelayError(
+                f"Image is {length} bytes, over the {self.max_bytes} byte limit: {self.url}"
+            )
+        return length
+
+    @property
+    def headers(self) -> dict:
+        """Content-Type header for the upload request"""
+        return {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+
+    @property
+    def len(self) -> Optional[int]:
+        """Body length when the image size is known (read by requests for Content-Length)"""
+        if self.image_length is None:
+            return None
+        return len(self._head) + self.image_length + len(self._tail)
+
+    def __iter__(self):
+        response, self._response = self._response or self._download(), None
+        digest = hashlib.sha256()
+        received = 0
+        try:
+            yield self._head
+            for chunk in response.iter_content(self.chunk_size):
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise ImageRelayError(
+                        f"Image exceeds the {self.max_bytes} byte limit: {self.url}"
+                    )
+                digest.update(chunk)
+                yield chunk
+            self.digest = digest
+            yield self._tail
+        finally:
+            response.close()
+
+    def close(self):
+        """Release a download that was opened but never sent"""
+        if self._response is not None:
+            self._response.close()
+            self._response = None
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Generated Image Store
+Keeps the generated_images directory within a byte and file-count budget.
+Every generated image (and its _metadata.json sidecar) is recorded in a
+SQLite index with its size, last use and, once uploaded, its Ghost URL, so
+the store can be inspected without listing the directory. A background
+thread evicts entries that are too old, then least-recently-used entries
+until the store fits its budget - images already uploaded to Ghost first,
+since the local copy is no longer needed.
+
+Enabled by default; disable with GHOST_IMAGE_STORE=false or
+configure_image_store(enabled=False). Index failures never fail a request.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from .sqlite_store import SQLiteStore
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_IMAGE_STORE_ENABLED = os.getenv("GHOST_IMAGE_STORE", "true").lower() == "true"
+DEFAULT_IMAGE_DIR = os.getenv("GHOST_IMAGE_DIR", "./generated_images")
+DEFAULT_IMAGE_STORE_INDEX = os.getenv(
+    "GHOST_IMAGE_STORE_INDEX",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "ghost_blog_smart", "image_store.sqlite3"
+    ),
+)
+DEFAULT_IMAGE_STORE_MAX_BYTES = int(
+    os.getenv("GHOST_IMAGE_STORE_MAX_BYTES", str(1024 * 1024 * 1024))
+)
+DEFAULT_IMAGE_STORE_MAX_FILES = int(os.getenv("GHOST_IMAGE_STORE_MAX_FILES", "1000"))
+# Entries older than this are evicted regardless of budget (0 disables)
+DEFAULT_IMAGE_STORE_MAX_AGE = float(os.getenv("GHOST_IMAGE_STORE_MAX_AGE", "0"))
+DEFAULT_IMAGE_STORE_SWEEP_INTERVAL = float(
+    os.getenv("GHOST_IMAGE_STORE_SWEEP_INTERVAL", "300")
+)
+
+# Sidecar written next to each generated image
+METADATA_SUFFIX = "_metadata.json"
+# Only files the generators write are adopted from an existing directory;
+# anything else there is never indexed, so never evicted
+GENERATED_PREFIXES = ("imagen_", "blog_feature_", "flux_")
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".gif")
+# Images not yet uploaded are kept at least this long, so a file is never
+# removed between generation and upload
+EVICTION_GRACE = 600
+
+_image_store_config = {
+    "enabled": DEFAULT_IMAGE_STORE_ENABLED,
+    "directory": DEFAULT_IMAGE_DIR,
+    "index_path": DEFAULT_IMAGE_STORE_INDEX,
+    "max_bytes": DEFAULT_IMAGE_STORE_MAX_BYTES,
+    "max_files": DEFAULT_IMAGE_STORE_MAX_FILES,
+    "max_age": DEFAULT_IMAGE_STORE_MAX_AGE,
+    "sweep_interval": DEFAULT_IMAGE_STORE_SWEEP_INTERVAL,
+}
+
+
+def _metadata_path(path: str) -> str:
+    return os.path.splitext(path)[0] + METADATA_SUFFIX
+
+
+def _is_generated_image(name: str) -> bool:
+    """True for image files named the way the generators name them"""
+    lowered = name.lower()
+    return lowered.startswith(GENERATED_PREFIXES) and lowered.endswith(IMAGE_SUFFIXES)
+
+
+def _remove(path: Optional[str]):
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ImageStore(SQLiteStore):
+    """Budgeted directory of generated images with a SQLite index"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS images ("
+        "path TEXT PRIMARY KEY, metadata_path TEXT, bytes INTEGER NOT NULL, "
+        "created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+        "ghost_url TEXT, uploaded_at REAL)",
+        "CREATE INDEX IF NOT EXISTS idx_images_eviction "
+        "ON images (ghost_url, accessed_at)",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        index_path: str,
+        max_bytes: int,
+        max_files: int,
+        max_age: float = 0,
+        sweep_interval: float = DEFAULT_IMAGE_STORE_SWEEP_INTERVAL,
+        grace: float = EVICTION_GRACE,
+    ):
+        super().__init__(index_path)
+        self.directory = os.path.abspath(directory)
+        self.index_path = index_path
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_files = max(0, int(max_files))
+        self.max_age = float(max_age or 0)
+        self.sweep_interval = float(sweep_interval)
+        self.grace = float(grace)
+        self.evicted = 0
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def _on_connect(self, conn: sqlite3.Connection):
+        # Each process runs its own sweeper
+        self._wake = threading.Event()
+        self._stopped = False
+        self._adopt_existing(conn)
+        if self.sweep_interval > 0:
+            threading.Thread(target=self._sweep_loop, daemon=True).start()
+
+    def _adopt_existing(self, conn: sqlite3.Connection):
+        """Index generated images written before the store existed"""
+        if not os.path.isdir(self.directory):
+            return
+        known = {row[0] for row in conn.execute("SELECT path FROM images")}
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or not _is_generated_image(entry.name):
+                continue
+            if entry.path in known:
+                continue
+            try:
+                self._insert(conn, entry.path, entry.stat().st_mtime)
+            except OSError:
+                # Removed while scanning
+                continue
+        conn.commit()
+
+    def _insert(self, conn: sqlite3.Connection, path: str, now: float):
+        metadata_path = _metadata_path(path)
+        if not os.path.exists(metadata_path):
+            metadata_path = None
+        size = os.path.getsize(path) + (
+            os.path.getsize(metadata_path) if metadata_path else 0
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO images "
+            "(path, metadata_path, bytes, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (path, metadata_path, size, now, now),
+        )
+
+    def add(self, path: str):
+        """Record a newly written image (its metadata sidecar is picked up too)"""
+        path = os.path.abspath(path)
+        try:
+            with self._lock:
+                conn = self._connection()
+                self._insert(conn, path, time.time())
+                conn.commit()
+                files, size = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM images"
+                ).fetchone()
+            if files > self.max_files or size > self.max_bytes:
+                self._wake.set()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Image store update failed: {str(e)}")
+
+    def mark_uploaded(self, path: str, ghost_url: str):
+        """Note that path now lives on Ghost; such images are evicted first"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "UPDATE images SET ghost_url = ?, uploaded_at = ?, accessed_at = ? "
+                    "WHERE path = ?",
+                    (ghost_url, now, now, os.path.abspath(path)),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Image store update failed: {str(e)}")
+
+    def evict(self) -> int:
+        """
+        Remove expired and missing entries, then evict until within budget
+
+        Eviction order: images already uploaded to Ghost, then the rest, each
+        least recently used first.
+
+        Returns:
+            int: Number of images removed
+        """
+        now = time.time()
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT path, metadata_path, bytes, created_at, accessed_at, "
+                    "ghost_url FROM images "
+                    "ORDER BY (ghost_url IS NULL), accessed_at"
+                )
+                .fetchall()
+            )
+
+        def evictable(row):
+            # Not-yet-uploaded images stay through the grace period
+            return row[5] is not None or now - row[4] > self.grace
+
+        victims = []
+        kept = []
+        for row in rows:
+            expired = self.max_age and now - row[3] > self.max_age
+            if not os.path.exists(row[0]) or (expired and evictable(row)):
+                victims.append(row)
+            else:
+                kept.append(row)
+
+        files = len(kept)
+        size = sum(row[2] for row in kept)
+        for row in kept:
+            if files <= self.max_files and size <= self.max_bytes:
+                break
+            if evictable(row):
+                victims.append(row)
+                files -= 1
+                size -= row[2]
+
+        for row in victims:
+            _remove(row[0])
+            _remove(row[1])
+
+        if victims:
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
+                    "DELETE FROM images WHERE path = ?", [(row[0],) for row in victims]
+                )
+                conn.commit()
+                self.evicted += len(victims)
+        return len(victims)
+
+    def _sweep_loop(self):
+        wake = self._wake
+        while True:
+            wake.wait(self.sweep_interval)
+            wake.clear()
+            if self._stopped:
+                return
+            try:
+                self.evict()
+            except Exception as e:
+                print(f"⚠️ Image store eviction failed: {str(e)}")
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Indexed images, most recently used first
+
+        Returns:
+            list: [{'path', 'metadata_path', 'bytes', 'created_at',
+                    'accessed_at', 'ghost_url', 'uploaded_at'}, ...]
+        """
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT path, metadata_path, bytes, created_at, accessed_at, "
+                    "ghost_url, uploaded_at FROM images "
+                    "ORDER BY accessed_at DESC LIMIT ?",
+                    (-1 if limit is None else int(limit),),
+                )
+                .fetchall()
+            )
+        keys = (
+            "path",
+            "metadata_path",
+            "bytes",
+            "created_at",
+            "accessed_at",
+            "ghost_url",
+            "uploaded_at",
+        )
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """Current usage against the budget, plus evictions by this process"""
+        with self._lock:
+            files, size, uploaded = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(bytes), 0), COUNT(ghost_url) "
+                    "FROM images"
+                )
+                .fetchone()
+            )
+        return {
+            "enabled": _image_store_config["enabled"],
+            "directory": self.directory,
+            "files": files,
+            "bytes": size,
+            "uploaded": uploaded,
+            "max_files": self.max_files,
+            "max_bytes": self.max_bytes,
+            "max_age": self.max_age,
+            "evicted": self.evicted,
+        }
+
+    def close(self):
+        """Stop the background sweeper"""
+        self._stopped = True
+        self._wake.set()
+
+
+_image_store: Optional[ImageStore] = None
+_image_store_lock = threading.Lock()
+
+
+def configure_image_store(
+    enabled: Optional[bool] = None,
+    directory: Optional[str] = None,
+    index_path: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    max_files: Optional[int] = None,
+    max_age: Optional[float] = None,
+    sweep_interval: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Configure the generated image store
+
+    Args:
+        enabled: Turn index and eviction on or off
+        directory: Where generated images are written
+        index_path: SQLite index file shared by all API worker processes
+        max_bytes: Total size budget for images and their metadata files
+        max_files: Maximum number of images kept
+        max_age: Seconds after which an image is evicted (0 disables)
+        sweep_interval: Seconds between background eviction passes (0 leaves
+                        eviction to explicit get_image_store().evict() calls)
+
+    Returns:
+        dict: The active store configuration
+    """
+    global _image_store
+    with _image_store_lock:
+        for key, value in (
+            ("enabled", enabled),
+            ("directory", directory),
+            ("index_path", index_path),
+            ("max_bytes", max_bytes),
+            ("max_files", max_files),
+            ("max_age", max_age),
+            ("sweep_interval", sweep_interval),
+        ):
+            if value is not None:
+                _image_store_config[key] = value
+        # Rebuilt with the new settings on next use
+        if _image_store is not None:
+            _image_store.close()
+            _image_store = None
+        return dict(_image_store_config)
+
+
+def get_image_directory() -> str:
+    """Directory generated images are written to"""
+    return _image_store_config["directory"]
+
+
+def get_image_store() -> Optional[ImageStore]:
+    """Return the shared store, or None when it is disabled"""
+    global _image_store
+    if not _image_store_config["enabled"]:
+        return None
+    with _image_store_lock:
+        if _image_store is None:
+            _image_store = ImageStore(
+                _image_store_config["directory"],
+                _image_store_config["index_path"],
+                _image_store_config["max_bytes"],
+                _image_store_config["max_files"],
+                _image_store_config["max_age"],
+                _image_store_config["sweep_interval"],
+            )
+        return _image_store
+
+
+def get_image_store_stats() -> Dict[str, Any]:
+    """Store usage (files, bytes, uploaded, evicted, budget)"""
+    store = get_image_store()
+    if store is None:
+        return {"enabled": False, "files": 0, "bytes": 0}
+    try:
+        return store.stats()
+    except (sqlite3.Error, OSError) as e:
+        return {"enabled": True, "error": str(e)}
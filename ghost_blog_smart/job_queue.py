@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Background Job Queue
+SQLite-backed job store with a local worker pool, used by the API's opt-in
+async mode. Slow AI pipelines run here instead of holding a request open;
+clients poll the job by ID. Job state lives in SQLite, so every gunicorn
+worker can answer status queries and finished results survive restarts.
+Jobs whose process died (no heartbeat) are marked failed instead of staying
+'running' forever.
+
+Credentials are never persisted: parameter keys naming API keys, tokens,
+passwords or secrets are dropped before a job is stored.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+from .sqlite_store import SQLiteStore
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_JOB_DB_PATH = os.getenv(
+    "GHOST_JOB_DB_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "ghost_blog_smart", "jobs.sqlite3"),
+)
+DEFAULT_JOB_WORKERS = int(os.getenv("GHOST_JOB_WORKERS", "2"))
+# Finished jobs are kept this many seconds
+DEFAULT_JOB_RETENTION = float(os.getenv("GHOST_JOB_RETENTION", str(7 * 24 * 3600)))
+# A queued/running job without a heartbeat for this long is marked failed
+DEFAULT_JOB_STALE_AFTER = float(os.getenv("GHOST_JOB_STALE_AFTER", "120"))
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Parameter names containing any of these are never written to the job store
+SECRET_MARKERS = ("api_key", "token", "password", "secret")
+
+_job_config = {
+    "path": DEFAULT_JOB_DB_PATH,
+    "workers": DEFAULT_JOB_WORKERS,
+    "retention": DEFAULT_JOB_RETENTION,
+    "stale_after": DEFAULT_JOB_STALE_AFTER,
+}
+
+
+def redact_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of params without credentials"""
+    return {
+        key: value
+        for key, value in (params or {}).items()
+        if not any(marker in key.lower() for marker in SECRET_MARKERS)
+    }
+
+
+class JobQueue(SQLiteStore):
+    """Runs callables on a local thread pool and records their state in SQLite"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, "
+        "params TEXT, result TEXT, error TEXT, owner TEXT, "
+        "created_at REAL NOT NULL, started_at REAL, finished_at REAL, "
+        "heartbeat_at REAL)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, heartbeat_at)",
+    )
+
+    def __init__(self, path: str, workers: int, retention: float, stale_after: float):
+        super().__init__(path)
+        self.workers = max(1, int(workers))
+        self.retention = float(retention)
+        self.stale_after = float(stale_after)
+        # Identifies this process's jobs for heartbeats
+        self.owner = uuid.uuid4().hex
+        self._executor = None
+        self._stop = threading.Event()
+
+    def _on_connect(self, conn: sqlite3.Connection):
+        # The worker pool and heartbeat thread are per process, like the connection
+        self.owner = uuid.uuid4().hex
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ghost-job"
+        )
+        self._stop = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, daemon=True).start()
+        self._sweep(conn)
+
+    def _execute(self, sql: str, args: tuple = ()):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(sql, args)
+            conn.commit()
+
+    def _sweep(self, conn: sqlite3.Connection):
+        """Heartbeat own jobs, fail orphaned ones and drop expired results"""
+        now = time.time()
+        conn.execute(
+            "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status IN (?, ?)",
+            (now, self.owner, JOB_QUEUED, JOB_RUNNING),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+            "WHERE status IN (?, ?) AND heartbeat_at < ?",
+            (
+                JOB_FAILED,
+                "Interrupted: the process running this job stopped",
+                now,
+                JOB_QUEUED,
+                JOB_RUNNING,
+                now - self.stale_after,
+            ),
+        )
+        conn.execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+            (now - self.retention,),
+        )
+        conn.commit()
+
+    def _heartbeat_loop(self):
+        stop = self._stop
+        while not stop.wait(max(1.0, self.stale_after / 4)):
+            try:
+                with self._lock:
+                    self._sweep(self._conn)
+            except Exception as e:
+                print(f"⚠️ Job queue heartbeat failed: {str(e)}")
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Record a job and schedule it on the worker pool
+
+        Args:
+            kind: Job type shown in status responses (e.g. 'create_post')
+            func: Zero-argument callable doing the work; a returned dict with
+                  'success': False marks the job failed
+            params: Request parameters to record (credentials are dropped)
+
+        Returns:
+            str: Job ID
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, owner, created_at, "
+                "heartbeat_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    kind,
+                    JOB_QUEUED,
+                    json.dumps(redact_params(params), default=str, ensure_ascii=False),
+                    self.owner,
+                    now,
+                    now,
+                ),
+            )
+            conn.commit()
+            executor = self._executor
+
+        executor.submit(self._run, job_id, func)
+        return job_id
+
+    def _run(self, job_id: str, func: Callable[[], Any]):
+        self._execute(
+            "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+            (JOB_RUNNING, time.time(), job_id),
+        )
+        try:
+            result = func()
+            failed = isinstance(result, dict) and result.get("success") is False
+            error = (result.get("message") or "Job failed") if failed else None
+        except Exception as e:
+            result, failed, error = None, True, str(e)
+
+        self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+            "WHERE id = ?",
+            (
+                JOB_FAILED if failed else JOB_SUCCEEDED,
+                json.dumps(result, default=str, ensure_ascii=False),
+                error,
+                time.time(),
+                job_id,
+            ),
+        )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job
+
+        Returns:
+            dict: {'job_id', 'kind', 'status', 'params', 'result', 'error',
+                   'created_at', 'started_at', 'finished_at'}, or None if unknown
+        """
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT id, kind, status, params, result, error, created_at, "
+                    "started_at, finished_at FROM jobs WHERE id = ?",
+                    (job_id,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+
+        return {
+            "job_id": row[0],
+            "kind": row[1],
+            "status": row[2],
+            "params": json.loads(row[3]) if row[3] else {},
+            "result": json.loads(row[4]) if row[4] else None,
+            "error": row[5],
+            "created_at": row[6],
+            "started_at": row[7],
+            "finished_at": row[8],
+        }
+
+    def close(self, wait: bool = True):
+        """Stop the heartbeat and the worker pool"""
+        self._stop.set()
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def configure_job_queue(
+    path: Optional[str] = None,
+    workers: Optional[int] = None,
+    retention: Optional[float] = None,
+    stale_after: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Configure the background job queue
+
+    Args:
+        path: SQLite database file shared by all API worker processes
+        workers: Jobs run concurrently per process
+        retention: Seconds finished jobs are kept
+        stale_after: Seconds without a heartbeat before a job counts as interrupted
+
+    Returns:
+        dict: The active job queue configuration
+    """
+    global _queue
+    with _queue_lock:
+        for key, value in (
+            ("path", path),
+            ("workers", workers),
+            ("retention", retention),
+            ("stale_after", stale_after),
+        ):
+            if value is not None:
+                _job_config[key] = value
+        # Rebuilt with the new settings on next use; running jobs finish
+        if _queue is not None:
+            _queue.close(wait=False)
+            _queue = None
+        return dict(_job_config)
+
+
+def get_job_queue() -> JobQueue:
+    """Return the shared job queue"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(
+                _job_config["path"],
+                _job_config["workers"],
+                _job_config["retention"],
+                _job_config["stale_after"],
+            )
+        return _queue
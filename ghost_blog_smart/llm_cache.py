@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+Optional SQLite-backed cache for Gemini text and structured-output calls.
+Entries are keyed by a SHA-256 of (model, system prompt, user prompt, generation
+config), expire after a TTL and are evicted least-recently-used once the cache
+holds more than max_entries. Resubmitting the same draft then costs a local
+lookup instead of another Gemini round trip.
+
+Disabled by default; enable with GHOST_LLM_CACHE=true or configure_llm_cache().
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+from .sqlite_store import SQLiteStore, evict_expired_and_lru
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_CACHE_ENABLED = os.getenv("GHOST_LLM_CACHE", "false").lower() == "true"
+DEFAULT_CACHE_PATH = os.getenv(
+    "GHOST_LLM_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "ghost_blog_smart", "llm.sqlite3"),
+)
+DEFAULT_CACHE_TTL = float(os.getenv("GHOST_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_CACHE_MAX_ENTRIES = int(os.getenv("GHOST_LLM_CACHE_MAX_ENTRIES", "1000"))
+
+_cache_config = {
+    "enabled": DEFAULT_CACHE_ENABLED,
+    "path": DEFAULT_CACHE_PATH,
+    "ttl": DEFAULT_CACHE_TTL,
+    "max_entries": DEFAULT_CACHE_MAX_ENTRIES,
+}
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    config: Optional[Dict[str, Any]] = None,
+) -> str:
+    """SHA-256 over everything that determines the model's answer"""
+    material = json.dumps(
+        {
+            "model": model,
+            "system_prompt": system_prompt or "",
+            "prompt": prompt,
+            "config": config or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMCache(SQLiteStore):
+    """SQLite key/value store with TTL, LRU eviction and hit/miss counters"""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+        "created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed "
+        "ON llm_cache (accessed_at)",
+    )
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        super().__init__(path)
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expired entry"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None or now - row[1] > self.ttl:
+                    if row is not None:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        conn.commit()
+                    self.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+                self.hits += 1
+                return json.loads(row[0])
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ LLM cache lookup failed: {str(e)}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serialisable value and evict beyond max_entries"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache "
+                    "(key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), now, now),
+                )
+                evict_expired_and_lru(
+                    conn, "llm_cache", self.ttl, self.max_entries, now
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ LLM cache update failed: {str(e)}")
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the current entry count"""
+        with self._lock:
+            entries = (
+                self._connection().execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            )[0]
+            lookups = self.hits + self.misses
+            return {
+                "enabled": _cache_config["enabled"],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "path": self.path,
+            }
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure_llm_cache(
+    enabled: Optional[bool] = None,
+    path: Optional[str] = None,
+    ttl: Optional[float] = None,
+    max_entries: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Configure the LLM response cache
+
+    Args:
+        enabled: Turn caching on or off
+        path: SQLite database file (':memory:' for a process-local cache)
+        ttl: Seconds an entry stays valid
+        max_entries: Entries kept before least-recently-used ones are evicted
+
+    Returns:
+        dict: The active cache configuration
+    """
+    global _cache
+    with _cache_lock:
+        if enabled is not None:
+            _cache_config["enabled"] = bool(enabled)
+        if path is not None:
+            _cache_config["path"] = path
+        if ttl is not None:
+            _cache_config["ttl"] = float(ttl)
+        if max_entries is not None:
+            _cache_config["max_entries"] = int(max_entries)
+        # Rebuilt with the new settings on next use
+        _cache = None
+        return dict(_cache_config)
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the shared cache, or None when caching is disabled"""
+    global _cache
+    if not _cache_config["enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMCache(
+                _cache_config["path"],
+                _cache_config["ttl"],
+                _cache_config["max_entries"],
+            )
+        return _cache
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Cache statistics (hits, misses, hit_rate, entries, ...)"""
+    cache = get_llm_cache()
+    if cache is None:
+        return {"enabled": False, "hits": 0, "misses": 0, "hit_rate": 0.0}
+    return cache.stats()
@@ -1,24 +1,48 @@
 from pypinyin import lazy_pinyin, Style
-import re, sys, os, unicodedata, mimetypes, requests, jwt, time, json
+import re, sys, os, unicodedata, mimetypes, time, json
 import random
 import base64
 import string
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from markdownify import markdownify as md
 from markdown_it import MarkdownIt
 import markdown
-import google.generativeai as genai
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # Import image generation modules
-from .clean_imagen_generator import CleanImagenGenerator
+from .clean_imagen_generator import get_image_generator, image_header_info
 from .blog_post_refine_prompt import (
     BLOG_POST_REFINE_SYSTEM_PROMPT,
     get_refine_prompt_with_language,
 )
 from .blog_to_image_prompt import BLOG_TO_IMAGE_SYSTEM_PROMPT
+from .ghost_http import (
+    ghost_request,
+    retry_delay,
+    _http_config,
+    _site_key,
+    RETRYABLE_STATUSES,
+    RETRYABLE_EXCEPTIONS,
+)
+from .ghost_auth import get_ghost_token
+from .gemini_client import get_gemini_model
+from .llm_cache import get_llm_cache, make_cache_key
+from .image_cache import (
+    get_image_cache,
+    content_key,
+    digest_key,
+    file_key,
+    url_key,
+)
+from .image_relay import ImageRelay
+from .image_optimizer import optimize_image, is_image_optimizer_enabled
+from .image_store import get_image_store, get_image_directory
 
 IMAGE_GENERATION_AVAILABLE = True
 
@@ -26,6 +50,10 @@ IMAGE_GENERATION_AVAILABLE = True
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GHOST_ADMIN_API_KEY = os.getenv("GHOST_ADMIN_API_KEY")
 GHOST_API_URL = os.getenv("GHOST_API_URL")
+# Write generated images to the image store directory; false keeps them in memory
+SAVE_GENERATED_IMAGES = (
+    os.getenv("GHOST_SAVE_GENERATED_IMAGES", "true").lower() == "true"
+)
 
 # Model configuration
 GEMINI_FLASH_MODEL = "gemini-2.5-flash"  # For text optimization
@@ -33,7 +61,11 @@ IMAGE_MODEL = "imagen-4.0-generate-001"  # For image generation
 
 
 def gemini_chat_simple(
-    prompt: str, system_prompt: str = "", model: str = None, api_key: str = None
+    prompt: str,
+    system_prompt: str = "",
+    model: str = None,
+    api_key: str = None,
+    use_cache: bool = True,
 ) -> str:
     # Use provided API key or fall back to environment variable
     api_key = api_key or GEMINI_API_KEY
@@ -45,12 +77,55 @@ def gemini_chat_simple(
     # Use provided model or fall back to default
     model = model or GEMINI_FLASH_MODEL
 
-    genai.configure(api_key=api_key)
-    genai_model = genai.GenerativeModel(model)
+    # Identical requests are answered from the LLM cache when it is enabled
+    cache = get_llm_cache() if use_cache else None
+    cache_key = make_cache_key(model, system_prompt, prompt) if cache else None
+    if cache:
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+    # Shared per-(key, model) handle: no global configure, safe across threads
+    genai_model = get_gemini_model(model, api_key)
+    full_prompt = prompt
     if system_prompt:
-        prompt = f"{system_prompt}\n\nUser:\n\n{prompt}"
-    response = genai_model.generate_content(prompt)
-    return response.text
+        full_prompt = f"{system_prompt}\n\nUser:\n\n{prompt}"
+    text = genai_model.generate_text(full_prompt)
+
+    if cache and text:
+        cache.set(cache_key, text)
+    return text
+
+
+def _emit_progress(progress_callback, event, **data):
+    """Report a pipeline event to an optional progress_callback(event, data)"""
+    if progress_callback:
+        try:
+            progress_callback(event, data)
+        except Exception as e:
+            print(f"Warning: progress callback failed: {str(e)}")
+
+
+@contextmanager
+def _timed_stage(timings, stage, progress_callback=None):
+    """
+    Add the wall time spent in the block to timings[stage] (seconds, monotonic)
+    and report 'stage' started/finished events to progress_callback
+    """
+    _emit_progress(progress_callback, "stage", stage=stage, status="started")
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings[stage] = round(timings.get(stage, 0.0) + elapsed, 4)
+        _emit_progress(
+            progress_callback,
+            "stage",
+            stage=stage,
+            status="finished",
+            duration=round(elapsed, 4),
+        )
 
 
 def create_slug(title=None):
@@ -104,6 +179,236 @@ def create_slug(title=None):
     return slug
 
 
+def upload_image_to_ghost(image_path_or_url, ghost_api_url, ghost_token):
+    """
+    Upload an image to Ghost
+
+    Parameters:
+    - image_path_or_url: Local path, http(s) URL, base64 data URI, or the
+      encoded image itself as bytes/bytearray/memoryview (nothing is written
+      to disk)
+    - ghost_api_url: Ghost site URL
+    - ghost_token: Ghost admin JWT
+
+    Images already uploaded to this site (same bytes, or same source URL) are
+    served from the image upload cache without another upload.
+
+    Returns:
+    - str: Ghost-hosted image URL, or "" if the upload failed
+    """
+    try:
+        upload_headers = {"Authorization": f"Ghost {ghost_token}"}
+        upload_url = f"{ghost_api_url}/ghost/api/admin/images/upload/"
+
+        cache = get_image_cache()
+        site = _site_key(ghost_api_url)
+        optimizing = is_image_optimizer_enabled()
+        cache_keys = []
+        local_path = None
+
+        def cached_upload(key):
+            # Every key looked up is recorded against the uploaded URL later
+            cache_keys.append(key)
+            hit = cache.get(site, key) if cache else None
+            if hit:
+                print(f"♻️ Reusing previously uploaded image: {hit}")
+            return hit
+
+        image_data = None
+        # Handle raw image bytes
+        if isinstance(image_path_or_url, (bytes, bytearray, memoryview)):
+            image_data = bytes(image_path_or_url)
+            try:
+                _, _, extension, mime_type = image_header_info(image_data)
+            except Exception:
+                print("Image upload failed: bytes are not a readable image")
+                return ""
+            filename = "image" + extension
+        # Handle base64 data
+        elif image_path_or_url.startswith("data:image/"):
+            # Extract base64 data
+
+            header, data = image_path_or_url.split(",", 1)
+            # Get MIME type from header
+            mime_type = header.split(":")[1].split(";")[0]
+            # Decode base64
+            image_data = base64.b64decode(data)
+            filename = "image.jpg"
+
+        # Upload in-memory image data (raw bytes or decoded data URI)
+        if image_data is not None:
+            hit = cached_upload(content_key(image_data))
+            if hit:
+                return hit
+            optimized = optimize_image(image_data)
+            if optimized:
+                image_data, mime_type, extension = optimized
+                filename = "image" + extension
+            # Upload to Ghost
+            files = {"file": (filename, image_data, mime_type)}
+            response = ghost_request(
+                "POST",
+                upload_url,
+                headers=upload_headers,
+                files=files,
+                idempotent=True,
+            )
+        # Handle local file path
+        elif os.path.exists(image_path_or_url):
+            local_path = image_path_or_url
+            hit = cached_upload(file_key(image_path_or_url)) if cache else None
+            if hit:
+                _mark_image_uploaded(local_path, hit)
+                return hit
+
+            # Determine MIME type based on file extension
+            mime_type, _ = mimetypes.guess_type(image_path_or_url)
+            if not mime_type or not mime_type.startswith("image/"):
+                mime_type = "image/jpeg"  # Default fallback
+
+            filename = os.path.basename(image_path_or_url)
+            with open(image_path_or_url, "rb") as image_file:
+                optimized = optimize_image(image_file.read()) if optimizing else None
+                image_file.seek(0)
+                if optimized:
+                    image_data, mime_type, extension = optimized
+                    filename = os.path.splitext(filename)[0] + extension
+                else:
+                    image_data = image_file
+                files = {"file": (filename, image_data, mime_type)}
+                response = ghost_request(
+                    "POST",
+                    upload_url,
+                    headers=upload_headers,
+                    files=files,
+                    idempotent=True,
+                )
+        else:
+            # Handle URL - stream the download straight into the upload body
+            hit = cached_upload(url_key(image_path_or_url))
+            if hit:
+                return hit
+            try:
+                relay = ImageRelay(image_path_or_url)
+            except Exception as e:
+                print(f"Error downloading image: {str(e)}")
+                return ""
+            try:
+                response = ghost_request(
+                    "POST",
+                    upload_url,
+                    headers={**upload_headers, **relay.headers},
+                    data=relay,
+                    idempotent=True,
+                )
+            except Exception as e:
+                print(f"Error relaying image: {str(e)}")
+                return ""
+            finally:
+                relay.close()
+            # Lets later uploads of the same bytes from a file or data URI hit
+            if relay.digest:
+                cache_keys.append(digest_key(relay.digest))
+
+        if response.status_code == 201:
+            response_data = response.json()
+            ghost_image_url = response_data["images"][0]["url"]
+            print(f"Image uploaded successfully: {ghost_image_url}")
+            if cache:
+                for key in cache_keys:
+                    cache.set(site, key, ghost_image_url)
+            if local_path:
+                _mark_image_uploaded(local_path, ghost_image_url)
+            return ghost_image_url
+        else:
+            print(f"Image upload failed: {response.status_code} {response.text}")
+            return ""
+
+    except Exception as e:
+        print(f"Error uploading image to Ghost: {str(e)}")
+        return ""
+
+
+def _track_generated_image(path):
+    """Record a generated image file in the image store, if enabled"""
+    store = get_image_store()
+    if store and path:
+        store.add(path)
+
+
+def _mark_image_uploaded(path, ghost_image_url):
+    """Tell the image store a local file is on Ghost, making it first to evict"""
+    store = get_image_store()
+    if store:
+        store.mark_uploaded(path, ghost_image_url)
+
+
+def _is_ghost_hosted_image(image_url, ghost_api_url):
+    """True if image_url already points at an image uploaded to this Ghost site"""
+    if not isinstance(image_url, str) or not image_url or not ghost_api_url:
+        return False
+    if not image_url.startswith(("http://", "https://")):
+        return False
+    site = urlsplit(ghost_api_url)
+    image = urlsplit(image_url)
+    return image.netloc.lower() == site.netloc.lower() and image.path.startswith(
+        "/content/images/"
+    )
+
+
+def _find_post_by_slug(ghost_api_url, post_type_key, slug, headers):
+    """Return the post (or page) with this slug, or None if Ghost has none"""
+    response = ghost_request(
+        "GET",
+        f"{ghost_api_url}/ghost/api/admin/{post_type_key}/slug/{slug}/",
+        headers=headers,
+    )
+    if response.status_code == 200:
+        items = response.json().get(post_type_key, [])
+        return items[0] if items else None
+    if response.status_code == 404:
+        return None
+    raise RuntimeError(f"Slug lookup failed: {response.status_code}")
+
+
+def _create_post_once(
+    api_url, headers, post_data, ghost_api_url, post_type_key, slug, title
+):
+    """
+    POST a new post, retrying transient failures without creating duplicates
+
+    A failed POST may still have created the post, so before every re-send the
+    slug is looked up. If a post with that slug and title exists it is returned
+    as the result of the create instead of POSTing again.
+
+    Returns:
+    - (response, post): post is the created post, or None if creation failed
+    """
+    retries = _http_config["retries"]
+
+    attempt = 0
+    while True:
+        try:
+            response = ghost_request(
+                "POST", api_url, headers=headers, data=json.dumps(post_data)
+            )
+            if response.status_code in [200, 201]:
+                return response, response.json()[post_type_key][0]
+            if response.status_code not in RETRYABLE_STATUSES or attempt >= retries:
+                return response, None
+        except RETRYABLE_EXCEPTIONS:
+            if attempt >= retries:
+                raise
+
+        time.sleep(retry_delay(attempt))
+        attempt += 1
+
+        existing = _find_post_by_slug(ghost_api_url, post_type_key, slug, headers)
+        if existing and existing.get("title") == title:
+            print(f"♻️ Post already created by an earlier attempt: {existing['id']}")
+            return None, existing
+
+
 def general_ghost_post(**kwargs):
     """
     Simplified Ghost CMS posting function - all parameters via kwargs
@@ -120,14 +425,20 @@ def general_ghost_post(**kwargs):
         visibility (str): 'public', 'members', 'paid' (default: 'public')
         status (str): 'published', 'draft' (default: 'published')
         tags (list): List of tags (default: [])
-        feature_image (str): Feature image path/URL
+        feature_image (str|bytes): Feature image path/URL, or image bytes
         custom_excerpt (str): Custom excerpt
         is_test (bool): Test mode (default: False)
         youtube_video_id (str): YouTube video ID for slug
+        progress_callback (callable): Called as callback(event, data) when each
+                                      stage starts and finishes
 
     Returns:
-        dict: {'success': bool, 'url': str, 'post_id': str, 'message': str}
+        dict: {'success': bool, 'url': str, 'post_id': str, 'message': str,
+               'timings': {'image_upload': s, 'post_create': s}}
     """
+    timings = {}
+    progress = kwargs.get("progress_callback")
+
     # Extract required parameters from kwargs
     title = kwargs.get("title")
     content = kwargs.get("content")
@@ -143,7 +454,10 @@ def general_ghost_post(**kwargs):
         # Process feature image for test mode too
         feature_image = kwargs.get("feature_image", "")
         ghost_feature_image = None
-        if feature_image:
+        if isinstance(feature_image, (bytes, bytearray, memoryview)):
+            # Image bytes are not JSON-serializable; describe them instead
+            ghost_feature_image = f"<in-memory image, {len(feature_image)} bytes>"
+        elif feature_image:
             # For test mode, just use the original feature_image path/URL
             ghost_feature_image = feature_image
 
@@ -194,17 +508,7 @@ def general_ghost_post(**kwargs):
 
     # Generate Ghost JWT token
     try:
-        key_id, secret = ghost_admin_api_key.split(":")
-        iat = int(time.time())
-        header = {"alg": "HS256", "kid": key_id}
-        payload = {
-            "iat": iat,
-            "exp": iat + 5 * 60,  # Token expires in 5 minutes
-            "aud": "/admin/",
-        }
-        ghost_token = jwt.encode(
-            payload, bytes.fromhex(secret), algorithm="HS256", headers=header
-        )
+        ghost_token = get_ghost_token(ghost_admin_api_key)
     except Exception as e:
         return {"success": False, "message": f"Failed to generate JWT token: {str(e)}"}
 
@@ -213,70 +517,6 @@ def general_ghost_post(**kwargs):
         "Content-Type": "application/json",
     }
 
-    # Helper function to upload image to Ghost
-    def upload_image_to_ghost(image_path_or_url, ghost_api_url, ghost_token):
-        try:
-            upload_headers = {"Authorization": f"Ghost {ghost_token}"}
-            upload_url = f"{ghost_api_url}/ghost/api/admin/images/upload/"
-
-            # Handle base64 data
-            if image_path_or_url.startswith("data:image/"):
-                # Extract base64 data
-
-                header, data = image_path_or_url.split(",", 1)
-                # Get MIME type from header
-                mime_type = header.split(":")[1].split(";")[0]
-                # Decode base64
-                image_data = base64.b64decode(data)
-                # Upload to Ghost
-                files = {"file": ("image.jpg", image_data, mime_type)}
-                response = requests.post(
-                    upload_url, headers=upload_headers, files=files
-                )
-            # Handle local file path
-            elif os.path.exists(image_path_or_url):
-                # Determine MIME type based on file extension
-                mime_type, _ = mimetypes.guess_type(image_path_or_url)
-                if not mime_type or not mime_type.startswith("image/"):
-                    mime_type = "image/jpeg"  # Default fallback
-
-                filename = os.path.basename(image_path_or_url)
-                with open(image_path_or_url, "rb") as image_file:
-                    files = {"file": (filename, image_file, mime_type)}
-                    response = requests.post(
-                        upload_url, headers=upload_headers, files=files
-                    )
-            else:
-                # Handle URL - download first then upload
-                try:
-                    img_response = requests.get(image_path_or_url, timeout=10)
-                    if img_response.status_code == 200:
-                        files = {
-                            "file": ("image.jpg", img_response.content, "image/jpeg")
-                        }
-                        response = requests.post(
-                            upload_url, headers=upload_headers, files=files
-                        )
-                    else:
-                        print(f"Failed to download image from URL: {image_path_or_url}")
-                        return ""
-                except Exception as e:
-                    print(f"Error downloading image: {str(e)}")
-                    return ""
-
-            if response.status_code == 201:
-                response_data = response.json()
-                ghost_image_url = response_data["images"][0]["url"]
-                print(f"Image uploaded successfully: {ghost_image_url}")
-                return ghost_image_url
-            else:
-                print(f"Image upload failed: {response.status_code} {response.text}")
-                return ""
-
-        except Exception as e:
-            print(f"Error uploading image to Ghost: {str(e)}")
-            return ""
-
     # Convert content to HTML if needed
     if content_type.lower() == "markdown":
         try:
@@ -323,10 +563,15 @@ def general_ghost_post(**kwargs):
 
     # Handle feature image upload
     ghost_feature_image = None  # Initialize to track actual uploaded image URL
-    if feature_image:
-        ghost_feature_image = upload_image_to_ghost(
-            feature_image, ghost_api_url, ghost_token
-        )
+    if feature_image and _is_ghost_hosted_image(feature_image, ghost_api_url):
+        # Already uploaded (e.g. by create_ghost_blog_post's image branch)
+        ghost_feature_image = feature_image
+        post_content_dict["feature_image"] = ghost_feature_image
+    elif feature_image:
+        with _timed_stage(timings, "image_upload", progress):
+            ghost_feature_image = upload_image_to_ghost(
+                feature_image, ghost_api_url, ghost_token
+            )
         if ghost_feature_image:
             post_content_dict["feature_image"] = ghost_feature_image
         else:
@@ -353,12 +598,20 @@ def general_ghost_post(**kwargs):
 
     # Make the API request
     try:
-        response = requests.post(api_url, headers=headers, data=json.dumps(post_data))
+        with _timed_stage(timings, "post_create", progress):
+            response, created_post = _create_post_once(
+                api_url,
+                headers,
+                post_data,
+                ghost_api_url=ghost_api_url,
+                post_type_key=post_type_key,
+                slug=slug,
+                title=title,
+            )
 
-        if response.status_code in [200, 201]:
-            response_data = response.json()
-            url = response_data[post_type_key][0]["url"]
-            post_id = response_data[post_type_key][0]["id"]
+        if created_post:
+            url = created_post["url"]
+            post_id = created_post["id"]
 
             return {
                 "success": True,
@@ -366,15 +619,16 @@ def general_ghost_post(**kwargs):
                 "post_id": post_id,
                 "message": "Post created successfully",
                 "feature_image": ghost_feature_image,  # Include actual uploaded image URL
+                "timings": timings,
             }
         else:
             error_msg = f"Failed to create post: {response.status_code} {response.text}"
             print(f"❌ Ghost API Error: {error_msg}")
-            return {"success": False, "message": error_msg}
+            return {"success": False, "message": error_msg, "timings": timings}
     except Exception as e:
         error_msg = f"Request failed: {str(e)}"
         print(f"generic_ghost_post() >> {error_msg}")
-        return {"success": False, "message": error_msg}
+        return {"success": False, "message": error_msg, "timings": timings}
 
 
 def create_ghost_blog_post(**kwargs):
@@ -388,7 +642,8 @@ def create_ghost_blog_post(**kwargs):
     Optional Args (in kwargs):
         # Basic post settings
         excerpt (str): Post excerpt/summary
-        feature_image (str): Path or URL to feature image (or base64 data)
+        feature_image (str|bytes): Path or URL to feature image (or base64 data,
+                                   or the image bytes)
         tags (list): List of tags (default: ['Blog'])
         post_type (str): 'post' or 'page' (default: 'post')
         status (str): 'draft' or 'published' (default: 'published')
@@ -404,6 +659,16 @@ def create_ghost_blog_post(**kwargs):
         use_generated_feature_image (bool): Generate feature image with AI (default: False)
         image_generation_prompt (str): Custom prompt for image generation
         image_aspect_ratio (str): Aspect ratio for generated image (default: '16:9')
+        save_generated_images (bool): Write the generated image to
+                                      the image store before uploading; False
+                                      uploads it straight from memory (default:
+                                      GHOST_SAVE_GENERATED_IMAGES, true)
+        combine_llm_calls (bool): With auto_format and use_generated_feature_image,
+                                  format the text and write the image description
+                                  in one structured Gemini call (default: False).
+                                  Saves an LLM call, but image generation then
+                                  waits for the formatting call instead of
+                                  running alongside it, so posts take longer
 
         # API settings
         is_test (bool): Test mode (default: False)
@@ -411,10 +676,18 @@ def create_ghost_blog_post(**kwargs):
         ghost_api_url (str): Override default Ghost API URL
         youtube_video_id (str): YouTube video ID for embedding
         gemini_api_key (str): Gemini API key for AI features
+        progress_callback (callable): Called as callback(event, data) from the
+                                      pipeline (and image worker) threads; 'stage'
+                                      events carry stage, status and duration
 
     Returns:
-        dict: Result from Ghost API with success status, URL, and post ID
+        dict: Result from Ghost API with success status, URL, and post ID, plus
+              'timings': seconds spent per stage (image_prompt, image_generation,
+              text_format, markdown_render, image_upload, post_create, total)
     """
+    pipeline_start = time.perf_counter()
+    timings = {}
+    progress = kwargs.get("progress_callback")
 
     def plain_text_to_formatted_content(
         text, gemini_api_key=None, target_language=None
@@ -458,107 +731,225 @@ def create_ghost_blog_post(**kwargs):
             "message": f'Missing required parameters: {", ".join(missing)}',
         }
 
-    # Handle feature image generation or validation
-    feature_image = kwargs.get("feature_image")
-    use_generated_feature_image = kwargs.get("use_generated_feature_image", False)
+    def format_with_image_prompt(text, gemini_api_key=None, target_language=None):
+        """
+        Format the text and describe its feature image in one structured call
+
+        Returns:
+            dict with 'formatted_content' and 'image_prompt', or None on failure
+            (the separate format and image-prompt calls are used instead)
+        """
+        # smart_gateway imports this module, so import it lazily
+        from .smart_gateway import format_content_with_image_prompt
 
-    # Generate feature image if requested and no image provided
-    if use_generated_feature_image and not feature_image and IMAGE_GENERATION_AVAILABLE:
         try:
-            print("🎨 Generating feature image with AI...")
+            result = format_content_with_image_prompt(
+                text,
+                title,
+                excerpt=kwargs.get("excerpt", kwargs.get("custom_excerpt", "")),
+                target_language=target_language,
+                model=GEMINI_FLASH_MODEL,
+                api_key=gemini_api_key,
+            )
+        except Exception as e:
+            print(f"Warning: Combined format/image call failed: {str(e)}")
+            return None
 
-            # Get API keys for image generation
-            gemini_api_key = kwargs.get("gemini_api_key") or GEMINI_API_KEY
-            replicate_api_key = kwargs.get("replicate_api_key") or os.getenv(
-                "REPLICATE_API_TOKEN"
+        if not result["success"]:
+            print(f"Warning: Combined format/image call failed: {result['message']}")
+            return None
+        return result["data"]
+
+    # Opt-in: one structured call returns the formatted post and the image
+    # description together. It runs before the image branch starts, trading
+    # the text/image overlap for one fewer LLM call
+    combined_output = None
+    if (
+        kwargs.get("combine_llm_calls", False)
+        and kwargs.get("auto_format", True)
+        and kwargs.get("use_generated_feature_image", False)
+        and not kwargs.get("feature_image")
+        and not kwargs.get("image_generation_prompt")
+        and IMAGE_GENERATION_AVAILABLE
+        and (kwargs.get("gemini_api_key") or GEMINI_API_KEY)
+    ):
+        print("🤖 Formatting content and creating image description in one call...")
+        with _timed_stage(timings, "text_format", progress):
+            combined_output = format_with_image_prompt(
+                content,
+                kwargs.get("gemini_api_key") or GEMINI_API_KEY,
+                kwargs.get("target_language", None),
             )
 
-            if not gemini_api_key:
-                print("⚠️ Cannot generate image: Gemini API key not provided")
-            else:
-                # Initialize hybrid image generator with both APIs
-                generator = CleanImagenGenerator(
-                    api_key=gemini_api_key,
-                    model_name=IMAGE_MODEL,
-                    replicate_api_key=replicate_api_key,
-                )
+    # Set when the text branch fails, so the image branch stops before spending
+    # on generation or an upload for a post that will never be created
+    image_cancelled = threading.Event()
 
-                # Create image generation prompt from title and content
-                image_prompt = kwargs.get("image_generation_prompt")
-                if not image_prompt:
-                    # Generate structured prompt from blog content using our system prompt
-                    print("🤖 Analyzing blog content to create image description...")
+    def prepare_feature_image():
+        """
+        Feature-image branch: image prompt -> image generation -> validation -> upload
 
-                    # Extract excerpt and first paragraph only (not full content)
-                    excerpt = kwargs.get("excerpt", kwargs.get("custom_excerpt", ""))
+        Runs alongside text formatting; returns the feature image to post with
+        (a Ghost-hosted URL once uploaded, otherwise the local path/URL/base64).
+        Returns None without further work once image_cancelled is set.
+        """
+        feature_image = kwargs.get("feature_image")
 
-                    # Get first paragraph from content
-                    paragraphs = content.strip().split("\n\n")
-                    first_paragraph = paragraphs[0] if paragraphs else content[:500]
+        # Handle feature image generation or validation
+        use_generated_feature_image = kwargs.get("use_generated_feature_image", False)
 
-                    # Combine title, excerpt, and first paragraph for context
-                    blog_context = f"Blog Title: {title}"
-                    if excerpt:
-                        blog_context += f"\n\nExcerpt: {excerpt}"
-                    blog_context += f"\n\nFirst Paragraph:\n{first_paragraph}"
+        # Generate feature image if requested and no image provided
+        if (
+            use_generated_feature_image
+            and not feature_image
+            and IMAGE_GENERATION_AVAILABLE
+        ):
+            try:
+                print("🎨 Generating feature image with AI...")
 
-                    # Use Gemini to convert blog to image description
-                    full_instruction = (
-                        BLOG_TO_IMAGE_SYSTEM_PROMPT + "\n\n" + blog_context
-                    )
+                # Get API keys for image generation
+                gemini_api_key = kwargs.get("gemini_api_key") or GEMINI_API_KEY
+                replicate_api_key = kwargs.get("replicate_api_key") or os.getenv(
+                    "REPLICATE_API_TOKEN"
+                )
 
-                    # Get structured image description
-                    image_description = gemini_chat_simple(
-                        prompt=full_instruction,
-                        model=GEMINI_FLASH_MODEL,
+                if not gemini_api_key:
+                    print("⚠️ Cannot generate image: Gemini API key not provided")
+                else:
+                    save_to_disk = kwargs.get(
+                        "save_generated_images", SAVE_GENERATED_IMAGES
+                    )
+                    # Shared hybrid image generator for these API keys
+                    generator = get_image_generator(
                         api_key=gemini_api_key,
+                        model_name=IMAGE_MODEL,
+                        replicate_api_key=replicate_api_key,
                     )
 
-                    # Use the structured description as the image prompt
-                    image_prompt = image_description
-                    print(f"🔍 Generated image description: {image_prompt[:100]}...")
+                    # Create image generation prompt from title and content
+                    image_prompt = kwargs.get("image_generation_prompt")
+                    if not image_prompt and combined_output:
+                        image_prompt = combined_output["image_prompt"]
+                    if not image_prompt:
+                        # Generate structured prompt from blog content using our system prompt
+                        print(
+                            "🤖 Analyzing blog content to create image description..."
+                        )
+
+                        # Extract excerpt and first paragraph only (not full content)
+                        excerpt = kwargs.get(
+                            "excerpt", kwargs.get("custom_excerpt", "")
+                        )
 
-                # Generate image with the prompt (no need to optimize again since we already have structured output)
-                # Check if user prefers Flux (Replicate) over Imagen (Google)
-                prefer_flux = kwargs.get("prefer_flux", False) or (
-                    replicate_api_key and not kwargs.get("prefer_imagen", False)
-                )
+                        # Get first paragraph from content
+                        paragraphs = content.strip().split("\n\n")
+                        first_paragraph = paragraphs[0] if paragraphs else content[:500]
+
+                        # Combine title, excerpt, and first paragraph for context
+                        blog_context = f"Blog Title: {title}"
+                        if excerpt:
+                            blog_context += f"\n\nExcerpt: {excerpt}"
+                        blog_context += f"\n\nFirst Paragraph:\n{first_paragraph}"
+
+                        # Use Gemini to convert blog to image description
+                        full_instruction = (
+                            BLOG_TO_IMAGE_SYSTEM_PROMPT + "\n\n" + blog_context
+                        )
+
+                        # Get structured image description
+                        with _timed_stage(timings, "image_prompt", progress):
+                            image_description = gemini_chat_simple(
+                                prompt=full_instruction,
+                                model=GEMINI_FLASH_MODEL,
+                                api_key=gemini_api_key,
+                            )
+
+                        # Use the structured description as the image prompt
+                        image_prompt = image_description
+                        print(
+                            f"🔍 Generated image description: {image_prompt[:100]}..."
+                        )
+
+                    # Generate image with the prompt (no need to optimize again since we already have structured output)
+                    # Check if user prefers Flux (Replicate) over Imagen (Google)
+                    prefer_flux = kwargs.get("prefer_flux", False) or (
+                        replicate_api_key and not kwargs.get("prefer_imagen", False)
+                    )
+
+                    if image_cancelled.is_set():
+                        return None
+                    with _timed_stage(timings, "image_generation", progress):
+                        image_result = generator.generate_image(
+                            prompt=image_prompt,
+                            aspect_ratio=kwargs.get("image_aspect_ratio", "16:9"),
+                            number_of_images=1,
+                            optimize_prompt=False,  # Already optimized by our blog-to-image prompt
+                            output_directory=get_image_directory(),
+                            image_prefix="blog_feature_",
+                            prefer_flux=prefer_flux,
+                            save_to_disk=save_to_disk,
+                        )
+
+                    if image_result["success"]:
+                        # Use the generated image path, or its bytes when kept in memory
+                        generated = image_result["results"][0]
+                        _track_generated_image(generated["filepath"])
+                        feature_image = (
+                            generated["filepath"] or generated["image_bytes"]
+                        )
+                        print(f"✅ Feature image generated: {generated['filename']}")
+                    else:
+                        print(
+                            f"⚠️ Image generation failed: {image_result.get('error')}"
+                        )
+            except Exception as e:
+                print(f"⚠️ Error generating feature image: {str(e)}")
 
-                image_result = generator.generate_image(
-                    prompt=image_prompt,
-                    aspect_ratio=kwargs.get("image_aspect_ratio", "16:9"),
-                    number_of_images=1,
-                    optimize_prompt=False,  # Already optimized by our blog-to-image prompt
-                    output_directory="./generated_images",
-                    image_prefix="blog_feature_",
-                    prefer_flux=prefer_flux,
+        # Validate feature_image if provided (only check for local files, not URLs or base64)
+        if feature_image:
+            # Check if it's image bytes held in memory
+            if isinstance(feature_image, (bytes, bytearray, memoryview)):
+                print(f"🧠 Using in-memory image ({len(feature_image)} bytes)")
+            # Check if it's base64 data
+            elif feature_image.startswith("data:image/"):
+                print("📸 Using base64 image data")
+            # Check if it's a URL
+            elif feature_image.startswith(("http://", "https://")):
+                print(f"🌐 Using image URL: {feature_image}")
+            # Check if it's a local file
+            elif os.path.isfile(feature_image):
+                print(f"📁 Using local image: {feature_image}")
+            else:
+                print(
+                    f"⚠️ Warning: Feature image not found: {feature_image}. Proceeding without image."
                 )
+                feature_image = None
 
-                if image_result["success"]:
-                    # Use the generated image path
-                    feature_image = image_result["results"][0]["filepath"]
-                    print(f"✅ Feature image generated: {feature_image}")
-                else:
-                    print(f"⚠️ Image generation failed: {image_result.get('error')}")
-        except Exception as e:
-            print(f"⚠️ Error generating feature image: {str(e)}")
-
-    # Validate feature_image if provided (only check for local files, not URLs or base64)
-    if feature_image:
-        # Check if it's base64 data
-        if feature_image.startswith("data:image/"):
-            print("📸 Using base64 image data")
-        # Check if it's a URL
-        elif feature_image.startswith(("http://", "https://")):
-            print(f"🌐 Using image URL: {feature_image}")
-        # Check if it's a local file
-        elif os.path.isfile(feature_image):
-            print(f"📁 Using local image: {feature_image}")
-        else:
-            print(
-                f"⚠️ Warning: Feature image not found: {feature_image}. Proceeding without image."
-            )
-            feature_image = None
+        # Upload now so the post create only has to reference the hosted image
+        admin_key = kwargs.get("ghost_admin_api_key") or GHOST_ADMIN_API_KEY
+        api_url = kwargs.get("ghost_api_url") or GHOST_API_URL
+        if feature_image and admin_key and api_url and not kwargs.get("is_test"):
+            if not _is_ghost_hosted_image(feature_image, api_url):
+                if image_cancelled.is_set():
+                    return None
+                with _timed_stage(timings, "image_upload", progress):
+                    uploaded_url = upload_image_to_ghost(
+                        feature_image, api_url, get_ghost_token(admin_key)
+                    )
+                if uploaded_url:
+                    feature_image = uploaded_url
+
+        return feature_image
+
+    # The image branch and the text branch do not depend on each other, so the
+    # image chain runs on a worker thread while the text is formatted here
+    needs_image_work = kwargs.get("feature_image") or (
+        kwargs.get("use_generated_feature_image", False) and IMAGE_GENERATION_AVAILABLE
+    )
+    image_executor = ThreadPoolExecutor(max_workers=1) if needs_image_work else None
+    image_future = (
+        image_executor.submit(prepare_feature_image) if image_executor else None
+    )
 
     try:
         # Get content type and auto-format settings
@@ -571,17 +962,22 @@ def create_ghost_blog_post(**kwargs):
 
         # Process content based on settings
         processed_content = content
-        if auto_format:
+        if combined_output:
+            # Already formatted by the combined call
+            processed_content = combined_output["formatted_content"].strip()
+        elif auto_format:
             # Auto-format plain text for better readability
-            processed_content = plain_text_to_formatted_content(
-                content, gemini_api_key, target_language
-            )
+            with _timed_stage(timings, "text_format", progress):
+                processed_content = plain_text_to_formatted_content(
+                    content, gemini_api_key, target_language
+                )
 
         # Convert to HTML if needed
         if content_type == "markdown":
             try:
-                md_parser = MarkdownIt()
-                final_content = md_parser.render(processed_content)
+                with _timed_stage(timings, "markdown_render", progress):
+                    md_parser = MarkdownIt()
+                    final_content = md_parser.render(processed_content)
                 final_content_type = "html"
             except ImportError:
                 print("Warning: markdown_it not available, using plain text")
@@ -591,6 +987,9 @@ def create_ghost_blog_post(**kwargs):
             final_content = processed_content
             final_content_type = content_type
 
+        # Join the image branch before the post is created
+        feature_image = image_future.result() if image_future else None
+
         # Prepare parameters for general_ghost_post
         post_params = kwargs.copy()  # Start with all original kwargs
 
@@ -618,14 +1017,29 @@ def create_ghost_blog_post(**kwargs):
         # Call the general Ghost post function
         result = general_ghost_post(**post_params)
 
+        # Merge upload/create timings from general_ghost_post into the pipeline view
+        for stage, seconds in result.get("timings", {}).items():
+            timings[stage] = round(timings.get(stage, 0.0) + seconds, 4)
+        timings["total"] = round(time.perf_counter() - pipeline_start, 4)
+        result["timings"] = timings
+
         # The feature_image is now properly returned by general_ghost_post
         # No need to override it here as it contains the actual uploaded URL
         return result
 
     except Exception as e:
+        # Stop the image branch at its next checkpoint (or before it starts)
+        image_cancelled.set()
+        if image_future:
+            image_future.cancel()
         error_msg = f"Failed to create Ghost blog post: {str(e)}"
         print(f"create_ghost_blog_post() >> {error_msg}")
-        return {"success": False, "message": error_msg}
+        timings["total"] = round(time.perf_counter() - pipeline_start, 4)
+        return {"success": False, "message": error_msg, "timings": timings}
+    finally:
+        if image_executor:
+            # The branch has finished or will return at its next checkpoint
+            image_executor.shutdown(wait=False)
 
 
 # ============================================================================
@@ -659,19 +1073,8 @@ def get_ghost_posts(**kwargs):
         if ":" not in admin_key:
             return {"success": False, "message": "Invalid admin API key format"}
 
-        id, secret = admin_key.split(":")
-
-        # Generate JWT token
-        iat = int(time.time())
-        exp = iat + 5 * 60  # 5 minute expiry
-
-        header = {"alg": "HS256", "typ": "JWT", "kid": id}
-
-        payload = {"iat": iat, "exp": exp, "aud": "/admin/"}
-
-        ghost_token = jwt.encode(
-            payload, bytes.fromhex(secret), algorithm="HS256", headers=header
-        )
+        # Get cached JWT token
+        ghost_token = get_ghost_token(admin_key)
 
         # Build query parameters
         params = {
@@ -691,8 +1094,8 @@ def get_ghost_posts(**kwargs):
             "Content-Type": "application/json",
         }
 
-        response = requests.get(
-            f"{api_url}/ghost/api/admin/posts/", headers=headers, params=params
+        response = ghost_request(
+            "GET", f"{api_url}/ghost/api/admin/posts/", headers=headers, params=params
         )
 
         if response.status_code == 200:
@@ -712,6 +1115,162 @@ def get_ghost_posts(**kwargs):
         return {"success": False, "message": f"Error getting posts: {str(e)}"}
 
 
+def _build_post_update_fields(kwargs):
+    """
+    Build the Ghost post update payload from update_ghost_post kwargs
+    Only fields present in kwargs are included (updated_at is added by the caller)
+    """
+    update_fields = {}
+
+    # Status update
+    if "status" in kwargs:
+        update_fields["status"] = kwargs["status"]
+
+    # Featured update
+    if "featured" in kwargs:
+        update_fields["featured"] = bool(kwargs["featured"])
+
+    # Title update
+    if "title" in kwargs:
+        update_fields["title"] = kwargs["title"]
+
+    # Content update
+    if "content" in kwargs:
+        content = kwargs["content"]
+        content_type = kwargs.get("content_type", "markdown")
+        if content_type.lower() == "markdown":
+            content = markdown.markdown(content)
+        update_fields["html"] = content
+
+    # Excerpt update
+    if "excerpt" in kwargs:
+        excerpt = (
+            kwargs["excerpt"][:299]
+            if len(kwargs["excerpt"]) > 299
+            else kwargs["excerpt"]
+        )
+        update_fields["custom_excerpt"] = excerpt
+
+    # Tags update
+    if "tags" in kwargs:
+        tags_list = (
+            kwargs["tags"] if isinstance(kwargs["tags"], list) else [kwargs["tags"]]
+        )
+        update_fields["tags"] = [{"name": tag} for tag in tags_list]
+
+    # Visibility update
+    if "visibility" in kwargs:
+        update_fields["visibility"] = kwargs["visibility"]
+
+    # Published date update
+    if "published_at" in kwargs:
+        published_at = kwargs["published_at"]
+        # Handle datetime object
+        if hasattr(published_at, "isoformat"):
+            # Convert to ISO format and ensure milliseconds
+            published_at = published_at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        elif isinstance(published_at, str):
+            # Ensure proper format for string dates
+            if not published_at.endswith("Z") and not published_at.endswith("+00:00"):
+                if "T" in published_at and not any(
+                    tz in published_at for tz in ["+", "-", "Z"]
+                ):
+                    # Add milliseconds if missing
+                    if "." not in published_at:
+                        published_at = published_at.replace("T", "T").split("T")
+                        published_at = (
+                            published_at[0]
+                            + "T"
+                            + published_at[1].split(".")[0]
+                            + ".000Z"
+                        )
+                    else:
+                        published_at = published_at + "Z"
+        update_fields["published_at"] = published_at
+
+    return update_fields
+
+
+def _update_already_applied(post, update_fields):
+    """
+    True if post already holds every field of update_fields (updated_at aside)
+
+    Used after a 409: when our own retried PUT landed first, the post matches
+    what we sent; anything else means someone else edited it in between.
+    """
+    for key, value in update_fields.items():
+        if key == "updated_at":
+            continue
+        current = post.get(key)
+        if key == "tags":
+            current = [tag.get("name") for tag in current or []]
+            value = [tag["name"] for tag in value]
+        elif key == "html":
+            # Ghost re-serializes HTML; compare ignoring whitespace layout
+            current = " ".join((current or "").split())
+            value = " ".join((value or "").split())
+        if current != value:
+            return False
+    return True
+
+
+def _post_after_collision(api_url, post_id, headers, update_fields):
+    """
+    Resolve a 409 on a post PUT
+
+    A retried PUT whose first attempt already landed is rejected as an update
+    collision. Only if the post now holds exactly what we sent is it our own
+    write, and the refreshed post is returned; otherwise someone else edited
+    the post and None is returned so the conflict goes back to the caller
+    instead of overwriting them.
+    """
+    refreshed = ghost_request(
+        "GET",
+        f"{api_url}/ghost/api/admin/posts/{post_id}/",
+        headers=headers,
+        params={"formats": "html"} if "html" in update_fields else None,
+    )
+    if refreshed.status_code != 200:
+        return None
+    post = refreshed.json()["posts"][0]
+    return post if _update_already_applied(post, update_fields) else None
+
+
+def _update_conflict(post_id):
+    """Result returned when someone else changed the post since it was read"""
+    return {
+        "success": False,
+        "conflict": True,
+        "message": (
+            f"Update collision: post {post_id} was changed by someone "
+            "else since it was read; reload it and try again"
+        ),
+    }
+
+
+def _summarize_post_updates(kwargs):
+    """List human-readable descriptions of the fields an update touches"""
+    updates = []
+    if "status" in kwargs:
+        updates.append(f"status→{kwargs['status']}")
+    if "featured" in kwargs:
+        updates.append(f"featured→{kwargs['featured']}")
+    if "title" in kwargs:
+        updates.append("title updated")
+    if "content" in kwargs:
+        updates.append("content updated")
+    if "excerpt" in kwargs:
+        updates.append("excerpt updated")
+    if "tags" in kwargs:
+        updates.append("tags updated")
+    if "visibility" in kwargs:
+        updates.append(f"visibility→{kwargs['visibility']}")
+    if "published_at" in kwargs:
+        updates.append("published date updated")
+
+    return updates
+
+
 def update_ghost_post(post_id, **kwargs):
     """
     Update various properties of a Ghost blog post
@@ -749,8 +1308,8 @@ def update_ghost_post(post_id, **kwargs):
             }
 
         # Get current post
-        get_response = requests.get(
-            f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
+        get_response = ghost_request(
+            "GET", f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
         )
 
         if get_response.status_code != 200:
@@ -759,75 +1318,7 @@ def update_ghost_post(post_id, **kwargs):
         current_post = get_response.json()["posts"][0]
 
         # Build update data with only provided fields
-        update_fields = {}
-
-        # Status update
-        if "status" in kwargs:
-            update_fields["status"] = kwargs["status"]
-
-        # Featured update
-        if "featured" in kwargs:
-            update_fields["featured"] = bool(kwargs["featured"])
-
-        # Title update
-        if "title" in kwargs:
-            update_fields["title"] = kwargs["title"]
-
-        # Content update
-        if "content" in kwargs:
-            content = kwargs["content"]
-            content_type = kwargs.get("content_type", "markdown")
-            if content_type.lower() == "markdown":
-                content = markdown.markdown(content)
-            update_fields["html"] = content
-
-        # Excerpt update
-        if "excerpt" in kwargs:
-            excerpt = (
-                kwargs["excerpt"][:299]
-                if len(kwargs["excerpt"]) > 299
-                else kwargs["excerpt"]
-            )
-            update_fields["custom_excerpt"] = excerpt
-
-        # Tags update
-        if "tags" in kwargs:
-            tags_list = (
-                kwargs["tags"] if isinstance(kwargs["tags"], list) else [kwargs["tags"]]
-            )
-            update_fields["tags"] = [{"name": tag} for tag in tags_list]
-
-        # Visibility update
-        if "visibility" in kwargs:
-            update_fields["visibility"] = kwargs["visibility"]
-
-        # Published date update
-        if "published_at" in kwargs:
-            published_at = kwargs["published_at"]
-            # Handle datetime object
-            if hasattr(published_at, "isoformat"):
-                # Convert to ISO format and ensure milliseconds
-                published_at = published_at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-            elif isinstance(published_at, str):
-                # Ensure proper format for string dates
-                if not published_at.endswith("Z") and not published_at.endswith(
-                    "+00:00"
-                ):
-                    if "T" in published_at and not any(
-                        tz in published_at for tz in ["+", "-", "Z"]
-                    ):
-                        # Add milliseconds if missing
-                        if "." not in published_at:
-                            published_at = published_at.replace("T", "T").split("T")
-                            published_at = (
-                                published_at[0]
-                                + "T"
-                                + published_at[1].split(".")[0]
-                                + ".000Z"
-                            )
-                        else:
-                            published_at = published_at + "Z"
-            update_fields["published_at"] = published_at
+        update_fields = _build_post_update_fields(kwargs)
 
         # Always include updated_at for version control
         update_fields["updated_at"] = current_post["updated_at"]
@@ -838,34 +1329,27 @@ def update_ghost_post(post_id, **kwargs):
         # Update the post
         update_data = {"posts": [update_fields]}
 
-        response = requests.put(
+        response = ghost_request(
+            "PUT",
             f"{api_url}/ghost/api/admin/posts/{post_id}/",
             headers=headers,
             json=update_data,
         )
 
+        updated_post = None
         if response.status_code == 200:
             updated_post = response.json()["posts"][0]
+        elif response.status_code == 409:
+            updated_post = _post_after_collision(
+                api_url, post_id, headers, update_fields
+            )
+            if updated_post is None:
+                return _update_conflict(post_id)
 
-            # Build update summary
-            updates = []
-            if "status" in kwargs:
-                updates.append(f"status→{kwargs['status']}")
-            if "featured" in kwargs:
-                updates.append(f"featured→{kwargs['featured']}")
-            if "title" in kwargs:
-                updates.append("title updated")
-            if "content" in kwargs:
-                updates.append("content updated")
-            if "excerpt" in kwargs:
-                updates.append("excerpt updated")
-            if "tags" in kwargs:
-                updates.append("tags updated")
-            if "visibility" in kwargs:
-                updates.append(f"visibility→{kwargs['visibility']}")
-            if "published_at" in kwargs:
-                updates.append("published date updated")
+        if updated_post is not None:
 
+            # Build update summary
+            updates = _summarize_post_updates(kwargs)
             update_summary = ", ".join(updates)
             print(
                 f"✅ Post updated successfully ({update_summary}): {api_url}/{updated_post['slug']}"
@@ -896,11 +1380,13 @@ def update_ghost_post_image(post_id, **kwargs):
 
     Parameters:
     - post_id: The ID of the post to update
-    - feature_image: Path/URL/base64 to new image, or None to remove
+    - feature_image: Path/URL/base64 or bytes of the new image, or None to remove
     - use_generated_feature_image: Generate new AI image (default: False)
     - image_prompt: Custom prompt for AI image generation (required if use_generated_image=True and no auto-generate)
     - auto_generate_prompt: Auto-generate prompt from post content (default: True if no image_prompt)
     - image_aspect_ratio: Aspect ratio for generated image (default: '16:9')
+    - save_generated_images: Write the generated image to disk before upload;
+      False uploads it from memory (default: GHOST_SAVE_GENERATED_IMAGES)
     - ghost_admin_api_key: Override env Ghost API key
     - ghost_api_url: Override env Ghost API URL
     - gemini_api_key: Override env Gemini API key (for AI generation)
@@ -941,8 +1427,8 @@ def update_ghost_post_image(post_id, **kwargs):
             }
 
         # Get current post
-        get_response = requests.get(
-            f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
+        get_response = ghost_request(
+            "GET", f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
         )
 
         if get_response.status_code != 200:
@@ -972,7 +1458,7 @@ def update_ghost_post_image(post_id, **kwargs):
                 }
 
             print("🎨 Generating new feature image with AI...")
-            generator = CleanImagenGenerator(
+            generator = get_image_generator(
                 api_key=gemini_api_key,
                 model_name=IMAGE_MODEL,
                 replicate_api_key=replicate_api_key,
@@ -1027,15 +1513,18 @@ def update_ghost_post_image(post_id, **kwargs):
                 aspect_ratio=kwargs.get("image_aspect_ratio", "16:9"),
                 number_of_images=1,
                 optimize_prompt=False,  # Already optimized by our blog-to-image prompt
-                output_directory="./generated_images",
+                output_directory=get_image_directory(),
                 prefer_flux=prefer_flux,
                 image_prefix="blog_feature_",
+                save_to_disk=kwargs.get("save_generated_images", SAVE_GENERATED_IMAGES),
             )
 
             if image_result["success"]:
-                # Get the first image path from results array
-                new_image_path = image_result["results"][0]["filepath"]
-                print(f"✅ Image generated: {new_image_path}")
+                # Get the first image path (or bytes) from results array
+                generated = image_result["results"][0]
+                _track_generated_image(generated["filepath"])
+                new_image_path = generated["filepath"] or generated["image_bytes"]
+                print(f"✅ Image generated: {generated['filename']}")
             else:
                 return {
                     "success": False,
@@ -1044,85 +1533,38 @@ def update_ghost_post_image(post_id, **kwargs):
 
         # Upload new image if provided
         if new_image_path:
-            # Helper function to upload image
-            def upload_image_to_ghost(image_path_or_url, api_url, headers):
-                try:
-                    upload_url = f"{api_url}/ghost/api/admin/images/upload/"
-
-                    # Handle base64 data
-                    if image_path_or_url.startswith("data:image/"):
-                        header, data = image_path_or_url.split(",", 1)
-                        mime_type = header.split(":")[1].split(";")[0]
-                        image_data = base64.b64decode(data)
-                        files = {"file": ("image.jpg", image_data, mime_type)}
-                        response = requests.post(
-                            upload_url,
-                            headers={"Authorization": headers["Authorization"]},
-                            files=files,
-                        )
-                    # Handle local file path
-                    elif os.path.exists(image_path_or_url):
-                        mime_type, _ = mimetypes.guess_type(image_path_or_url)
-                        if not mime_type or not mime_type.startswith("image/"):
-                            mime_type = "image/jpeg"
-                        filename = os.path.basename(image_path_or_url)
-                        with open(image_path_or_url, "rb") as image_file:
-                            files = {"file": (filename, image_file, mime_type)}
-                            response = requests.post(
-                                upload_url,
-                                headers={"Authorization": headers["Authorization"]},
-                                files=files,
-                            )
-                    else:
-                        # Handle URL
-                        img_response = requests.get(image_path_or_url, timeout=10)
-                        if img_response.status_code == 200:
-                            files = {
-                                "file": (
-                                    "image.jpg",
-                                    img_response.content,
-                                    "image/jpeg",
-                                )
-                            }
-                            response = requests.post(
-                                upload_url,
-                                headers={"Authorization": headers["Authorization"]},
-                                files=files,
-                            )
-                        else:
-                            return ""
-
-                    if response.status_code == 201:
-                        response_data = response.json()
-                        return response_data["images"][0]["url"]
-                    else:
-                        return ""
-                except Exception as e:
-                    print(f"Error uploading image: {str(e)}")
-                    return ""
-
-            feature_image_url = upload_image_to_ghost(new_image_path, api_url, headers)
+            feature_image_url = upload_image_to_ghost(
+                new_image_path, api_url, get_ghost_token(admin_key)
+            )
             if not feature_image_url:
                 print("⚠️ Failed to upload image, updating without image")
 
         # Update the post
-        update_data = {
-            "posts": [
-                {
-                    "feature_image": feature_image_url,
-                    "updated_at": current_post["updated_at"],
-                }
-            ]
+        update_fields = {
+            "feature_image": feature_image_url,
+            "updated_at": current_post["updated_at"],
         }
 
-        response = requests.put(
+        response = ghost_request(
+            "PUT",
             f"{api_url}/ghost/api/admin/posts/{post_id}/",
             headers=headers,
-            json=update_data,
+            json={"posts": [update_fields]},
         )
 
+        updated_post = None
         if response.status_code == 200:
             updated_post = response.json()["posts"][0]
+        elif response.status_code == 409:
+            # The image is already generated and uploaded; don't report a
+            # retried PUT that landed as a failure
+            updated_post = _post_after_collision(
+                api_url, post_id, headers, update_fields
+            )
+            if updated_post is None:
+                return _update_conflict(post_id)
+
+        if updated_post is not None:
             action = "updated" if feature_image_url else "removed"
             print(f"✅ Feature image {action} successfully")
             return {
@@ -1171,8 +1613,8 @@ def delete_ghost_post(post_id, **kwargs):
             }
 
         # Delete the post
-        response = requests.delete(
-            f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
+        response = ghost_request(
+            "DELETE", f"{api_url}/ghost/api/admin/posts/{post_id}/", headers=headers
         )
 
         if response.status_code == 204:
@@ -1197,6 +1639,7 @@ def delete_ghost_post(post_id, **kwargs):
 def generate_ghost_headers(admin_key):
     """
     Helper function to generate Ghost API headers with JWT token
+    The token is cached per admin key and reused until shortly before it expires
 
     Parameters:
     - admin_key: Ghost admin API key
@@ -1208,19 +1651,8 @@ def generate_ghost_headers(admin_key):
         if ":" not in admin_key:
             return None
 
-        id, secret = admin_key.split(":")
-
-        # Generate JWT token
-        iat = int(time.time())
-        exp = iat + 5 * 60  # 5 minute expiry
-
-        header = {"alg": "HS256", "typ": "JWT", "kid": id}
-
-        payload = {"iat": iat, "exp": exp, "aud": "/admin/"}
-
-        ghost_token = jwt.encode(
-            payload, bytes.fromhex(secret), algorithm="HS256", headers=header
-        )
+        # Get cached JWT token
+        ghost_token = get_ghost_token(admin_key)
 
         return {
             "Authorization": f"Ghost {ghost_token}",
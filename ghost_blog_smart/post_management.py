@@ -5,14 +5,17 @@ Provides advanced querying, filtering, and batch operations for Ghost CMS posts
 """
 
 import os
-import jwt
-import time
+import re
 import json
-import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from dotenv import load_dotenv
 
+from .ghost_http import ghost_request
+from .ghost_auth import get_ghost_token
+from .concurrency import run_bounded, run_post_operations
+from .main_functions import update_ghost_post, delete_ghost_post
+
 # Load environment variables
 load_dotenv()
 
@@ -20,6 +23,221 @@ load_dotenv()
 GHOST_ADMIN_API_KEY = os.getenv("GHOST_ADMIN_API_KEY")
 GHOST_API_URL = os.getenv("GHOST_API_URL")
 
+# Page size used when streaming or prefetching the full archive
+DEFAULT_PAGE_SIZE = 100
+# Concurrent page requests when fetching the full archive with get_all
+DEFAULT_PREFETCH_WORKERS = int(os.getenv("GHOST_PREFETCH_WORKERS", "4"))
+# Post IDs per id:[...] filter query in batch_get_post_details (keeps URLs short)
+BATCH_ID_CHUNK_SIZE = 50
+
+
+def _build_posts_query_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build Ghost posts browse query parameters from get_ghost_posts_advanced kwargs
+    Shared by the sync and async listing paths.
+    """
+    params = {}
+
+    # Pagination
+    if kwargs.get("get_all"):
+        params["limit"] = "all"
+    else:
+        params["limit"] = kwargs.get("limit", 15)
+        params["page"] = kwargs.get("page", 1)
+
+    # Build filters
+    filters = []
+
+    # Status filter
+    status = kwargs.get("status", "all")
+    if status != "all":
+        filters.append(f"status:{status}")
+
+    # Visibility filter
+    visibility = kwargs.get("visibility", "all")
+    if visibility != "all":
+        filters.append(f"visibility:{visibility}")
+
+    # Featured filter
+    if "featured" in kwargs:
+        filters.append(f'featured:{str(kwargs["featured"]).lower()}')
+
+    # Date range filters
+    date_filters = {
+        "published_after": "published_at:>",
+        "published_before": "published_at:<",
+        "created_after": "created_at:>",
+        "created_before": "created_at:<",
+        "updated_after": "updated_at:>",
+        "updated_before": "updated_at:<",
+    }
+
+    for key, ghost_filter in date_filters.items():
+        if key in kwargs and kwargs[key] is not None:
+            date_value = kwargs[key]
+            # Convert datetime to ISO format
+            if hasattr(date_value, "isoformat"):
+                date_value = date_value.isoformat()
+            # Ensure proper format
+            if "T" not in str(date_value):
+                date_value = str(date_value) + "T00:00:00.000Z"
+            elif not str(date_value).endswith("Z"):
+                if not str(date_value).endswith("+00:00"):
+                    date_value = str(date_value) + "Z"
+            filters.append(f"{ghost_filter}'{date_value}'")
+
+    # Tag filter
+    if "tag" in kwargs and kwargs["tag"]:
+        filters.append(f'tag:{kwargs["tag"]}')
+
+    # Author filter
+    if "author" in kwargs and kwargs["author"]:
+        filters.append(f'author:{kwargs["author"]}')
+
+    # Combine filters
+    if filters:
+        params["filter"] = "+".join(filters)
+
+    # Search
+    if "search" in kwargs and kwargs["search"]:
+        params["search"] = kwargs["search"]
+
+    # Sorting
+    if "order" in kwargs:
+        params["order"] = kwargs["order"]
+    else:
+        params["order"] = "published_at DESC"
+
+    # Include options
+    includes = ["tags", "authors"]
+    if kwargs.get("include_content"):
+        includes.append("mobiledoc")
+    params["include"] = ",".join(includes)
+
+    # Formats
+    formats = []
+    if kwargs.get("include_html"):
+        formats.append("html")
+    if kwargs.get("include_content"):
+        formats.append("mobiledoc")
+    if formats:
+        params["formats"] = ",".join(formats)
+
+    # Specific fields
+    if "fields" in kwargs and kwargs["fields"]:
+        params["fields"] = ",".join(kwargs["fields"])
+
+    return params
+
+
+def _build_posts_listing_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a Ghost posts browse response into the get_ghost_posts_advanced result"""
+    meta = data.get("meta", {})
+    posts = data.get("posts", [])
+
+    # Enhanced response
+    result = {
+        "success": True,
+        "posts": posts,
+        "total": meta.get("pagination", {}).get("total", len(posts)),
+        "pages": meta.get("pagination", {}).get("pages", 1),
+        "page": meta.get("pagination", {}).get("page", 1),
+        "limit": meta.get("pagination", {}).get("limit", len(posts)),
+        "meta": meta,
+    }
+
+    # Add summary info
+    if posts:
+        result["summary"] = {
+            "first_post_date": posts[-1].get("published_at"),
+            "last_post_date": posts[0].get("published_at"),
+            "post_count": len(posts),
+        }
+
+    return result
+
+
+def _build_full_archive_data(
+    first_page: Dict[str, Any], other_pages: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Merge prefetched pages into the shape Ghost returns for limit=all"""
+    posts = list(first_page.get("posts", []))
+    for data in other_pages:
+        posts.extend(data.get("posts", []))
+
+    pagination = first_page.get("meta", {}).get("pagination", {})
+    return {
+        "posts": posts,
+        "meta": {
+            "pagination": {
+                "page": 1,
+                "limit": "all",
+                "pages": 1,
+                "total": pagination.get("total", len(posts)),
+                "next": None,
+                "prev": None,
+            }
+        },
+    }
+
+
+def _fetch_all_posts_parallel(
+    api_url: str, admin_key: str, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Fetch the full archive page by page, prefetching pages concurrently
+
+    Page 1 is fetched first to learn meta.pagination.pages, then the remaining
+    pages go through run_bounded under the per-host cap and are merged back in
+    page order.
+    """
+    page_size = max(1, int(kwargs.get("page_size", DEFAULT_PAGE_SIZE)))
+    max_workers = max(1, int(kwargs.get("max_workers", DEFAULT_PREFETCH_WORKERS)))
+
+    query_kwargs = {
+        k: v for k, v in kwargs.items() if k not in ("get_all", "limit", "page")
+    }
+    base_params = _build_posts_query_params(query_kwargs)
+    base_params["limit"] = page_size
+    url = f"{api_url}/ghost/api/admin/posts/"
+
+    def fetch_page(page):
+        headers = {
+            "Authorization": f"Ghost {get_ghost_token(admin_key)}",
+            "Content-Type": "application/json",
+        }
+        response = ghost_request(
+            "GET", url, headers=headers, params={**base_params, "page": page}
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to get posts page {page}: {response.status_code} {response.text}"
+            )
+        return response.json()
+
+    def fetch_pages(page_numbers):
+        # Share the host's request budget with batch jobs hitting the same site
+        outcomes = run_bounded(
+            fetch_page,
+            page_numbers,
+            max_workers=min(max_workers, len(page_numbers)),
+            host=api_url,
+        )
+        for outcome in outcomes:
+            if not outcome["success"]:
+                raise RuntimeError(outcome["error"])
+        # run_bounded returns results in input order
+        return [outcome["result"] for outcome in outcomes]
+
+    first_page = fetch_pages([1])[0]
+    pages = first_page.get("meta", {}).get("pagination", {}).get("pages") or 1
+
+    other_pages = fetch_pages(list(range(2, pages + 1))) if pages > 1 else []
+
+    return _build_posts_listing_result(
+        _build_full_archive_data(first_page, other_pages)
+    )
+
 
 def get_ghost_posts_advanced(**kwargs) -> Dict[str, Any]:
     """
@@ -30,6 +248,10 @@ def get_ghost_posts_advanced(**kwargs) -> Dict[str, Any]:
         limit (int): Number of posts per page (default: 15, max: all)
         page (int): Page number for pagination (default: 1)
         get_all (bool): Get all posts ignoring pagination (default: False)
+                        Pages are prefetched concurrently and returned in order;
+                        to stream instead of loading everything use iter_ghost_posts()
+        page_size (int): Posts per request when get_all is set (default: 100)
+        max_workers (int): Concurrent page requests when get_all is set (default: 4)
 
         # Status & Visibility Filters
         status (str): 'published', 'draft', 'scheduled', 'all' (default: 'all')
@@ -82,110 +304,15 @@ def get_ghost_posts_advanced(**kwargs) -> Dict[str, Any]:
         if ":" not in admin_key:
             return {"success": False, "message": "Invalid admin API key format"}
 
-        id, secret = admin_key.split(":")
-
-        # Generate JWT token
-        iat = int(time.time())
-        exp = iat + 5 * 60
-
-        header = {"alg": "HS256", "typ": "JWT", "kid": id}
-        payload = {"iat": iat, "exp": exp, "aud": "/admin/"}
-
-        ghost_token = jwt.encode(
-            payload, bytes.fromhex(secret), algorithm="HS256", headers=header
-        )
-
-        # Build query parameters
-        params = {}
-
-        # Pagination
+        # Full archive: prefetch pages concurrently instead of one limit=all request
         if kwargs.get("get_all"):
-            params["limit"] = "all"
-        else:
-            params["limit"] = kwargs.get("limit", 15)
-            params["page"] = kwargs.get("page", 1)
-
-        # Build filters
-        filters = []
-
-        # Status filter
-        status = kwargs.get("status", "all")
-        if status != "all":
-            filters.append(f"status:{status}")
-
-        # Visibility filter
-        visibility = kwargs.get("visibility", "all")
-        if visibility != "all":
-            filters.append(f"visibility:{visibility}")
-
-        # Featured filter
-        if "featured" in kwargs:
-            filters.append(f'featured:{str(kwargs["featured"]).lower()}')
-
-        # Date range filters
-        date_filters = {
-            "published_after": "published_at:>",
-            "published_before": "published_at:<",
-            "created_after": "created_at:>",
-            "created_before": "created_at:<",
-            "updated_after": "updated_at:>",
-            "updated_before": "updated_at:<",
-        }
-
-        for key, ghost_filter in date_filters.items():
-            if key in kwargs and kwargs[key] is not None:
-                date_value = kwargs[key]
-                # Convert datetime to ISO format
-                if hasattr(date_value, "isoformat"):
-                    date_value = date_value.isoformat()
-                # Ensure proper format
-                if "T" not in str(date_value):
-                    date_value = str(date_value) + "T00:00:00.000Z"
-                elif not str(date_value).endswith("Z"):
-                    if not str(date_value).endswith("+00:00"):
-                        date_value = str(date_value) + "Z"
-                filters.append(f"{ghost_filter}'{date_value}'")
-
-        # Tag filter
-        if "tag" in kwargs and kwargs["tag"]:
-            filters.append(f'tag:{kwargs["tag"]}')
-
-        # Author filter
-        if "author" in kwargs and kwargs["author"]:
-            filters.append(f'author:{kwargs["author"]}')
-
-        # Combine filters
-        if filters:
-            params["filter"] = "+".join(filters)
-
-        # Search
-        if "search" in kwargs and kwargs["search"]:
-            params["search"] = kwargs["search"]
-
-        # Sorting
-        if "order" in kwargs:
-            params["order"] = kwargs["order"]
-        else:
-            params["order"] = "published_at DESC"
-
-        # Include options
-        includes = ["tags", "authors"]
-        if kwargs.get("include_content"):
-            includes.append("mobiledoc")
-        params["include"] = ",".join(includes)
+            return _fetch_all_posts_parallel(api_url, admin_key, kwargs)
 
-        # Formats
-        formats = []
-        if kwargs.get("include_html"):
-            formats.append("html")
-        if kwargs.get("include_content"):
-            formats.append("mobiledoc")
-        if formats:
-            params["formats"] = ",".join(formats)
+        # Get cached JWT token
+        ghost_token = get_ghost_token(admin_key)
 
-        # Specific fields
-        if "fields" in kwargs and kwargs["fields"]:
-            params["fields"] = ",".join(kwargs["fields"])
+        # Build query parameters
+        params = _build_posts_query_params(kwargs)
 
         # Make request
         headers = {
@@ -193,35 +320,12 @@ def get_ghost_posts_advanced(**kwargs) -> Dict[str, Any]:
             "Content-Type": "application/json",
         }
 
-        response = requests.get(
-            f"{api_url}/ghost/api/admin/posts/", headers=headers, params=params
+        response = ghost_request(
+            "GET", f"{api_url}/ghost/api/admin/posts/", headers=headers, params=params
         )
 
         if response.status_code == 200:
-            data = response.json()
-            meta = data.get("meta", {})
-            posts = data.get("posts", [])
-
-            # Enhanced response
-            result = {
-                "success": True,
-                "posts": posts,
-                "total": meta.get("pagination", {}).get("total", len(posts)),
-                "pages": meta.get("pagination", {}).get("pages", 1),
-                "page": meta.get("pagination", {}).get("page", 1),
-                "limit": meta.get("pagination", {}).get("limit", len(posts)),
-                "meta": meta,
-            }
-
-            # Add summary info
-            if posts:
-                result["summary"] = {
-                    "first_post_date": posts[-1].get("published_at"),
-                    "last_post_date": posts[0].get("published_at"),
-                    "post_count": len(posts),
-                }
-
-            return result
+            return _build_posts_listing_result(response.json())
         else:
             return {
                 "success": False,
@@ -233,6 +337,116 @@ def get_ghost_posts_advanced(**kwargs) -> Dict[str, Any]:
         return {"success": False, "message": f"Error getting posts: {str(e)}"}
 
 
+def iter_ghost_posts(page_size: int = DEFAULT_PAGE_SIZE, **kwargs) -> Iterator[Dict]:
+    """
+    Stream posts from Ghost one at a time, paging through the archive
+
+    Accepts the same filter, sorting and output options as get_ghost_posts_advanced
+    (limit/page/get_all are ignored). Only one page is held in memory at a time,
+    so memory stays flat regardless of archive size.
+
+    Parameters:
+        page_size (int): Posts fetched per request (default: 100)
+        **kwargs: Filters and credentials, see get_ghost_posts_advanced
+
+    Yields:
+        dict: One post object at a time, in the requested order
+
+    Raises:
+        ValueError: If credentials are missing or malformed
+        RuntimeError: If Ghost returns a non-200 response
+    """
+    admin_key = kwargs.get("ghost_admin_api_key") or GHOST_ADMIN_API_KEY
+    api_url = kwargs.get("ghost_api_url") or GHOST_API_URL
+
+    if not admin_key or not api_url:
+        raise ValueError("Ghost API credentials not provided")
+    if ":" not in admin_key:
+        raise ValueError("Invalid admin API key format")
+
+    query_kwargs = {
+        k: v for k, v in kwargs.items() if k not in ("get_all", "limit", "page")
+    }
+    params = _build_posts_query_params(query_kwargs)
+    params["limit"] = max(1, int(page_size))
+
+    page = 1
+    while True:
+        params["page"] = page
+        headers = {
+            "Authorization": f"Ghost {get_ghost_token(admin_key)}",
+            "Content-Type": "application/json",
+        }
+        response = ghost_request(
+            "GET", f"{api_url}/ghost/api/admin/posts/", headers=headers, params=params
+        )
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to get posts page {page}: {response.status_code} {response.text}"
+            )
+
+        data = response.json()
+        posts = data.get("posts", [])
+        for post in posts:
+            yield post
+
+        pagination = data.get("meta", {}).get("pagination", {})
+        if not posts or not pagination.get("next"):
+            break
+        page = pagination["next"]
+
+
+def _build_post_details_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Build Ghost post read query parameters from get_ghost_post_details kwargs"""
+    includes = []
+    if kwargs.get("include_tags", True):
+        includes.append("tags")
+    if kwargs.get("include_authors", True):
+        includes.append("authors")
+    if kwargs.get("include_count", False):
+        includes.append("count.posts")
+
+    params = {}
+    if includes:
+        params["include"] = ",".join(includes)
+
+    # Formats
+    formats = []
+    if kwargs.get("include_html", True):
+        formats.append("html")
+    if kwargs.get("include_mobiledoc", True):
+        formats.append("mobiledoc")
+    if formats:
+        params["formats"] = ",".join(formats)
+
+    return params
+
+
+def _enrich_post_details(post: Dict[str, Any]) -> Dict[str, Any]:
+    """Add computed convenience fields (formatted dates, preview, word count) to a post"""
+    if post:
+        # Format dates for readability
+        for date_field in ["published_at", "created_at", "updated_at"]:
+            if post.get(date_field):
+                # Keep original ISO format
+                post[f"{date_field}_iso"] = post[date_field]
+                # Add human-readable format
+                try:
+                    dt = datetime.fromisoformat(post[date_field].replace("Z", "+00:00"))
+                    post[f"{date_field}_formatted"] = dt.strftime("%Y-%m-%d %H:%M:%S")
+                except:
+                    pass
+
+        # Add content preview and word count if full content exists
+        if post.get("html"):
+            # Strip HTML tags for preview
+            text = re.sub("<[^<]+?>", "", post["html"])
+            post["content_preview"] = text[:500] + "..." if len(text) > 500 else text
+            post["word_count"] = len(text.split())
+
+    return post
+
+
 def get_ghost_post_details(post_id: str, **kwargs) -> Dict[str, Any]:
     """
     Get complete details of a specific Ghost post by ID
@@ -270,40 +484,11 @@ def get_ghost_post_details(post_id: str, **kwargs) -> Dict[str, Any]:
         if ":" not in admin_key:
             return {"success": False, "message": "Invalid admin API key format"}
 
-        id, secret = admin_key.split(":")
-
-        # Generate JWT token
-        iat = int(time.time())
-        exp = iat + 5 * 60
-
-        header = {"alg": "HS256", "typ": "JWT", "kid": id}
-        payload = {"iat": iat, "exp": exp, "aud": "/admin/"}
-
-        ghost_token = jwt.encode(
-            payload, bytes.fromhex(secret), algorithm="HS256", headers=header
-        )
+        # Get cached JWT token
+        ghost_token = get_ghost_token(admin_key)
 
         # Build query parameters
-        includes = []
-        if kwargs.get("include_tags", True):
-            includes.append("tags")
-        if kwargs.get("include_authors", True):
-            includes.append("authors")
-        if kwargs.get("include_count", False):
-            includes.append("count.posts")
-
-        params = {}
-        if includes:
-            params["include"] = ",".join(includes)
-
-        # Formats
-        formats = []
-        if kwargs.get("include_html", True):
-            formats.append("html")
-        if kwargs.get("include_mobiledoc", True):
-            formats.append("mobiledoc")
-        if formats:
-            params["formats"] = ",".join(formats)
+        params = _build_post_details_params(kwargs)
 
         # Make request
         headers = {
@@ -311,7 +496,8 @@ def get_ghost_post_details(post_id: str, **kwargs) -> Dict[str, Any]:
             "Content-Type": "application/json",
         }
 
-        response = requests.get(
+        response = ghost_request(
+            "GET",
             f"{api_url}/ghost/api/admin/posts/{post_id}/",
             headers=headers,
             params=params,
@@ -324,42 +510,7 @@ def get_ghost_post_details(post_id: str, **kwargs) -> Dict[str, Any]:
             if not posts:
                 return {"success": False, "message": f"Post not found: {post_id}"}
 
-            post = posts[0]
-
-            # Add computed fields for convenience
-            if post:
-                # Format dates for readability
-                for date_field in ["published_at", "created_at", "updated_at"]:
-                    if post.get(date_field):
-                        # Keep original ISO format
-                        post[f"{date_field}_iso"] = post[date_field]
-                        # Add human-readable format
-                        try:
-                            dt = datetime.fromisoformat(
-                                post[date_field].replace("Z", "+00:00")
-                            )
-                            post[f"{date_field}_formatted"] = dt.strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                        except:
-                            pass
-
-                # Add content preview if full content exists
-                if post.get("html"):
-                    # Strip HTML tags for preview
-                    import re
-
-                    text = re.sub("<[^<]+?>", "", post["html"])
-                    post["content_preview"] = (
-                        text[:500] + "..." if len(text) > 500 else text
-                    )
-
-                # Add word count
-                if post.get("html"):
-                    import re
-
-                    text = re.sub("<[^<]+?>", "", post["html"])
-                    post["word_count"] = len(text.split())
+            post = _enrich_post_details(posts[0])
 
             return {"success": True, "post": post}
         elif response.status_code == 404:
@@ -403,11 +554,10 @@ def get_posts_summary(
                 # If days is not a valid integer, ignore it
                 pass
 
-        # Use advanced function with minimal fields for performance
-        result = get_ghost_posts_advanced(
+        # Stream posts in range with minimal fields for performance
+        posts = iter_ghost_posts(
             published_after=date_from,
             published_before=date_to,
-            get_all=True,  # Get all posts in range
             fields=[
                 "id",
                 "title",
@@ -422,67 +572,100 @@ def get_posts_summary(
             ghost_api_url=kwargs.get("ghost_api_url"),
         )
 
-        if result.get("success"):
-            posts = result.get("posts", [])
-
-            # Handle empty posts list
-            if not posts:
-                return {
-                    "success": True,
-                    "total_posts": 0,
-                    "posts": [],
-                    "date_range": {"from": date_from, "to": date_to},
-                    "message": "No posts found in the specified date range",
-                }
-
-            # Format for easy viewing
-            posts_summary = []
-            for post in posts:
-                # Safely handle potential None values
-                summary_post = {
-                    "id": post.get("id", ""),
-                    "title": post.get("title", "Untitled"),
-                    "slug": post.get("slug", ""),
-                    "status": post.get("status", "unknown"),
-                    "featured": post.get("featured", False),
-                    "published_at": post.get("published_at"),
-                    "updated_at": post.get("updated_at"),
-                }
-                posts_summary.append(summary_post)
+        # Format for easy viewing
+        posts_summary = []
+        for post in posts:
+            # Safely handle potential None values
+            summary_post = {
+                "id": post.get("id", ""),
+                "title": post.get("title", "Untitled"),
+                "slug": post.get("slug", ""),
+                "status": post.get("status", "unknown"),
+                "featured": post.get("featured", False),
+                "published_at": post.get("published_at"),
+                "updated_at": post.get("updated_at"),
+            }
+            posts_summary.append(summary_post)
 
+        # Handle empty posts list
+        if not posts_summary:
             return {
                 "success": True,
-                "total_posts": len(posts_summary),
-                "posts": posts_summary,
-                "date_range": {
-                    "from": str(date_from) if date_from else None,
-                    "to": str(date_to) if date_to else None,
-                },
-                "filters_applied": {
-                    "days": days,
-                    "status": kwargs.get("status", "all"),
-                },
-            }
-        else:
-            return {
-                "success": False,
-                "message": result.get(
-                    "message", "Failed to retrieve posts for summary"
-                ),
-                "error": result.get("error"),
+                "total_posts": 0,
+                "posts": [],
+                "date_range": {"from": date_from, "to": date_to},
+                "message": "No posts found in the specified date range",
             }
 
+        return {
+            "success": True,
+            "total_posts": len(posts_summary),
+            "posts": posts_summary,
+            "date_range": {
+                "from": str(date_from) if date_from else None,
+                "to": str(date_to) if date_to else None,
+            },
+            "filters_applied": {
+                "days": days,
+                "status": kwargs.get("status", "all"),
+            },
+        }
+
+    except (ValueError, RuntimeError) as e:
+        return {"success": False, "message": str(e)}
     except Exception as e:
         return {"success": False, "message": f"Error getting posts summary: {str(e)}"}
 
 
+def _chunk_post_ids(
+    post_ids: List[str], size: int = BATCH_ID_CHUNK_SIZE
+) -> List[List[str]]:
+    """De-duplicate post IDs (keeping order) and split them into filter-sized chunks"""
+    unique_ids = list(dict.fromkeys(str(pid).strip() for pid in post_ids))
+    return [unique_ids[i : i + size] for i in range(0, len(unique_ids), size)]
+
+
+def _build_batch_details_params(
+    chunk: List[str], include_content: bool = False
+) -> Dict[str, Any]:
+    """Build a posts browse query that returns every post in chunk in one request"""
+    params = _build_post_details_params(
+        {"include_html": include_content, "include_mobiledoc": include_content}
+    )
+    quoted = ",".join(
+        "'" + pid.replace("\\", "\\\\").replace("'", "\\'") + "'" for pid in chunk
+    )
+    params["filter"] = f"id:[{quoted}]"
+    params["limit"] = len(chunk)
+    return params
+
+
+def _collect_batch_details(
+    results: Dict[str, Any], chunk: List[str], posts: List[Dict[str, Any]]
+):
+    """Enrich the posts returned for a chunk and record chunk IDs Ghost did not return"""
+    found = {post.get("id"): post for post in posts}
+    for post_id in chunk:
+        if post_id in found:
+            results["posts"][post_id] = _enrich_post_details(found[post_id])
+        else:
+            results["failed"].append(
+                {"id": post_id, "error": f"Post not found: {post_id}"}
+            )
+
+
 def batch_get_post_details(post_ids: List[str], **kwargs) -> Dict[str, Any]:
     """
-    Get details for multiple posts at once - FIXED VERSION
+    Get details for multiple posts at once
+
+    IDs are fetched in chunks with a single id:[...] filter query per chunk
+    instead of one request per post. IDs Ghost does not return are reported
+    in 'failed'.
 
     Parameters:
         post_ids (list): List of post IDs to fetch
         include_content (bool): Include full content (default: False)
+        max_workers (int): Concurrent chunk requests (default: GHOST_BATCH_WORKERS)
         ghost_admin_api_key (str): Override env Ghost API key
         ghost_api_url (str): Override env Ghost API URL
 
@@ -514,26 +697,55 @@ def batch_get_post_details(post_ids: List[str], **kwargs) -> Dict[str, Any]:
                 ],
             }
 
-        for post_id in valid_post_ids:
-            try:
-                result = get_ghost_post_details(
-                    post_id,
-                    include_html=kwargs.get("include_content", False),
-                    include_mobiledoc=kwargs.get("include_content", False),
-                    ghost_admin_api_key=kwargs.get("ghost_admin_api_key"),
-                    ghost_api_url=kwargs.get("ghost_api_url"),
-                )
+        # Get API credentials
+        admin_key = kwargs.get("ghost_admin_api_key") or GHOST_ADMIN_API_KEY
+        api_url = kwargs.get("ghost_api_url") or GHOST_API_URL
 
-                if result.get("success"):
-                    results["posts"][post_id] = result["post"]
-                else:
-                    results["failed"].append(
-                        {"id": post_id, "error": result.get("message", "Unknown error")}
-                    )
+        if not admin_key or not api_url:
+            return {
+                "success": False,
+                "message": "Ghost API credentials not provided",
+                "posts": {},
+                "failed": [],
+            }
 
-            except Exception as e:
-                results["failed"].append(
-                    {"id": post_id, "error": f"Exception: {str(e)}"}
+        if ":" not in admin_key:
+            return {
+                "success": False,
+                "message": "Invalid admin API key format",
+                "posts": {},
+                "failed": [],
+            }
+
+        include_content = kwargs.get("include_content", False)
+
+        def fetch_chunk(chunk):
+            headers = {
+                "Authorization": f"Ghost {get_ghost_token(admin_key)}",
+                "Content-Type": "application/json",
+            }
+            response = ghost_request(
+                "GET",
+                f"{api_url}/ghost/api/admin/posts/",
+                headers=headers,
+                params=_build_batch_details_params(chunk, include_content),
+            )
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to get post: {response.status_code}")
+            return response.json().get("posts", [])
+
+        # Chunks are independent, so fetch them concurrently under the per-host cap
+        chunks = _chunk_post_ids(valid_post_ids)
+        outcomes = run_bounded(
+            fetch_chunk, chunks, max_workers=kwargs.get("max_workers"), host=api_url
+        )
+
+        for chunk, outcome in zip(chunks, outcomes):
+            if outcome["success"]:
+                _collect_batch_details(results, chunk, outcome["result"])
+            else:
+                results["failed"].extend(
+                    {"id": post_id, "error": outcome["error"]} for post_id in chunk
                 )
 
         results["total_fetched"] = len(results["posts"])
@@ -551,6 +763,90 @@ def batch_get_post_details(post_ids: List[str], **kwargs) -> Dict[str, Any]:
         }
 
 
+def batch_update_posts(
+    post_ids: List[str], max_workers: Optional[int] = None, **kwargs
+) -> Dict[str, Any]:
+    """
+    Apply the same update to many posts concurrently
+
+    Ghost has no bulk edit endpoint, so each post is updated with its own
+    request on the shared bounded executor.
+
+    Parameters:
+        post_ids (list): IDs of the posts to update
+        max_workers (int): Concurrent updates (default: GHOST_BATCH_WORKERS)
+        **kwargs: Fields to update and credentials, see update_ghost_post
+
+    Returns:
+        dict: {
+            'success': bool,
+            'posts': {post_id: update result},
+            'failed': [{'id', 'error'}],
+            'total_requested', 'total_succeeded', 'total_failed'
+        }
+    """
+    if not post_ids or not isinstance(post_ids, list):
+        return {
+            "success": False,
+            "message": "post_ids must be a non-empty list",
+            "posts": {},
+            "failed": [],
+        }
+
+    api_url = kwargs.get("ghost_api_url") or GHOST_API_URL
+    valid_post_ids = list(
+        dict.fromkeys(str(pid).strip() for pid in post_ids if pid and str(pid).strip())
+    )
+
+    return run_post_operations(
+        lambda post_id: update_ghost_post(post_id, **kwargs),
+        valid_post_ids,
+        max_workers=max_workers,
+        host=api_url,
+    )
+
+
+def batch_delete_posts(
+    post_ids: List[str], max_workers: Optional[int] = None, **kwargs
+) -> Dict[str, Any]:
+    """
+    Delete many posts concurrently
+
+    Parameters:
+        post_ids (list): IDs of the posts to delete
+        max_workers (int): Concurrent deletes (default: GHOST_BATCH_WORKERS)
+        ghost_admin_api_key (str): Override env Ghost API key
+        ghost_api_url (str): Override env Ghost API URL
+
+    Returns:
+        dict: {
+            'success': bool,
+            'posts': {post_id: delete result},
+            'failed': [{'id', 'error'}],
+            'total_requested', 'total_succeeded', 'total_failed'
+        }
+    """
+    if not post_ids or not isinstance(post_ids, list):
+        return {
+            "success": False,
+            "message": "post_ids must be a non-empty list",
+            "posts": {},
+            "failed": [],
+        }
+
+    api_url = kwargs.get("ghost_api_url") or GHOST_API_URL
+    valid_post_ids = list(
+        dict.fromkeys(str(pid).strip() for pid in post_ids if pid and str(pid).strip())
+    )
+
+    return run_post_operations(
+        lambda post_id: delete_ghost_post(post_id, **kwargs),
+        valid_post_ids,
+        max_workers=max_workers,
+        host=api_url,
+    )
+
+
 def find_posts_by_date_pattern(pattern=None, **kwargs) -> Dict[str, Any]:
     """
     Find posts that match specific date patterns - FIXED VERSION
@@ -706,18 +1002,13 @@ def get_all_post_ids(**kwargs) -> List[str]:
         list: List of all post IDs
     """
     try:
-        result = get_ghost_posts_advanced(
-            get_all=True,
+        posts = iter_ghost_posts(
             fields=["id"],
             status=kwargs.get("status", "all"),
             ghost_admin_api_key=kwargs.get("ghost_admin_api_key"),
             ghost_api_url=kwargs.get("ghost_api_url"),
         )
-
-        if result.get("success"):
-            posts = result.get("posts", [])
-            return [post.get("id") for post in posts if post.get("id")]
-        return []
+        return [post.get("id") for post in posts if post.get("id")]
     except Exception as e:
         print(f"Error getting post IDs: {str(e)}")
         return []
@@ -732,19 +1023,13 @@ def get_posts_for_date_update(**kwargs) -> Dict[str, Any]:
         dict: Posts with date information formatted for updates
     """
     try:
-        result = get_ghost_posts_advanced(
-            get_all=True,
+        posts = iter_ghost_posts(
             fields=["id", "title", "slug", "status", "published_at", "created_at"],
             order="published_at ASC",  # Oldest first
             status=kwargs.get("status", "published"),
             ghost_admin_api_key=kwargs.get("ghost_admin_api_key"),
             ghost_api_url=kwargs.get("ghost_api_url"),
         )
-
-        if not result.get("success"):
-            return result
-
-        posts = result.get("posts", [])
         posts_for_update = []
 
         for post in posts:
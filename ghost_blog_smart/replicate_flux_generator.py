@@ -5,10 +5,13 @@ A wrapper around Replicate's Flux-dev model for high-quality image generation.
 Provides fallback support for Google Imagen generation.
 """
 
+import io
 import os
 import time
+import uuid
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 
@@ -16,6 +19,11 @@ from typing import Dict, List, Any, Optional, Union
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Outputs of one prediction downloaded in parallel
+MAX_CONCURRENT_DOWNLOADS = 4
+# flux-dev rejects predictions asking for more outputs than this
+MAX_OUTPUTS_PER_PREDICTION = 4
+
 
 class ReplicateFluxGenerator:
     """
@@ -44,9 +52,9 @@ class ReplicateFluxGenerator:
             try:
                 import replicate
 
-                # Set API token in environment for replicate library
-                os.environ["REPLICATE_API_TOKEN"] = self.api_key
-                self.replicate = replicate
+                # Per-key client instead of the process-wide REPLICATE_API_TOKEN,
+                # so generators for different keys can run side by side
+                self.replicate = replicate.Client(api_token=self.api_key)
                 logger.info(
                     f"✅ Replicate Flux generator initialized with model: {self.model_name}"
                 )
@@ -72,6 +80,7 @@ class ReplicateFluxGenerator:
         number_of_images: int = 1,
         output_directory: str = "./generated_images",
         image_prefix: str = "flux_",
+        save_to_disk: bool = True,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -80,9 +89,12 @@ class ReplicateFluxGenerator:
         Args:
             prompt: Text description of the image to generate
             aspect_ratio: Image aspect ratio (default: "16:9")
-            number_of_images: Number of images to generate (default: 1)
+            number_of_images: Number of images (1-4, default: 1), generated by
+                one prediction and downloaded concurrently
             output_directory: Directory to save images (default: "./generated_images")
             image_prefix: Prefix for saved image files (default: "flux_")
+            save_to_disk: Write images to output_directory (default: True). When
+                False, results carry the bytes in 'image_bytes' and 'filepath' is None
             **kwargs: Additional Flux-specific parameters
 
         Returns:
@@ -97,11 +109,23 @@ class ReplicateFluxGenerator:
                 "generation_time": 0,
             }
 
+        if not 1 <= number_of_images <= MAX_OUTPUTS_PER_PREDICTION:
+            return {
+                "success": False,
+                "error": (
+                    f"number_of_images must be between 1-{MAX_OUTPUTS_PER_PREDICTION}"
+                ),
+                "results": [],
+                "model": self.model_name,
+                "generation_time": 0,
+            }
+
         start_time = time.time()
 
         try:
             # Ensure output directory exists
-            os.makedirs(output_directory, exist_ok=True)
+            if save_to_disk:
+                os.makedirs(output_directory, exist_ok=True)
 
             logger.info(
                 f"🎨 Starting Flux generation of {number_of_images} image(s)..."
@@ -110,79 +134,65 @@ class ReplicateFluxGenerator:
                 f"📝 Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}"
             )
 
-            results = []
-
-            for i in range(number_of_images):
-                # Prepare Flux input parameters
-                flux_input = {
-                    "prompt": prompt,
-                    "go_fast": kwargs.get("go_fast", True),
-                    "guidance": kwargs.get("guidance", 3.5),
-                    "megapixels": kwargs.get("megapixels", "1"),
-                    "num_outputs": 1,  # Generate one at a time for better control
-                    "aspect_ratio": self._convert_aspect_ratio(aspect_ratio),
-                    "output_format": kwargs.get("output_format", "webp"),
-                    "output_quality": kwargs.get("output_quality", 80),
-                    "prompt_strength": kwargs.get("prompt_strength", 0.8),
-                    "num_inference_steps": kwargs.get("num_inference_steps", 28),
+            # One prediction returns every variant (flux-dev allows up to 4)
+            flux_input = {
+                "prompt": prompt,
+                "go_fast": kwargs.get("go_fast", True),
+                "guidance": kwargs.get("guidance", 3.5),
+                "megapixels": kwargs.get("megapixels", "1"),
+                "num_outputs": number_of_images,
+                "aspect_ratio": self._convert_aspect_ratio(aspect_ratio),
+                "output_format": kwargs.get("output_format", "webp"),
+                "output_quality": kwargs.get("output_quality", 80),
+                "prompt_strength": kwargs.get("prompt_strength", 0.8),
+                "num_inference_steps": kwargs.get("num_inference_steps", 28),
+            }
+
+            logger.info(
+                f"🚀 Generating {number_of_images} image(s) in one prediction..."
+            )
+            output = list(self.replicate.run(self.model_name, input=flux_input) or [])
+
+            if not output:
+                logger.error("❌ No output received from Flux model")
+                return {
+                    "success": False,
+                    "error": "No output received from Flux model",
+                    "results": [],
+                    "model": self.model_name,
+                    "generation_time": time.time() - start_time,
                 }
+            if len(output) < number_of_images:
+                logger.warning(
+                    f"⚠️ Flux returned {len(output)} of {number_of_images} image(s)"
+                )
 
-                # Generate image with Replicate
-                logger.info(f"🚀 Generating image {i+1}/{number_of_images}...")
-                output = self.replicate.run(self.model_name, input=flux_input)
-
-                if output and len(output) > 0:
-                    # Download and save the image
-                    image_url = output[0]
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-                    # Handle different aspect ratios for filename
-                    aspect_suffix = aspect_ratio.replace(":", "x")
-                    filename = f"{image_prefix}{timestamp}_{aspect_suffix}.webp"
-                    filepath = os.path.join(output_directory, filename)
-
-                    # Download image
-                    response = requests.get(image_url, timeout=30)
-                    response.raise_for_status()
-
-                    with open(filepath, "wb") as f:
-                        f.write(response.content)
-
-                    # Get image dimensions
-                    try:
-                        from PIL import Image
-
-                        with Image.open(filepath) as img:
-                            width, height = img.size
-                    except ImportError:
-                        # Fallback if PIL not available
-                        width, height = self._estimate_dimensions(
-                            aspect_ratio, flux_input["megapixels"]
-                        )
-
-                    logger.info(f"✅ Image saved: {filename} ({width}x{height})")
-
-                    results.append(
-                        {
-                            "filepath": filepath,
-                            "filename": filename,
-                            "url": image_url,
-                            "width": width,
-                            "height": height,
-                            "aspect_ratio": aspect_ratio,
-                            "prompt": prompt,
-                            "model": self.model_name,
-                        }
+            # Random suffix: concurrent generations in the same second must not
+            # overwrite each other's files
+            timestamp = (
+                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            )
+            # Download all outputs at once; results keep the prediction's order
+            with ThreadPoolExecutor(
+                max_workers=min(len(output), MAX_CONCURRENT_DOWNLOADS)
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        self._save_output,
+                        index,
+                        str(item),
+                        len(output),
+                        timestamp,
+                        prompt,
+                        aspect_ratio,
+                        flux_input,
+                        output_directory,
+                        image_prefix,
+                        save_to_disk,
                     )
-                else:
-                    logger.error(f"❌ No output received for image {i+1}")
-                    return {
-                        "success": False,
-                        "error": f"No output received from Flux model for image {i+1}",
-                        "results": results,
-                        "model": self.model_name,
-                        "generation_time": time.time() - start_time,
-                    }
+                    for index, item in enumerate(output)
+                ]
+                results = [future.result() for future in futures]
 
             generation_time = time.time() - start_time
             logger.info(
@@ -211,6 +221,72 @@ class ReplicateFluxGenerator:
                 "generation_time": generation_time,
             }
 
+    def _save_output(
+        self,
+        index: int,
+        image_url: str,
+        total: int,
+        timestamp: str,
+        prompt: str,
+        aspect_ratio: str,
+        flux_input: Dict[str, Any],
+        output_directory: str,
+        image_prefix: str,
+        save_to_disk: bool,
+    ) -> Dict[str, Any]:
+        """Download one prediction output and build its result entry"""
+        output_format = flux_input["output_format"]
+        extension = "jpg" if output_format == "jpeg" else output_format
+        mime_type = "image/jpeg" if extension == "jpg" else f"image/{extension}"
+
+        # Handle different aspect ratios for filename; index keeps variants apart
+        aspect_suffix = aspect_ratio.replace(":", "x")
+        filename = f"{image_prefix}{timestamp}_{aspect_suffix}"
+        if total > 1:
+            filename += f"_{index+1:03d}"
+        filename += f".{extension}"
+
+        # Download image
+        response = requests.get(image_url, timeout=30)
+        response.raise_for_status()
+        image_bytes = response.content
+
+        filepath = None
+        if save_to_disk:
+            # Absolute like the Imagen generator's paths, so callers treat both alike
+            filepath = os.path.abspath(os.path.join(output_directory, filename))
+            with open(filepath, "wb") as f:
+                f.write(image_bytes)
+
+        # Get image dimensions (header only, no pixel decode)
+        try:
+            from PIL import Image
+
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                width, height = img.size
+        except ImportError:
+            # Fallback if PIL not available
+            width, height = self._estimate_dimensions(
+                aspect_ratio, flux_input["megapixels"]
+            )
+
+        logger.info(f"✅ Image saved: {filename} ({width}x{height})")
+
+        result = {
+            "filepath": filepath,
+            "filename": filename,
+            "url": image_url,
+            "width": width,
+            "height": height,
+            "aspect_ratio": aspect_ratio,
+            "prompt": prompt,
+            "model": self.model_name,
+        }
+        if not save_to_disk:
+            result["image_bytes"] = image_bytes
+            result["mime_type"] = mime_type
+        return result
+
     def _convert_aspect_ratio(self, aspect_ratio: str) -> str:
         """
         Convert aspect ratio to Flux-compatible format.
@@ -7,14 +7,16 @@ Intelligently routes blog creation through two paths:
 """
 
 import os
-import json
 import time
 from typing import Dict, Any
-import google.generativeai as genai
 from dotenv import load_dotenv
 
 # Import our existing blog creation function
-from .main_functions import create_ghost_blog_post
+from .main_functions import create_ghost_blog_post, _emit_progress, _timed_stage
+from .gemini_client import get_gemini_model
+from .llm_cache import get_llm_cache, make_cache_key
+from .blog_to_image_prompt import get_format_and_image_prompt
+from .structured_output import repair_json, coerce_to_schema, validate_against_schema
 
 # Load environment variables
 load_dotenv()
@@ -62,6 +64,22 @@ BLOG_STRUCTURE_SCHEMA = {
     "required": ["title", "content", "excerpt", "tags"],
 }
 
+# Formatted post plus feature image description, returned by one call
+FORMAT_AND_IMAGE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "formatted_content": {
+            "type": "string",
+            "description": "The refined blog post in markdown, ready to publish",
+        },
+        "image_prompt": {
+            "type": "string",
+            "description": "Feature image description for the blog post",
+        },
+    },
+    "required": ["formatted_content", "image_prompt"],
+}
+
 # System prompt for structured output - Combines blog refinement and image generation
 BLOG_REWRITE_SYSTEM_PROMPT = """You are an expert blog writer, content strategist, and visual designer. Your task is to transform user input into a COMPLETE, PUBLICATION-READY blog post with all necessary components.
 
@@ -278,6 +296,7 @@ def direct_publish_blog(**kwargs) -> Dict[str, Any]:
             "ghost_api_url": kwargs.get("ghost_api_url"),
             "gemini_api_key": kwargs.get("gemini_api_key"),
             "is_test": kwargs.get("is_test", False),
+            "progress_callback": kwargs.get("progress_callback"),
         }
 
         # Remove None values
@@ -360,13 +379,14 @@ Content/Ideas:
 
         # Generate structured output
         gemini_api_key = kwargs.get("gemini_api_key") or GEMINI_API_KEY
-        structured_result = gemini_structured_output_with_schema(
-            user_content=user_input,
-            system_prompt=BLOG_REWRITE_SYSTEM_PROMPT,
-            json_schema=BLOG_STRUCTURE_SCHEMA,
-            api_key=gemini_api_key,
-            model=GEMINI_MODEL,
-        )
+        with _timed_stage({}, "rewrite", kwargs.get("progress_callback")):
+            structured_result = gemini_structured_output_with_schema(
+                user_content=user_input,
+                system_prompt=BLOG_REWRITE_SYSTEM_PROMPT,
+                json_schema=BLOG_STRUCTURE_SCHEMA,
+                api_key=gemini_api_key,
+                model=GEMINI_MODEL,
+            )
 
         if not structured_result["success"]:
             return {
@@ -399,6 +419,7 @@ Content/Ideas:
             "ghost_api_url",
             "gemini_api_key",
             "is_test",
+            "progress_callback",
         ]:
             if key in kwargs:
                 api_credentials[key] = kwargs[key]
@@ -476,10 +497,14 @@ def gemini_structured_output_with_schema(
     model: str = None,
     api_key: str = None,
     max_retries: int = 3,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Generate structured output using Gemini that conforms to JSON Schema.
-    Adapted from the reference implementation.
+    Uses the model's native JSON mode (response MIME type + response schema).
+    Responses are repaired and validated locally; only an unusable response
+    costs another LLM call, and only API errors are retried with backoff.
+    Successful results are served from the LLM cache on identical requests.
     """
     if not model:
         model = GEMINI_MODEL
@@ -495,104 +520,119 @@ def gemini_structured_output_with_schema(
                 "retries_used": 0,
             }
 
-    # Build complete prompt with JSON Schema
+    # The schema is enforced natively by the model, so the prompt stays plain
     full_prompt = f"""{system_prompt}
 
-You must respond with a valid JSON object that strictly conforms to the following JSON Schema:
-
-{json.dumps(json_schema, indent=2, ensure_ascii=False)}
-
-IMPORTANT:
-- Your response must be ONLY the JSON object, no additional text
-- All required fields must be present
-- Follow the exact data types and structure specified
-- Use proper JSON formatting
-
 User Input:
 {user_content}"""
 
     start_time = time.time()
 
+    generation_config = {"temperature": 0.3, "top_p": 0.9}
+    cache = get_llm_cache() if use_cache else None
+    cache_key = None
+    if cache:
+        cache_key = make_cache_key(
+            model,
+            system_prompt,
+            user_content,
+            {**generation_config, "json_schema": json_schema},
+        )
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return {
+                "success": True,
+                "data": cached_data,
+                "message": "Successfully generated structured output (cached)",
+                "response_time": time.time() - start_time,
+                "retries_used": 0,
+                "cached": True,
+            }
+
+    last_error = "All attempts failed"
     for attempt in range(max_retries):
         try:
-            # Configure and create model
-            genai.configure(api_key=api_key)
-            model_instance = genai.GenerativeModel(model)
+            # Shared per-(key, model) handle
+            model_instance = get_gemini_model(model, api_key)
 
-            # Generate response (updated API)
+            # Native structured output: JSON MIME type plus the raw JSON Schema
             response = model_instance.generate_content(
                 full_prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=0.3,
-                    top_p=0.9,
-                ),
+                response_mime_type="application/json",
+                response_json_schema=json_schema,
+                **generation_config,
             )
+        except Exception as e:
+            last_error = f"API error: {str(e)}"
+            if attempt < max_retries - 1:
+                time.sleep(2**attempt)  # Backoff only for API failures
+            continue
 
-            if response and hasattr(response, "text") and response.text:
-                try:
-                    # Clean markdown code blocks if present
-                    response_text = response.text.strip()
-                    if response_text.startswith("```json"):
-                        response_text = response_text[7:]
-                        if response_text.endswith("```"):
-                            response_text = response_text[:-3]
-                    elif response_text.startswith("```"):
-                        response_text = response_text[3:]
-                        if response_text.endswith("```"):
-                            response_text = response_text[:-3]
-
-                    # Clean control characters that can break JSON parsing
-                    import re
-
-                    response_text = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", response_text)
-
-                    # Parse JSON
-                    result_data = json.loads(response_text.strip())
-
-                    response_time = time.time() - start_time
-                    return {
-                        "success": True,
-                        "data": result_data,
-                        "message": f"Successfully generated structured output",
-                        "response_time": response_time,
-                        "retries_used": attempt,
-                    }
-
-                except json.JSONDecodeError as e:
-                    if attempt == max_retries - 1:
-                        response_time = time.time() - start_time
-                        return {
-                            "success": False,
-                            "data": None,
-                            "message": f"JSON parsing failed: {str(e)}",
-                            "response_time": response_time,
-                            "retries_used": attempt + 1,
-                        }
-                    time.sleep(2**attempt)  # Exponential backoff
-                    continue
+        try:
+            # Near-misses (fences, truncation, long tag lists) are repaired locally
+            result_data = coerce_to_schema(
+                repair_json(getattr(response, "text", None) or ""), json_schema
+            )
+        except ValueError as e:
+            last_error = f"JSON parsing failed: {str(e)}"
+            continue
 
-        except Exception as e:
-            if attempt == max_retries - 1:
-                response_time = time.time() - start_time
-                return {
-                    "success": False,
-                    "data": None,
-                    "message": f"API error: {str(e)}",
-                    "response_time": response_time,
-                    "retries_used": attempt + 1,
-                }
-            time.sleep(2**attempt)
+        errors = validate_against_schema(result_data, json_schema)
+        if errors:
+            last_error = f"Schema validation failed: {'; '.join(errors)}"
             continue
 
+        if cache:
+            cache.set(cache_key, result_data)
+
+        return {
+            "success": True,
+            "data": result_data,
+            "message": f"Successfully generated structured output",
+            "response_time": time.time() - start_time,
+            "retries_used": attempt,
+        }
+
     return {
         "success": False,
         "data": None,
-        "message": "All attempts failed",
+        "message": last_error,
         "response_time": time.time() - start_time,
         "retries_used": max_retries,
     }
 
 
+def format_content_with_image_prompt(
+    content: str,
+    title: str,
+    excerpt: str = None,
+    target_language: str = None,
+    model: str = None,
+    api_key: str = None,
+) -> Dict[str, Any]:
+    """
+    Format a post and describe its feature image in a single structured call.
+    Replaces the separate refine and blog-to-image calls made by
+    create_ghost_blog_post when both auto-formatting and AI images are on.
+
+    Returns:
+        dict: gemini_structured_output_with_schema result; on success 'data'
+              holds 'formatted_content' and 'image_prompt'
+    """
+    user_content = f"Blog Title: {title}"
+    if excerpt:
+        user_content += f"\n\nExcerpt: {excerpt}"
+    user_content += f"\n\nBlog Content:\n{content}"
+
+    return gemini_structured_output_with_schema(
+        user_content,
+        get_format_and_image_prompt(target_language),
+        FORMAT_AND_IMAGE_SCHEMA,
+        model=model,
+        api_key=api_key,
+    )
+
+
 # ================================================================================
 # MAIN SMART GATEWAY FUNCTION
 # ================================================================================
@@ -606,6 +646,8 @@ def smart_blog_gateway(user_input: str, **kwargs) -> Dict[str, Any]:
     Args:
         user_input: User's blog content or request
         **kwargs: Additional parameters like status, preferred_language, etc.
+                  progress_callback(event, data) receives a 'route' event with
+                  the chosen path and 'stage' events as each stage runs
 
     Returns:
         Dictionary with success status and response message
@@ -628,6 +670,9 @@ def smart_blog_gateway(user_input: str, **kwargs) -> Dict[str, Any]:
         if needs_rewrite:
             # Route to rewrite path
             print("📌 Routing to: rewrite_and_publish_blog")
+            _emit_progress(
+                kwargs.get("progress_callback"), "route", route="rewrite_and_publish"
+            )
             result = rewrite_and_publish_blog(
                 raw_content=user_input,
                 status=kwargs.get("status", "published"),
@@ -642,12 +687,16 @@ def smart_blog_gateway(user_input: str, **kwargs) -> Dict[str, Any]:
                         "ghost_api_url",
                         "gemini_api_key",
                         "is_test",
+                        "progress_callback",
                     ]
                 },
             )
         else:
             # Route to direct publish
             print("📌 Routing to: direct_publish_blog")
+            _emit_progress(
+                kwargs.get("progress_callback"), "route", route="direct_publish"
+            )
 
             # Extract title from first line if it looks like a title
             lines = user_input.strip().split("\n")
@@ -678,6 +727,7 @@ def smart_blog_gateway(user_input: str, **kwargs) -> Dict[str, Any]:
                         "ghost_api_url",
                         "gemini_api_key",
                         "is_test",
+                        "progress_callback",
                     ]
                 },
             )
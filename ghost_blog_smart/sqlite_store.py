@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite Store Plumbing
+Common base for the library's SQLite-backed stores (LLM cache, image upload
+cache, job queue, generated image index). Each store keeps one connection per
+process in WAL mode, so several gunicorn workers can share one database file,
+and reconnects after fork instead of reusing the parent's handle.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Sequence
+
+
+def open_database(path: str, schema: Sequence[str]) -> sqlite3.Connection:
+    """
+    Open a SQLite database in WAL mode and apply its schema
+
+    Args:
+        path: Database file (':memory:' for a process-local database); its
+              directory is created if missing
+        schema: CREATE TABLE / CREATE INDEX IF NOT EXISTS statements
+
+    Returns:
+        sqlite3.Connection usable from any thread (callers serialize access)
+    """
+    if path != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    for statement in schema:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def evict_expired_and_lru(
+    conn: sqlite3.Connection, table: str, ttl: float, max_entries: int, now: float
+):
+    """
+    Drop rows older than ttl, then the least recently used beyond max_entries
+
+    The table needs created_at and accessed_at columns. The caller commits.
+    """
+    conn.execute(f"DELETE FROM {table} WHERE created_at < ?", (now - ttl,))
+    conn.execute(
+        f"DELETE FROM {table} WHERE rowid IN ("
+        f"SELECT rowid FROM {table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+        (max_entries,),
+    )
+
+
+class SQLiteStore:
+    """
+    Base class holding one SQLite connection per process
+
+    Subclasses set schema and call _connection() while holding self._lock.
+    Per-process resources (threads, pools) belong in _on_connect, which runs
+    after every (re)connect.
+    """
+
+    schema: Sequence[str] = ()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections and threads do not survive fork, so each gunicorn
+        # worker opens its own on first use
+        if self._conn is None or self._pid != os.getpid():
+            conn = open_database(self.path, self.schema)
+            self._conn = conn
+            self._pid = os.getpid()
+            self._on_connect(conn)
+        return self._conn
+
+    def _on_connect(self, conn: sqlite3.Connection):
+        """Set up per-process state after a new connection was opened"""
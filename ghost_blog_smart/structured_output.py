@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Structured Output Helpers
+Local parsing, repair and validation of JSON returned by Gemini's structured
+output mode. A near-miss (markdown fences, stray control characters, a response
+cut off mid-object, a tag list one item too long) is fixed here instead of
+paying for another LLM round trip.
+"""
+
+import re
+import json
+from typing import Any, Dict, List
+
+_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+
+
+def _close_truncated_json(text: str) -> str:
+    """Close an unterminated string and any open objects/arrays"""
+    stack = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack:
+            stack.pop()
+
+    if in_string:
+        if escaped:
+            text = text[:-1]
+        text += '"'
+
+    # A dangling "key": or trailing comma cannot be completed meaningfully
+    text = re.sub(r'(,\s*"[^"]*"\s*:\s*|,\s*)$', "", text.rstrip())
+
+    return text + "".join(reversed(stack))
+
+
+def repair_json(text: str) -> Any:
+    """
+    Parse JSON from a model response, repairing common near-misses
+
+    Handles markdown code fences, text around the JSON value, raw control
+    characters inside strings, trailing commas and output truncated before
+    the closing brackets.
+
+    Raises:
+        ValueError: If the text cannot be turned into JSON
+    """
+    if not text or not text.strip():
+        raise ValueError("Empty response")
+
+    candidate = _FENCE_PATTERN.sub("", text.strip())
+
+    # Drop any prose before the first JSON value
+    starts = [i for i in (candidate.find("{"), candidate.find("[")) if i != -1]
+    if starts:
+        candidate = candidate[min(starts) :]
+
+    # strict=False accepts raw newlines/tabs inside strings
+    try:
+        return json.loads(candidate, strict=False)
+    except json.JSONDecodeError:
+        pass
+
+    # Remove other control characters, trailing commas, then close open brackets
+    cleaned = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", candidate)
+    cleaned = _TRAILING_COMMA_PATTERN.sub(r"\1", cleaned)
+    # Last resort for a cut-off object key: drop the final partial element
+    without_partial = re.sub(r',\s*"[^"]*$', "", cleaned)
+    for attempt in (
+        cleaned,
+        _close_truncated_json(cleaned),
+        _close_truncated_json(without_partial),
+    ):
+        try:
+            return json.loads(attempt, strict=False)
+        except json.JSONDecodeError:
+            continue
+
+    # Text after a complete value (e.g. a closing remark) - keep the first value
+    try:
+        value, _ = json.JSONDecoder(strict=False).raw_decode(cleaned)
+        return value
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unrepairable JSON: {str(e)}")
+
+
+def coerce_to_schema(data: Any, schema: Dict[str, Any]) -> Any:
+    """
+    Nudge a parsed value toward the schema without changing its meaning
+
+    - arrays longer than maxItems are trimmed
+    - a comma-separated string where an array of strings is expected is split
+    - "true"/"false" strings become booleans, numeric strings become numbers
+    """
+    expected = schema.get("type")
+
+    if expected == "object" and isinstance(data, dict):
+        properties = schema.get("properties", {})
+        return {
+            key: (
+                coerce_to_schema(value, properties[key]) if key in properties else value
+            )
+            for key, value in data.items()
+        }
+
+    if expected == "array":
+        if isinstance(data, str) and schema.get("items", {}).get("type") == "string":
+            data = [part.strip() for part in data.split(",") if part.strip()]
+        if isinstance(data, list):
+            items = schema.get("items", {})
+            data = [coerce_to_schema(item, items) for item in data]
+            if "maxItems" in schema:
+                data = data[: schema["maxItems"]]
+        return data
+
+    if expected == "boolean" and isinstance(data, str):
+        lowered = data.strip().lower()
+        if lowered in ("true", "false"):
+            return lowered == "true"
+
+    if expected in ("number", "integer") and isinstance(data, str):
+        try:
+            number = float(data)
+            return int(number) if expected == "integer" else number
+        except ValueError:
+            return data
+
+    return data
+
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+
+def validate_against_schema(
+    data: Any, schema: Dict[str, Any], path: str = "$"
+) -> List[str]:
+    """
+    Validate a value against the JSON Schema subset used by this package
+
+    Supports type, properties, required, items, minItems, maxItems and enum.
+
+    Returns:
+        list: Human-readable errors, empty if the value is valid
+    """
+    errors = []
+    expected = schema.get("type")
+    check = _TYPE_CHECKS.get(expected)
+    if check and not check(data):
+        return [f"{path}: expected {expected}, got {type(data).__name__}"]
+
+    if "enum" in schema and data not in schema["enum"]:
+        errors.append(f"{path}: {data!r} is not one of {schema['enum']}")
+
+    if expected == "object":
+        for key in schema.get("required", []):
+            if key not in data:
+                errors.append(f"{path}: missing required field '{key}'")
+        for key, subschema in schema.get("properties", {}).items():
+            if key in data:
+                errors.extend(
+                    validate_against_schema(data[key], subschema, f"{path}.{key}")
+                )
+
+    if expected == "array":
+        if "minItems" in schema and len(data) < schema["minItems"]:
+            errors.append(f"{path}: expected at least {schema['minItems']} items")
+        if "maxItems" in schema and len(data) > schema["maxItems"]:
+            errors.append(f"{path}: expected at most {schema['maxItems']} items")
+        items = schema.get("items")
+        if items:
+            for index, item in enumerate(data):
+                errors.extend(validate_against_schema(item, items, f"{path}[{index}]"))
+
+    return errors
@@ -7,6 +7,8 @@ Tests all endpoints with real Ghost credentials
 import pytest
 import json
 import os
+import time
+from unittest.mock import patch
 from flask import Flask
 from dotenv import load_dotenv
 
@@ -280,6 +282,113 @@ class TestGhostBlogSmartAPI:
         data = json.loads(response.data)
         assert data["success"] == True
 
+    def test_create_post_server_timing(self, client, auth_headers):
+        """Test that stage timings are returned in the body and Server-Timing header"""
+        timings = {"text_format": 1.25, "post_create": 0.5, "total": 1.8}
+        with patch(
+            "app.create_ghost_blog_post",
+            return_value={"success": True, "post_id": "abc", "timings": timings},
+        ):
+            response = client.post(
+                "/api/posts",
+                data=json.dumps({"title": "Timed", "content": "Body"}),
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["data"]["timings"] == timings
+        assert response.headers["Server-Timing"] == (
+            "text_format;dur=1250.0, post_create;dur=500.0, total;dur=1800.0"
+        )
+
+    def test_smart_create_stream(self, client, auth_headers):
+        """Test that smart create streams progress events and ends with the result"""
+
+        def fake_gateway(user_input, progress_callback=None, **kwargs):
+            progress_callback("route", {"route": "rewrite_and_publish"})
+            progress_callback("stage", {"stage": "rewrite", "status": "started"})
+            return {"success": True, "url": "https://blog.example.com/p/"}
+
+        with patch("app.smart_blog_gateway", side_effect=fake_gateway):
+            response = client.post(
+                "/api/smart-create/stream",
+                data=json.dumps({"user_input": "Write about AI benefits"}),
+                headers=auth_headers,
+            )
+            body = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        events = [
+            (
+                block.split("\n")[0][len("event: ") :],
+                json.loads(block.split("data: ")[1]),
+            )
+            for block in body.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["accepted", "route", "stage", "result"]
+        assert events[1][1] == {"route": "rewrite_and_publish"}
+        assert events[-1][1]["data"]["url"] == "https://blog.example.com/p/"
+
+    def test_smart_create_stream_always_ends(self, client, auth_headers):
+        """Test that the stream ends with an error event when the gateway thread fails"""
+
+        def fake_gateway(user_input, progress_callback=None, **kwargs):
+            assert callable(progress_callback)
+            return {"success": True}
+
+        with patch("app.smart_blog_gateway", side_effect=fake_gateway), patch(
+            "app._smart_create_body", side_effect=RuntimeError("boom")
+        ):
+            response = client.post(
+                "/api/smart-create/stream",
+                data=json.dumps(
+                    {"user_input": "Write about AI", "progress_callback": "x"}
+                ),
+                headers=auth_headers,
+            )
+            body = response.get_data(as_text=True)
+
+        blocks = body.strip().split("\n\n")
+        assert blocks[-1].startswith("event: result")
+        result = json.loads(blocks[-1].split("data: ")[1])
+        assert result["success"] is False and result["message"] == "boom"
+
+    def test_create_post_async_job(self, client, auth_headers, tmp_path):
+        """Test that async mode answers 202 and the job reports the result"""
+        from ghost_blog_smart import job_queue
+
+        original = dict(job_queue._job_config)
+        job_queue.configure_job_queue(path=str(tmp_path / "jobs.sqlite3"))
+        try:
+            with patch(
+                "app.create_ghost_blog_post",
+                return_value={"success": True, "post_id": "abc"},
+            ):
+                response = client.post(
+                    "/api/posts",
+                    data=json.dumps({"title": "T", "content": "Body", "async": True}),
+                    headers=auth_headers,
+                )
+                assert response.status_code == 202
+                status_url = json.loads(response.data)["data"]["status_url"]
+                assert response.headers["Location"] == status_url
+
+                for _ in range(500):
+                    job = json.loads(client.get(status_url, headers=auth_headers).data)
+                    if job["data"]["status"] == "succeeded":
+                        break
+                    time.sleep(0.01)
+
+            assert job["data"]["result"]["data"]["post_id"] == "abc"
+            assert "async" not in job["data"]["params"]
+            missing = client.get("/api/jobs/unknown", headers=auth_headers)
+            assert missing.status_code == 404
+        finally:
+            job_queue._job_config.update(original)
+            job_queue.configure_job_queue()
+
     def test_api_response_format(self, client):
         """Test that all API responses follow standard format"""
         response = client.get("/")
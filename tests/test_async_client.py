@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio Ghost client
+"""
+
+import asyncio
+import json
+import re
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from ghost_blog_smart import AsyncGhostBlogSmart, async_client, ghost_ratelimit
+
+ADMIN_KEY = "68aaca1251d63700017fb41c:" + "ab" * 32
+GHOST_URL = "https://blog.example.com"
+
+
+def ghost_handler(request: httpx.Request) -> httpx.Response:
+    """Minimal fake of the Ghost Admin posts API"""
+    assert request.headers["Authorization"].startswith("Ghost ")
+    path = request.url.path
+    if request.method == "GET" and path.endswith("/posts/"):
+        id_filter = request.url.params.get("filter", "")
+        if id_filter.startswith("id:["):
+            ids = re.findall(r"'([^']*)'", id_filter)
+            return httpx.Response(
+                200,
+                json={
+                    "posts": [
+                        {"id": pid, "html": "<p>Hi</p>"}
+                        for pid in ids
+                        if pid != "missing"
+                    ]
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "posts": [{"id": "a", "published_at": "2024-01-02T00:00:00.000Z"}],
+                "meta": {"pagination": {"total": 1, "pages": 1, "page": 1}},
+            },
+        )
+    post_id = path.rstrip("/").split("/")[-1]
+    if post_id == "missing":
+        return httpx.Response(404, json={"errors": []})
+    if request.method == "GET":
+        return httpx.Response(
+            200,
+            json={
+                "posts": [
+                    {
+                        "id": post_id,
+                        "html": "<p>Hello async world</p>",
+                        "updated_at": "2024-01-01T00:00:00.000Z",
+                    }
+                ]
+            },
+        )
+    if request.method == "PUT":
+        body = json.loads(request.content)["posts"][0]
+        return httpx.Response(
+            200,
+            json={
+                "posts": [
+                    {"id": post_id, "slug": "s", "status": body.get("status", "draft")}
+                ]
+            },
+        )
+    return httpx.Response(204)
+
+
+class TestAsyncGhostBlogSmart:
+    """Native async Ghost calls against a mocked transport"""
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncGhostBlogSmart(ghost_url=GHOST_URL, ghost_api_key=ADMIN_KEY)
+        asyncio.run(client._http.aclose())
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(ghost_handler))
+        return client
+
+    def test_get_post_details_enriched(self, client):
+        result = asyncio.run(client.get_post_details("abc"))
+
+        assert result["success"] is True
+        assert result["post"]["word_count"] == 3
+        assert result["post"]["content_preview"] == "Hello async world"
+
+    def test_get_posts_advanced_shapes_listing(self, client):
+        result = asyncio.run(client.get_posts_advanced(status="published"))
+
+        assert result["success"] is True
+        assert result["total"] == 1
+        assert result["summary"]["post_count"] == 1
+
+    def test_batch_details_reports_failures(self, client):
+        result = asyncio.run(client.batch_get_post_details(["a", "missing", "b"]))
+
+        assert list(result["posts"]) == ["a", "b"]
+        assert result["failed"] == [
+            {"id": "missing", "error": "Post not found: missing"}
+        ]
+        assert result["total_requested"] == 3
+
+    def test_update_and_delete(self, client):
+        updated = asyncio.run(client.update_post("abc", status="published"))
+        deleted = asyncio.run(client.delete_post("abc"))
+
+        assert updated["success"] is True
+        assert updated["status"] == "published"
+        assert deleted == {
+            "success": True,
+            "message": "Post deleted successfully",
+            "post_id": "abc",
+        }
+
+
+class TestAsyncPacingAndRetry:
+    """Async requests share the sync rate limiter and retry policy"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_limiter(self):
+        original = dict(ghost_ratelimit._rate_config)
+        ghost_ratelimit._buckets.clear()
+        yield
+        ghost_ratelimit._rate_config.update(original)
+        ghost_ratelimit._buckets.clear()
+
+    def make_client(self, statuses, headers=None):
+        sent = []
+
+        def handler(request):
+            sent.append(request.method)
+            status = statuses[min(len(sent), len(statuses)) - 1]
+            if status != 200:
+                return httpx.Response(status, headers=headers or {})
+            return ghost_handler(request)
+
+        client = AsyncGhostBlogSmart(ghost_url=GHOST_URL, ghost_api_key=ADMIN_KEY)
+        asyncio.run(client._http.aclose())
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client, sent
+
+    def test_throttled_request_waits_and_resends(self):
+        ghost_ratelimit.configure_ghost_rate_limit(rate=10, max_rate=10)
+        client, sent = self.make_client([429, 200], {"Retry-After": "0"})
+
+        result = asyncio.run(client.get_post_details("abc"))
+
+        assert result["success"] is True
+        assert sent == ["GET", "GET"]
+        bucket = ghost_ratelimit.get_rate_limiter(GHOST_URL)
+        # Halved by the 429, then nudged up by the success
+        assert bucket.rate == 5.5
+
+    def test_server_errors_retried_with_jitter(self):
+        client, sent = self.make_client([502, 503, 200])
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        with patch.object(async_client.asyncio, "sleep", side_effect=fake_sleep):
+            result = asyncio.run(client.get_post_details("abc"))
+
+        assert result["success"] is True
+        assert len(sent) == 3
+        assert len(delays) == 2 and all(delay >= 0 for delay in delays)
+
+    def test_post_not_retried(self):
+        client, sent = self.make_client([502])
+
+        response = asyncio.run(
+            client._request("POST", f"{GHOST_URL}/ghost/api/admin/posts/")
+        )
+
+        assert response.status_code == 502
+        assert sent == ["POST"]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded per-post executor
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ghost_blog_smart import concurrency, post_management
+
+GHOST_URL = "https://blog.example.com"
+
+
+class TestRunBounded:
+    """Ordering, failure reporting and per-host caps"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_config(self):
+        original = dict(concurrency._concurrency_config)
+        concurrency._host_semaphores.clear()
+        yield
+        concurrency._concurrency_config.update(original)
+        concurrency._host_semaphores.clear()
+
+    def test_results_in_input_order(self):
+        def slow_echo(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        outcomes = concurrency.run_bounded(slow_echo, range(5), max_workers=5)
+
+        assert [o["result"] for o in outcomes] == [0, 2, 4, 6, 8]
+        assert all(o["success"] for o in outcomes)
+
+    def test_partial_failures_reported(self):
+        def operation(post_id):
+            if post_id == "boom":
+                raise RuntimeError("exploded")
+            if post_id == "gone":
+                return {"success": False, "message": "Post not found: gone"}
+            return {"success": True, "post_id": post_id}
+
+        result = concurrency.run_post_operations(
+            operation, ["a", "boom", "b", "gone"], max_workers=2
+        )
+
+        assert list(result["posts"]) == ["a", "b"]
+        assert result["failed"] == [
+            {"id": "boom", "error": "exploded"},
+            {"id": "gone", "error": "Post not found: gone"},
+        ]
+        assert result["total_succeeded"] == 2
+        assert result["total_failed"] == 2
+
+    def test_per_host_cap_shared_across_calls(self):
+        concurrency.configure_batch_concurrency(max_per_host=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def operation(item):
+            with lock:
+                active.append(item)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(item)
+            return item
+
+        threads = [
+            threading.Thread(
+                target=concurrency.run_bounded,
+                args=(operation, range(4)),
+                kwargs={"max_workers": 4, "host": f"{GHOST_URL}/ghost/api/admin/"},
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+
+
+class TestBulkPostOperations:
+    """batch_update_posts / batch_delete_posts"""
+
+    def test_batch_delete_collects_results(self):
+        def fake_delete(post_id, **kwargs):
+            assert kwargs["ghost_api_url"] == GHOST_URL
+            if post_id == "missing":
+                return {"success": False, "message": f"Post not found: {post_id}"}
+            return {"success": True, "post_id": post_id}
+
+        with patch.object(
+            post_management, "delete_ghost_post", side_effect=fake_delete
+        ):
+            result = post_management.batch_delete_posts(
+                ["a", "missing", "a", ""], ghost_api_url=GHOST_URL
+            )
+
+        assert list(result["posts"]) == ["a"]
+        assert result["failed"] == [
+            {"id": "missing", "error": "Post not found: missing"}
+        ]
+        assert result["total_requested"] == 2
+
+    def test_batch_update_passes_fields(self):
+        with patch.object(
+            post_management,
+            "update_ghost_post",
+            side_effect=lambda post_id, **kw: {"success": True, **kw},
+        ):
+            result = post_management.batch_update_posts(
+                ["a", "b"], status="draft", ghost_api_url=GHOST_URL
+            )
+
+        assert result["posts"]["b"]["status"] == "draft"
+        assert result["total_failed"] == 0
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Gemini client registry
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ghost_blog_smart import gemini_client, main_functions
+
+
+class TestGeminiClientRegistry:
+    """Per-key clients and per-(key, model) handles"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_registry(self):
+        gemini_client.clear_gemini_clients()
+        yield
+        gemini_client.clear_gemini_clients()
+
+    def test_handles_shared_per_key_and_model(self):
+        flash = gemini_client.get_gemini_model("gemini-2.5-flash", "key-a")
+        again = gemini_client.get_gemini_model("gemini-2.5-flash", "key-a")
+        pro = gemini_client.get_gemini_model("gemini-2.5-pro", "key-a")
+        other_tenant = gemini_client.get_gemini_model("gemini-2.5-flash", "key-b")
+
+        assert flash is again
+        assert pro is not flash and pro.client is flash.client
+        assert other_tenant.client is not flash.client
+
+    def test_missing_key_raises(self, monkeypatch):
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            gemini_client.get_gemini_client()
+
+    def test_chat_simple_uses_registry(self):
+        handle = gemini_client.get_gemini_model("gemini-2.5-flash", "key-a")
+        with patch.object(
+            handle, "generate_text", return_value="formatted"
+        ) as generate:
+            text = main_functions.gemini_chat_simple(
+                "hello", "system", model="gemini-2.5-flash", api_key="key-a"
+            )
+
+        assert text == "formatted"
+        generate.assert_called_once_with("system\n\nUser:\n\nhello")
+
+    def test_warm_up_reports_failures(self):
+        client = gemini_client.get_gemini_client("key-a")
+        with patch.object(
+            client.models, "get", side_effect=[None, RuntimeError("bad key")]
+        ):
+            status = gemini_client.warm_up_gemini(
+                ["gemini-2.5-flash", "gemini-2.5-pro"], api_key="key-a"
+            )
+
+        assert status == {"gemini-2.5-flash": True, "gemini-2.5-pro": False}
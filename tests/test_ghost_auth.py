@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached Ghost admin JWT signer
+"""
+
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from ghost_blog_smart import ghost_auth, generate_ghost_headers
+
+ADMIN_KEY = "68aaca1251d63700017fb41c:" + "ab" * 32
+
+
+class TestGhostAuth:
+    """Token caching, refresh and validation"""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        ghost_auth.clear_ghost_token_cache()
+        yield
+        ghost_auth.clear_ghost_token_cache()
+
+    def test_token_is_valid_ghost_jwt(self):
+        token = ghost_auth.get_ghost_token(ADMIN_KEY)
+
+        claims = jwt.decode(
+            token, bytes.fromhex("ab" * 32), algorithms=["HS256"], audience="/admin/"
+        )
+        assert claims["exp"] - claims["iat"] == ghost_auth.TOKEN_LIFETIME
+        assert jwt.get_unverified_header(token)["kid"] == "68aaca1251d63700017fb41c"
+
+    def test_token_reused_until_near_expiry(self):
+        with patch("ghost_blog_smart.ghost_auth.time.time", return_value=1000):
+            first = ghost_auth.get_ghost_token(ADMIN_KEY)
+
+        still_valid = 1000 + ghost_auth.TOKEN_LIFETIME - ghost_auth.TOKEN_REFRESH_MARGIN
+        with patch(
+            "ghost_blog_smart.ghost_auth.time.time", return_value=still_valid - 1
+        ):
+            assert ghost_auth.get_ghost_token(ADMIN_KEY) == first
+
+        with patch("ghost_blog_smart.ghost_auth.time.time", return_value=still_valid):
+            assert ghost_auth.get_ghost_token(ADMIN_KEY) != first
+
+    def test_invalid_key_rejected(self):
+        with pytest.raises(ValueError):
+            ghost_auth.get_ghost_token("not-a-ghost-key")
+        assert generate_ghost_headers("not-a-ghost-key") is None
+
+    def test_headers_use_cached_token(self):
+        headers = generate_ghost_headers(ADMIN_KEY)
+        assert headers["Authorization"] == (
+            f"Ghost {ghost_auth.get_ghost_token(ADMIN_KEY)}"
+        )
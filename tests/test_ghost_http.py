@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Ghost Admin API transport
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ghost_blog_smart import ghost_http
+
+
+class TestGhostHttp:
+    """Session pooling and default request options"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_sessions(self):
+        ghost_http.close_ghost_sessions()
+        yield
+        ghost_http.close_ghost_sessions()
+
+    def test_session_shared_per_site(self):
+        first = ghost_http.get_ghost_session(
+            "https://blog.example.com/ghost/api/admin/posts/"
+        )
+        second = ghost_http.get_ghost_session(
+            "https://BLOG.example.com/ghost/api/admin/images/upload/"
+        )
+        other = ghost_http.get_ghost_session(
+            "https://other.example.com/ghost/api/admin/posts/"
+        )
+
+        assert first is second
+        assert first is not other
+
+    def test_configure_pool_size_rebuilds_sessions(self):
+        original = ghost_http._http_config.copy()
+        try:
+            before = ghost_http.get_ghost_session("https://blog.example.com")
+            config = ghost_http.configure_ghost_http(pool_maxsize=5)
+            after = ghost_http.get_ghost_session("https://blog.example.com")
+
+            assert config["pool_maxsize"] == 5
+            assert before is not after
+            assert after.get_adapter("https://blog.example.com")._pool_maxsize == 5
+        finally:
+            ghost_http._http_config.update(original)
+
+    def test_request_applies_default_timeout(self):
+        url = "https://blog.example.com/ghost/api/admin/posts/"
+        session = ghost_http.get_ghost_session(url)
+
+        with patch.object(session, "request") as mock_request:
+            ghost_http.ghost_request("GET", url, params={"limit": 1})
+            ghost_http.ghost_request("GET", url, timeout=5)
+
+        assert mock_request.call_args_list[0].kwargs["timeout"] == (
+            ghost_http._http_config["timeout"]
+        )
+        assert mock_request.call_args_list[1].kwargs["timeout"] == 5
+
+
+def make_response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    return response
+
+
+class TestGhostRetries:
+    """Jittered backoff for transient failures"""
+
+    URL = "https://blog.example.com/ghost/api/admin/posts/"
+
+    @pytest.fixture(autouse=True)
+    def fresh_sessions(self):
+        ghost_http.close_ghost_sessions()
+        with patch.object(ghost_http.time, "sleep") as sleep:
+            self.sleep = sleep
+            yield
+        ghost_http.close_ghost_sessions()
+
+    def test_idempotent_request_retried_on_5xx(self):
+        session = ghost_http.get_ghost_session(self.URL)
+        responses = [make_response(502), make_response(503), make_response(200)]
+
+        with patch.object(session, "request", side_effect=responses) as mock_request:
+            response = ghost_http.ghost_request("GET", self.URL)
+
+        assert response.status_code == 200
+        assert mock_request.call_count == 3
+        assert self.sleep.call_count == 2
+
+    def test_post_not_retried_by_default(self):
+        session = ghost_http.get_ghost_session(self.URL)
+
+        with patch.object(
+            session, "request", return_value=make_response(502)
+        ) as mock_request:
+            response = ghost_http.ghost_request("POST", self.URL)
+            ghost_http.ghost_request("POST", self.URL, idempotent=True)
+
+        assert response.status_code == 502
+        assert mock_request.call_count == 1 + 1 + ghost_http._http_config["retries"]
+
+    def test_network_error_raised_after_retries(self):
+        session = ghost_http.get_ghost_session(self.URL)
+
+        with patch.object(
+            session, "request", side_effect=requests.ConnectionError("reset")
+        ) as mock_request:
+            with pytest.raises(requests.ConnectionError):
+                ghost_http.ghost_request("DELETE", self.URL)
+
+        assert mock_request.call_count == ghost_http._http_config["retries"] + 1
+
+    def test_backoff_delay_is_bounded(self):
+        for attempt in range(10):
+            delay = ghost_http.retry_delay(attempt)
+            assert 0 <= delay <= ghost_http._http_config["backoff_max"]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive per-site Ghost rate limiter
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghost_blog_smart import ghost_http, ghost_ratelimit
+
+URL = "https://blog.example.com/ghost/api/admin/posts/"
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestGhostRateLimit:
+    """Token bucket pacing, Retry-After handling and rate adaptation"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_limiter(self):
+        original = dict(ghost_ratelimit._rate_config)
+        ghost_ratelimit._buckets.clear()
+        ghost_http.close_ghost_sessions()
+        yield
+        ghost_ratelimit._rate_config.update(original)
+        ghost_ratelimit._buckets.clear()
+        ghost_http.close_ghost_sessions()
+
+    def test_parse_retry_after(self):
+        assert ghost_ratelimit.parse_retry_after("2") == 2.0
+        assert ghost_ratelimit.parse_retry_after("100000") == (
+            ghost_ratelimit._rate_config["max_wait"]
+        )
+        assert ghost_ratelimit.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert ghost_ratelimit.parse_retry_after(None) is None
+        assert ghost_ratelimit.parse_retry_after("soon") is None
+
+    def test_throttled_request_waits_and_resends(self):
+        ghost_ratelimit.configure_ghost_rate_limit(rate=10, max_rate=10)
+        session = ghost_http.get_ghost_session(URL)
+        upload = io.BytesIO(b"image-bytes")
+        sent = []
+
+        def fake_request(method, url, **kwargs):
+            sent.append(kwargs["files"]["file"][1].read())
+            if len(sent) == 1:
+                return make_response(429, {"Retry-After": "0"})
+            return make_response(201)
+
+        with patch.object(session, "request", side_effect=fake_request):
+            response = ghost_http.ghost_request(
+                "POST", URL, files={"file": ("a.png", upload, "image/png")}
+            )
+
+        assert response.status_code == 201
+        assert sent == [b"image-bytes", b"image-bytes"]
+        # Halved by the 429, then nudged up by the success
+        bucket = ghost_ratelimit.get_rate_limiter(ghost_http._site_key(URL))
+        assert bucket.rate == 5.5
+
+    def test_gives_up_after_throttle_retries(self):
+        ghost_ratelimit.configure_ghost_rate_limit(rate=100, throttle_retries=2)
+        session = ghost_http.get_ghost_session(URL)
+
+        with patch.object(
+            session,
+            "request",
+            return_value=make_response(429, {"Retry-After": "0"}),
+        ) as mock_request:
+            response = ghost_http.ghost_request("GET", URL)
+
+        assert response.status_code == 429
+        assert mock_request.call_count == 3
+
+    def test_throttled_503_not_retried_again_as_5xx(self):
+        ghost_ratelimit.configure_ghost_rate_limit(rate=100, throttle_retries=2)
+        session = ghost_http.get_ghost_session(URL)
+
+        with patch.object(
+            session,
+            "request",
+            return_value=make_response(503, {"Retry-After": "0"}),
+        ) as mock_request, patch.object(
+            ghost_http, "retry_delay", return_value=0
+        ) as backoff:
+            response = ghost_http.ghost_request("GET", URL)
+
+        assert response.status_code == 503
+        # One throttle cycle only; the 5xx backoff loop does not start another
+        assert mock_request.call_count == 3
+        backoff.assert_not_called()
+
+    def test_rate_stays_within_bounds(self):
+        bucket = ghost_ratelimit.TokenBucket(rate=4, burst=1, min_rate=1, max_rate=5)
+        for _ in range(5):
+            bucket.penalize(retry_after=0)
+        assert bucket.rate == 1
+        for _ in range(20):
+            bucket.reward()
+        assert bucket.rate == 5
+
+    def test_disabled_when_rate_is_zero(self):
+        ghost_ratelimit.configure_ghost_rate_limit(rate=0)
+        assert ghost_ratelimit.get_rate_limiter("https://blog.example.com") is None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed image upload cache
+"""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghost_blog_smart import image_cache, main_functions
+
+GHOST_URL = "https://blog.example.com"
+HOSTED = f"{GHOST_URL}/content/images/2024/01/logo.png"
+
+
+def upload_response():
+    response = MagicMock()
+    response.status_code = 201
+    response.json.return_value = {"images": [{"url": HOSTED}]}
+    return response
+
+
+class TestImageUploadCache:
+    """Hash/URL keys map to Ghost URLs and skip repeat uploads"""
+
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path):
+        original = dict(image_cache._image_cache_config)
+        path = str(tmp_path / "images.sqlite3")
+        image_cache.configure_image_cache(enabled=True, path=path)
+        yield path
+        image_cache._image_cache_config.update(original)
+        image_cache.configure_image_cache()
+
+    def test_url_key_normalization(self):
+        assert image_cache.url_key("HTTPS://CDN.Example.com:443/a.png#x") == (
+            image_cache.url_key("https://cdn.example.com/a.png")
+        )
+        assert image_cache.url_key("https://cdn.example.com/a.png?v=1") != (
+            image_cache.url_key("https://cdn.example.com/a.png?v=2")
+        )
+
+    def test_same_bytes_uploaded_once(self, tmp_path):
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(b"\x89PNG brand")
+        data_uri = "data:image/png;base64," + base64.b64encode(b"\x89PNG brand").decode(
+            "ascii"
+        )
+
+        with patch.object(
+            main_functions, "ghost_request", return_value=upload_response()
+        ) as post:
+            first = main_functions.upload_image_to_ghost(
+                str(image_path), GHOST_URL, "token"
+            )
+            second = main_functions.upload_image_to_ghost(data_uri, GHOST_URL, "token")
+            other_site = main_functions.upload_image_to_ghost(
+                str(image_path), "https://other.example.com", "token"
+            )
+
+        assert first == second == other_site == HOSTED
+        assert post.call_count == 2  # once per site
+        assert image_cache.get_image_cache_stats()["hits"] == 1
+
+    def test_remote_url_skips_download(self):
+        relay = MagicMock(headers={}, digest=None)
+        with patch.object(
+            main_functions, "ImageRelay", return_value=relay
+        ) as download, patch.object(
+            main_functions, "ghost_request", return_value=upload_response()
+        ) as post:
+            for url in (
+                "https://cdn.example.com/a.png",
+                "HTTPS://cdn.example.com/a.png",
+            ):
+                assert (
+                    main_functions.upload_image_to_ghost(url, GHOST_URL, "t") == HOSTED
+                )
+
+        assert download.call_count == 1
+        assert post.call_count == 1
+
+    def test_failed_upload_not_cached(self, tmp_path):
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(b"\x89PNG")
+        failed = MagicMock(status_code=500, text="boom")
+
+        with patch.object(main_functions, "ghost_request", return_value=failed):
+            assert (
+                main_functions.upload_image_to_ghost(str(image_path), GHOST_URL, "t")
+                == ""
+            )
+
+        assert image_cache.get_image_cache_stats()["entries"] == 0
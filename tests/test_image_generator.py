@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared image generator registry
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from ghost_blog_smart import clean_imagen_generator, replicate_flux_generator
+from ghost_blog_smart.clean_imagen_generator import (
+    IMAGE_MODEL,
+    clear_image_generators,
+    get_image_generator,
+    image_header_info,
+)
+
+
+class TestImageGeneratorRegistry:
+    """One warm generator per (gemini key, replicate key, model)"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_registry(self, monkeypatch):
+        monkeypatch.delenv("REPLICATE_API_TOKEN", raising=False)
+        clear_image_generators()
+        yield
+        clear_image_generators()
+
+    def test_shared_per_key_combination(self):
+        generator = get_image_generator("key-a")
+        again = get_image_generator("key-a", model_name=IMAGE_MODEL)
+        other_model = get_image_generator("key-a", model_name="imagen-3.0")
+        other_tenant = get_image_generator("key-b")
+        with_flux = get_image_generator("key-a", replicate_api_key="r-1")
+
+        assert generator is again
+        assert other_model is not generator and other_model.client is generator.client
+        assert other_tenant is not generator
+        assert with_flux is not generator and with_flux.flux_generator is not None
+        assert generator.flux_generator is None
+
+    def test_concurrent_first_use_builds_once(self, monkeypatch):
+        built = []
+        original = clean_imagen_generator.CleanImagenGenerator.__init__
+
+        def counting_init(self, *args, **kwargs):
+            built.append(1)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(
+            clean_imagen_generator.CleanImagenGenerator, "__init__", counting_init
+        )
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            generators = list(
+                pool.map(lambda _: get_image_generator("key-a"), range(16))
+            )
+
+        assert len(built) == 1
+        assert all(generator is generators[0] for generator in generators)
+
+    def test_missing_key_raises(self, monkeypatch):
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            get_image_generator()
+
+
+class TestImagenFastPath:
+    """Generated bytes are written as returned, without a decode/re-encode"""
+
+    def _png(self, size=(64, 36)):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (10, 20, 30)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def test_bytes_written_unchanged(self, tmp_path):
+        png = self._png()
+        response = SimpleNamespace(
+            generated_images=[SimpleNamespace(image=SimpleNamespace(image_bytes=png))]
+        )
+        generator = clean_imagen_generator.CleanImagenGenerator(api_key="key-a")
+        with patch.object(
+            generator.client.models, "generate_images", return_value=response
+        ), patch.object(Image.Image, "load") as load:
+            result = generator.generate_image(
+                "A lighthouse", optimize_prompt=False, output_directory=str(tmp_path)
+            )
+
+        assert result["success"] is True
+        image = result["results"][0]
+        assert (image["width"], image["height"]) == (64, 36)
+        assert image["filename"].endswith(".png")
+        assert open(image["filepath"], "rb").read() == png
+        assert os.path.exists(image["filepath"][: -len(".png")] + "_metadata.json")
+        load.assert_not_called()
+
+    def test_same_second_generations_get_distinct_files(self, tmp_path):
+        response = SimpleNamespace(
+            generated_images=[
+                SimpleNamespace(image=SimpleNamespace(image_bytes=self._png()))
+            ]
+        )
+        generator = clean_imagen_generator.CleanImagenGenerator(api_key="key-a")
+        with patch.object(
+            generator.client.models, "generate_images", return_value=response
+        ):
+            paths = [
+                generator.generate_image(
+                    "A lighthouse",
+                    optimize_prompt=False,
+                    output_directory=str(tmp_path),
+                )["results"][0]["filepath"]
+                for _ in range(2)
+            ]
+
+        assert paths[0] != paths[1]
+        assert all(os.path.exists(path) for path in paths)
+
+    def test_header_info_uses_real_format(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (10, 5)).save(buffer, format="JPEG")
+
+        assert image_header_info(buffer.getvalue()) == (10, 5, ".jpg", "image/jpeg")
+
+    def test_in_memory_results_skip_disk(self, tmp_path):
+        png = self._png()
+        response = SimpleNamespace(
+            generated_images=[SimpleNamespace(image=SimpleNamespace(image_bytes=png))]
+        )
+        output_dir = tmp_path / "generated"
+        generator = clean_imagen_generator.CleanImagenGenerator(api_key="key-a")
+        with patch.object(
+            generator.client.models, "generate_images", return_value=response
+        ):
+            result = generator.generate_image(
+                "A lighthouse",
+                optimize_prompt=False,
+                output_directory=str(output_dir),
+                save_to_disk=False,
+            )
+
+        image = result["results"][0]
+        assert image["filepath"] is None
+        assert image["image_bytes"] == png and image["mime_type"] == "image/png"
+        assert not output_dir.exists()
+
+
+class TestFluxBatching:
+    """Variants come from one prediction and are downloaded concurrently"""
+
+    def test_one_prediction_parallel_downloads(self, tmp_path):
+        generator = replicate_flux_generator.ReplicateFluxGenerator(api_key="r-1")
+        generator.replicate = MagicMock()
+        urls = [f"https://replicate.delivery/out-{i}.webp" for i in range(4)]
+        generator.replicate.run.return_value = urls
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 18)).save(buffer, format="WEBP")
+
+        def slow_get(url, timeout):
+            time.sleep(0.2)
+            return MagicMock(content=buffer.getvalue())
+
+        started = time.perf_counter()
+        with patch.object(
+            replicate_flux_generator.requests, "get", side_effect=slow_get
+        ):
+            result = generator.generate_image(
+                "A lighthouse", number_of_images=4, output_directory=str(tmp_path)
+            )
+        elapsed = time.perf_counter() - started
+
+        assert result["success"] is True and result["total_images"] == 4
+        generator.replicate.run.assert_called_once()
+        assert generator.replicate.run.call_args.kwargs["input"]["num_outputs"] == 4
+        assert elapsed < 0.6
+        assert [image["url"] for image in result["results"]] == urls
+        filenames = [image["filename"] for image in result["results"]]
+        assert len(set(filenames)) == 4 and filenames[0].endswith("_001.webp")
+        assert all(os.path.exists(image["filepath"]) for image in result["results"])
+
+    def test_relative_output_directory_gives_absolute_paths(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        generator = replicate_flux_generator.ReplicateFluxGenerator(api_key="r-1")
+        generator.replicate = MagicMock()
+        generator.replicate.run.return_value = ["https://replicate.delivery/out.webp"]
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 18)).save(buffer, format="WEBP")
+
+        with patch.object(
+            replicate_flux_generator.requests,
+            "get",
+            return_value=MagicMock(content=buffer.getvalue()),
+        ):
+            result = generator.generate_image("A lighthouse", output_directory="out")
+
+        filepath = result["results"][0]["filepath"]
+        assert os.path.isabs(filepath)
+        assert filepath.startswith(str(tmp_path / "out"))
+
+    @pytest.mark.parametrize("count", [0, 5])
+    def test_out_of_range_count_rejected(self, count):
+        generator = replicate_flux_generator.ReplicateFluxGenerator(api_key="r-1")
+        generator.replicate = MagicMock()
+
+        result = generator.generate_image("A lighthouse", number_of_images=count)
+
+        assert result["success"] is False
+        assert "1-4" in result["error"]
+        generator.replicate.run.assert_not_called()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-upload image optimizer
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from ghost_blog_smart import image_optimizer, main_functions
+
+GHOST_URL = "https://blog.example.com"
+
+
+def make_png(width=1200, height=600, mode="RGB", exif=False):
+    image = Image.new(mode, (width, height), "red")
+    output = io.BytesIO()
+    if exif:
+        metadata = Image.Exif()
+        metadata[0x010F] = "CameraMaker"
+        image.save(output, format="JPEG", exif=metadata.tobytes())
+    else:
+        image.save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestOptimizeImageBytes:
+    """Resize, re-encode and metadata stripping"""
+
+    def test_downscale_to_webp(self):
+        data, mime_type, extension = image_optimizer.optimize_image_bytes(
+            make_png(), 400, "webp", 80
+        )
+
+        image = Image.open(io.BytesIO(data))
+        assert (mime_type, extension, image.format) == ("image/webp", ".webp", "WEBP")
+        assert image.size == (400, 200)
+
+    def test_exif_stripped_and_alpha_flattened_for_jpeg(self):
+        data, mime_type, _ = image_optimizer.optimize_image_bytes(
+            make_png(800, 400, exif=True), 400, "jpeg", 80
+        )
+        assert mime_type == "image/jpeg"
+        assert not Image.open(io.BytesIO(data)).getexif()
+
+        transparent, _, _ = image_optimizer.optimize_image_bytes(
+            make_png(800, 400, mode="RGBA"), 400, "jpeg", 80
+        )
+        assert Image.open(io.BytesIO(transparent)).mode == "RGB"
+
+    def test_original_kept_when_not_smaller_or_unreadable(self):
+        tiny = make_png(4, 4)
+        assert image_optimizer.optimize_image_bytes(tiny, 400, "webp", 100) is None
+        assert (
+            image_optimizer.optimize_image_bytes(b"not an image", 400, "webp", 80)
+            is None
+        )
+
+
+class TestOptimizedUpload:
+    """upload_image_to_ghost sends the optimized bytes when enabled"""
+
+    @pytest.fixture(autouse=True)
+    def optimizer(self):
+        original = dict(image_optimizer._optimizer_config)
+        yield image_optimizer.configure_image_optimizer(
+            enabled=True, max_width=300, output_format="webp", workers=1
+        )
+        image_optimizer.configure_image_optimizer(workers=original["workers"])
+        image_optimizer._optimizer_config.update(original)
+
+    def test_upload_in_process_pool(self, tmp_path):
+        image_path = tmp_path / "generated.png"
+        image_path.write_bytes(make_png())
+        response = MagicMock(status_code=201)
+        response.json.return_value = {"images": [{"url": f"{GHOST_URL}/i.webp"}]}
+
+        with patch.object(
+            main_functions, "ghost_request", return_value=response
+        ) as post:
+            main_functions.upload_image_to_ghost(str(image_path), GHOST_URL, "token")
+
+        filename, data, mime_type = post.call_args.kwargs["files"]["file"]
+        assert (filename, mime_type) == ("generated.webp", "image/webp")
+        assert Image.open(io.BytesIO(data)).size == (300, 150)
+
+    def test_invalid_format_rejected(self):
+        with pytest.raises(ValueError):
+            image_optimizer.configure_image_optimizer(output_format="gif")
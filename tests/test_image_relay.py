@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming remote images into Ghost uploads
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ghost_blog_smart import image_relay, main_functions
+
+GHOST_URL = "https://blog.example.com"
+HOSTED = f"{GHOST_URL}/content/images/2024/01/photo.png"
+
+
+class FakeDownload:
+    """Streaming response yielding the image in small chunks"""
+
+    def __init__(self, body, headers=None, status_code=200):
+        self.body = body
+        self.headers = headers if headers is not None else {}
+        self.status_code = status_code
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), 4):
+            yield self.body[start : start + 4]
+
+    def close(self):
+        self.closed = True
+
+
+def downloads(body, headers=None, status_code=200):
+    return lambda *args, **kwargs: FakeDownload(body, headers, status_code)
+
+
+class TestImageRelay:
+    """Multipart framing, content type, size limits and re-iteration"""
+
+    def test_body_streams_real_content_type(self):
+        body = b"\x89PNG" + b"x" * 20
+        with patch.object(
+            image_relay.requests,
+            "get",
+            side_effect=downloads(
+                body, {"Content-Type": "image/png", "Content-Length": str(len(body))}
+            ),
+        ) as get:
+            relay = image_relay.ImageRelay("https://cdn.example.com/a/photo")
+            first = b"".join(relay)
+            second = b"".join(relay)  # a retry downloads again
+
+        assert first == second
+        assert get.call_count == 2
+        assert get.call_args.kwargs["stream"] is True
+        assert relay.len == len(first)
+        assert relay.headers["Content-Type"].endswith(relay.boundary)
+        assert b'filename="photo.png"' in first
+        assert b"Content-Type: image/png\r\n\r\n" + body + b"\r\n--" in first
+        assert relay.digest is not None
+
+    def test_declared_size_over_limit(self):
+        with patch.object(
+            image_relay.requests,
+            "get",
+            side_effect=downloads(b"", {"Content-Length": "999"}),
+        ):
+            with pytest.raises(image_relay.ImageRelayError):
+                image_relay.ImageRelay("https://cdn.example.com/a.jpg", max_bytes=10)
+
+    def test_streamed_size_over_limit(self):
+        with patch.object(
+            image_relay.requests, "get", side_effect=downloads(b"y" * 40)
+        ):
+            relay = image_relay.ImageRelay(
+                "https://cdn.example.com/a.jpg", max_bytes=10
+            )
+            assert relay.len is None  # unknown size: chunked upload
+            with pytest.raises(image_relay.ImageRelayError):
+                b"".join(relay)
+
+    def test_non_image_rejected(self):
+        with patch.object(
+            image_relay.requests,
+            "get",
+            side_effect=downloads(b"<html>", {"Content-Type": "text/html"}),
+        ):
+            with pytest.raises(image_relay.ImageRelayError):
+                image_relay.ImageRelay("https://cdn.example.com/page")
+
+    def test_upload_uses_relay(self):
+        sent = []
+
+        def fake_request(method, url, **kwargs):
+            sent.append((kwargs["headers"], b"".join(kwargs["data"])))
+            response = MagicMock(status_code=201)
+            response.json.return_value = {"images": [{"url": HOSTED}]}
+            return response
+
+        with patch.object(
+            image_relay.requests,
+            "get",
+            side_effect=downloads(b"\x89PNG", {"Content-Type": "image/png"}),
+        ), patch.object(main_functions, "ghost_request", side_effect=fake_request):
+            result = main_functions.upload_image_to_ghost(
+                "https://cdn.example.com/photo.png", GHOST_URL, "token"
+            )
+
+        assert result == HOSTED
+        headers, body = sent[0]
+        assert headers["Authorization"] == "Ghost token"
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert b"Content-Type: image/png" in body and b"\x89PNG" in body
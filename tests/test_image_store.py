@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the budgeted generated image store
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from ghost_blog_smart import main_functions
+from ghost_blog_smart.image_store import ImageStore
+
+
+def write_image(directory, name, size, metadata=False):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    if metadata:
+        with open(os.path.splitext(path)[0] + "_metadata.json", "w") as f:
+            f.write("{}")
+    return path
+
+
+class TestImageStore:
+    """Index, budget and eviction order"""
+
+    def make_store(self, tmp_path, **kwargs):
+        settings = {
+            "max_bytes": 10_000,
+            "max_files": 100,
+            "grace": 0,
+            "sweep_interval": 0,
+        }
+        settings.update(kwargs)
+        directory = tmp_path / "generated_images"
+        directory.mkdir(exist_ok=True)
+        return ImageStore(
+            str(directory),
+            str(tmp_path / "index.sqlite3"),
+            **settings,
+        )
+
+    def test_uploaded_images_evicted_first(self, tmp_path):
+        store = self.make_store(tmp_path, max_files=2)
+        paths = [
+            write_image(store.directory, f"img{i}.png", 100, metadata=True)
+            for i in range(3)
+        ]
+        for path in paths:
+            store.add(path)
+        # The newest image is the only one on Ghost, yet goes before older ones
+        store.mark_uploaded(paths[2], "https://blog.example.com/content/images/2.png")
+
+        assert store.evict() == 1
+        assert not os.path.exists(paths[2])
+        assert not os.path.exists(paths[2][: -len(".png")] + "_metadata.json")
+        assert [entry["path"] for entry in store.entries()] == [paths[1], paths[0]]
+
+    def test_byte_budget_evicts_least_recently_used(self, tmp_path):
+        store = self.make_store(tmp_path, max_bytes=250)
+        old, new = (
+            write_image(store.directory, name, 100, metadata=True)
+            for name in ("old.png", "new.png")
+        )
+        store.add(old)
+        store.add(new)
+
+        stats = store.stats()
+        assert stats["files"] == 2 and stats["bytes"] == 204
+
+        store.add(write_image(store.directory, "newest.png", 100))
+        store.evict()
+
+        assert not os.path.exists(old) and os.path.exists(new)
+        assert store.stats()["bytes"] <= 250
+
+    def test_grace_period_protects_pending_uploads(self, tmp_path):
+        store = self.make_store(tmp_path, max_files=0, grace=600)
+        path = write_image(store.directory, "pending.png", 10)
+        store.add(path)
+
+        assert store.evict() == 0
+        assert os.path.exists(path)
+
+    def test_max_age_and_missing_files(self, tmp_path):
+        store = self.make_store(tmp_path, max_age=60)
+        stale = write_image(store.directory, "stale.png", 10)
+        gone = write_image(store.directory, "gone.png", 10)
+        store.add(stale)
+        store.add(gone)
+        os.remove(gone)
+        store._conn.execute(
+            "UPDATE images SET created_at = ? WHERE path = ?",
+            (time.time() - 120, stale),
+        )
+
+        assert store.evict() == 2
+        assert store.entries() == []
+
+    def test_existing_files_adopted(self, tmp_path):
+        directory = tmp_path / "generated_images"
+        directory.mkdir()
+        write_image(str(directory), "blog_feature_legacy.png", 50, metadata=True)
+        store = self.make_store(tmp_path)
+
+        entries = store.entries()
+        assert len(entries) == 1
+        assert entries[0]["bytes"] == 52
+        assert entries[0]["metadata_path"].endswith("legacy_metadata.json")
+
+    def test_foreign_files_never_evicted(self, tmp_path):
+        directory = tmp_path / "generated_images"
+        directory.mkdir()
+        foreign = [
+            write_image(str(directory), name, 50)
+            for name in ("notes.txt", "logo.png", "flux_readme.md")
+        ]
+        generated = write_image(str(directory), "flux_20240101_16x9.webp", 50)
+        store = self.make_store(tmp_path, max_files=0)
+
+        assert [entry["path"] for entry in store.entries()] == [generated]
+        assert store.evict() == 1
+        assert not os.path.exists(generated)
+        assert all(os.path.exists(path) for path in foreign)
+
+    def test_over_budget_add_wakes_sweeper(self, tmp_path):
+        store = self.make_store(tmp_path, max_files=1, sweep_interval=3600)
+        first = write_image(store.directory, "a.png", 10)
+        store.add(first)
+        store.mark_uploaded(first, "https://blog.example.com/content/images/a.png")
+        store.add(write_image(store.directory, "b.png", 10))
+
+        deadline = time.time() + 5
+        while os.path.exists(first) and time.time() < deadline:
+            time.sleep(0.05)
+        store.close()
+
+        assert not os.path.exists(first)
+
+    def test_upload_marks_local_file(self, tmp_path):
+        store = self.make_store(tmp_path)
+        path = write_image(store.directory, "feature.png", 10)
+        store.add(path)
+        hosted = "https://blog.example.com/content/images/feature.png"
+        response = MagicMock(status_code=201)
+        response.json.return_value = {"images": [{"url": hosted}]}
+
+        with patch.object(
+            main_functions, "get_image_store", return_value=store
+        ), patch.object(main_functions, "ghost_request", return_value=response):
+            main_functions.upload_image_to_ghost(
+                path, "https://blog.example.com", "token"
+            )
+
+        assert store.entries()[0]["ghost_url"] == hosted
+        assert store.stats()["uploaded"] == 1
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed background job queue
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from ghost_blog_smart import job_queue
+
+
+def wait_for(queue, job_id, status, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {status}")
+
+
+class TestJobQueue:
+    """Job lifecycle, redaction and orphan recovery"""
+
+    @pytest.fixture(autouse=True)
+    def db_path(self, tmp_path):
+        original = dict(job_queue._job_config)
+        path = str(tmp_path / "jobs.sqlite3")
+        job_queue.configure_job_queue(path=path, workers=2, stale_after=60)
+        yield path
+        job_queue._job_config.update(original)
+        job_queue.configure_job_queue()
+
+    def test_success_and_failure(self):
+        queue = job_queue.get_job_queue()
+        ok = queue.submit("create_post", lambda: {"success": True, "post_id": "p1"})
+        bad = queue.submit("create_post", lambda: {"success": False, "message": "nope"})
+
+        assert wait_for(queue, ok, "succeeded")["result"]["post_id"] == "p1"
+        failed = wait_for(queue, bad, "failed")
+        assert failed["error"] == "nope"
+        assert queue.get("missing") is None
+
+    def test_credentials_never_stored(self, db_path):
+        queue = job_queue.get_job_queue()
+        job_id = queue.submit(
+            "smart_create",
+            lambda: {"success": True},
+            params={
+                "user_input": "Draft",
+                "gemini_api_key": "g-secret",
+                "ghost_admin_api_key": "id:secret",
+                "replicate_api_key": "r-secret",
+            },
+        )
+        wait_for(queue, job_id, "succeeded")
+
+        assert queue.get(job_id)["params"] == {"user_input": "Draft"}
+        with sqlite3.connect(db_path) as conn:
+            dump = "\n".join(conn.iterdump())
+        assert "secret" not in dump
+
+    def test_results_survive_restart_and_orphans_fail(self, db_path):
+        queue = job_queue.get_job_queue()
+        release = threading.Event()
+        done = queue.submit("create_post", lambda: {"success": True})
+        stuck = queue.submit("create_post", lambda: release.wait(5) and None)
+        wait_for(queue, done, "succeeded")
+        wait_for(queue, stuck, "running")
+
+        # Simulate a crash: the job's heartbeat goes stale, a new process starts
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE jobs SET heartbeat_at = 0 WHERE id = ?", (stuck,))
+        restarted = job_queue.JobQueue(db_path, 1, 3600, 60)
+
+        assert restarted.get(done)["status"] == "succeeded"
+        orphan = restarted.get(stuck)
+        assert orphan["status"] == "failed"
+        assert "Interrupted" in orphan["error"]
+        release.set()
+        restarted.close()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed LLM response cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from ghost_blog_smart import gemini_client, llm_cache, main_functions
+
+
+class TestLLMCache:
+    """Content-hash keys, TTL, LRU eviction and counters"""
+
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path):
+        original = dict(llm_cache._cache_config)
+        path = str(tmp_path / "llm.sqlite3")
+        llm_cache.configure_llm_cache(enabled=True, path=path, ttl=60, max_entries=2)
+        yield path
+        llm_cache._cache_config.update(original)
+        llm_cache.configure_llm_cache()
+
+    def test_key_depends_on_every_input(self):
+        base = llm_cache.make_cache_key("m", "sys", "hi", {"a": 1, "b": 2})
+
+        assert base == llm_cache.make_cache_key("m", "sys", "hi", {"b": 2, "a": 1})
+        assert base != llm_cache.make_cache_key("m2", "sys", "hi", {"a": 1, "b": 2})
+        assert base != llm_cache.make_cache_key("m", "sys2", "hi", {"a": 1, "b": 2})
+        assert base != llm_cache.make_cache_key("m", "sys", "hi!", {"a": 1, "b": 2})
+        assert base != llm_cache.make_cache_key("m", "sys", "hi", {"a": 1})
+
+    def test_hits_misses_and_ttl(self):
+        cache = llm_cache.get_llm_cache()
+        cache.set("k", {"title": "cached"})
+
+        assert cache.get("k") == {"title": "cached"}
+        with patch.object(llm_cache.time, "time", return_value=10**12):
+            assert cache.get("k") is None
+        assert cache.get("missing") is None
+
+        stats = llm_cache.get_llm_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 0)
+
+    def test_lru_eviction(self):
+        cache = llm_cache.get_llm_cache()
+        with patch.object(llm_cache.time, "time", side_effect=range(100, 107)):
+            cache.set("a", "A")
+            cache.set("b", "B")
+            cache.get("a")  # a is now more recently used than b
+            cache.set("c", "C")
+
+            assert cache.get("a") == "A"
+            assert cache.get("b") is None
+            assert cache.get("c") == "C"
+
+    def test_disabled_cache(self):
+        llm_cache.configure_llm_cache(enabled=False)
+        assert llm_cache.get_llm_cache() is None
+        assert llm_cache.get_llm_cache_stats()["enabled"] is False
+
+    def test_unwritable_path_degrades_to_misses(self, tmp_path):
+        # GHOST_LLM_CACHE_PATH pointing below a regular file can never be created
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        llm_cache.configure_llm_cache(path=str(blocker / "llm.sqlite3"))
+        cache = llm_cache.get_llm_cache()
+
+        cache.set("k", "V")
+        assert cache.get("k") is None
+        assert cache.misses == 1
+
+        handle = gemini_client.get_gemini_model("gemini-2.5-flash", "key-a")
+        with patch.object(handle, "generate_text", return_value="formatted") as call:
+            result = main_functions.gemini_chat_simple(
+                "draft", "sys", model="gemini-2.5-flash", api_key="key-a"
+            )
+
+        assert result == "formatted"
+        call.assert_called_once()
+
+    def test_chat_simple_served_from_cache(self):
+        handle = gemini_client.get_gemini_model("gemini-2.5-flash", "key-a")
+        with patch.object(handle, "generate_text", return_value="formatted") as call:
+            first = main_functions.gemini_chat_simple(
+                "draft", "sys", model="gemini-2.5-flash", api_key="key-a"
+            )
+            second = main_functions.gemini_chat_simple(
+                "draft", "sys", model="gemini-2.5-flash", api_key="key-a"
+            )
+            main_functions.gemini_chat_simple(
+                "draft",
+                "sys",
+                model="gemini-2.5-flash",
+                api_key="key-a",
+                use_cache=False,
+            )
+
+        assert first == second == "formatted"
+        assert call.call_count == 2
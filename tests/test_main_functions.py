@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Tests for post creation and update in main_functions
+"""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from PIL import Image
+
+from ghost_blog_smart import main_functions
+
+ADMIN_KEY = "68aaca1251d63700017fb41c:" + "ab" * 32
+GHOST_URL = "https://blog.example.com"
+
+
+def make_response(status_code=200, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    response.text = ""
+    return response
+
+
+class TestIdempotentCreate:
+    """general_ghost_post must not create duplicates when retrying"""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch.object(main_functions.time, "sleep"):
+            yield
+
+    def create(self):
+        return main_functions.general_ghost_post(
+            title="Hello",
+            content="Body",
+            youtube_video_id="abc123",
+            ghost_admin_api_key=ADMIN_KEY,
+            ghost_api_url=GHOST_URL,
+        )
+
+    def test_lost_response_recovered_by_slug(self):
+        existing = {"id": "p1", "title": "Hello", "url": f"{GHOST_URL}/abc123/"}
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append((method, url))
+            if method == "POST":
+                raise requests.ConnectionError("connection reset")
+            return make_response(200, {"posts": [existing]})
+
+        with patch.object(main_functions, "ghost_request", side_effect=fake_request):
+            result = self.create()
+
+        assert result["success"] is True
+        assert result["post_id"] == "p1"
+        assert calls == [
+            ("POST", f"{GHOST_URL}/ghost/api/admin/posts/?source=html"),
+            ("GET", f"{GHOST_URL}/ghost/api/admin/posts/slug/abc123/"),
+        ]
+
+    def test_reposts_when_slug_not_found(self):
+        created = {"id": "p2", "url": f"{GHOST_URL}/abc123/"}
+        responses = [
+            make_response(502),
+            make_response(404),
+            make_response(201, {"posts": [created]}),
+        ]
+
+        with patch.object(
+            main_functions, "ghost_request", side_effect=responses
+        ) as mock_request:
+            result = self.create()
+
+        assert result["success"] is True
+        assert result["post_id"] == "p2"
+        assert [c.args[0] for c in mock_request.call_args_list] == [
+            "POST",
+            "GET",
+            "POST",
+        ]
+
+    def test_client_error_not_retried(self):
+        with patch.object(
+            main_functions, "ghost_request", return_value=make_response(422)
+        ) as mock_request:
+            result = self.create()
+
+        assert result["success"] is False
+        assert mock_request.call_count == 1
+
+
+class TestUpdateCollision:
+    """A 409 is only success when it was our own retried write"""
+
+    def _update(self, refreshed_post):
+        stale = {
+            "posts": [
+                {
+                    "id": "p1",
+                    "slug": "s",
+                    "status": "published",
+                    "title": "Old",
+                    "updated_at": "2024-01-01T00:00:00.000Z",
+                }
+            ]
+        }
+        puts = []
+
+        def fake_request(method, url, **kwargs):
+            if method == "GET":
+                if not puts:
+                    return make_response(200, stale)
+                return make_response(200, {"posts": [refreshed_post]})
+            puts.append(kwargs["json"])
+            return make_response(409)
+
+        with patch.object(main_functions, "ghost_request", side_effect=fake_request):
+            result = main_functions.update_ghost_post(
+                "p1",
+                status="draft",
+                title="New",
+                tags=["AI"],
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+        return result, puts
+
+    def test_own_retried_write_is_success(self):
+        result, puts = self._update(
+            {
+                "id": "p1",
+                "slug": "s",
+                "status": "draft",
+                "title": "New",
+                "tags": [{"id": "t1", "name": "AI", "slug": "ai"}],
+                "updated_at": "2024-01-02T00:00:00.000Z",
+            }
+        )
+
+        assert result["success"] is True
+        assert result["status"] == "draft"
+        assert len(puts) == 1
+
+    def test_concurrent_edit_returns_conflict(self):
+        result, puts = self._update(
+            {
+                "id": "p1",
+                "slug": "s",
+                "status": "published",
+                "title": "Edited by a colleague",
+                "tags": [],
+                "updated_at": "2024-01-02T00:00:00.000Z",
+            }
+        )
+
+        assert result["success"] is False
+        assert result["conflict"] is True
+        # The colleague's edit is not overwritten by a second PUT
+        assert len(puts) == 1
+
+    def test_image_update_retried_write_is_success(self):
+        hosted = "https://blog.example.com/content/images/feature.png"
+        stale = {"posts": [{"id": "p1", "updated_at": "2024-01-01T00:00:00.000Z"}]}
+        refreshed = {
+            "posts": [
+                {
+                    "id": "p1",
+                    "slug": "s",
+                    "feature_image": hosted,
+                    "updated_at": "2024-01-02T00:00:00.000Z",
+                }
+            ]
+        }
+        puts = []
+
+        def fake_request(method, url, **kwargs):
+            if method == "GET":
+                return make_response(200, refreshed if puts else stale)
+            puts.append(kwargs["json"])
+            return make_response(409)
+
+        with patch.object(
+            main_functions, "ghost_request", side_effect=fake_request
+        ), patch.object(main_functions, "upload_image_to_ghost", return_value=hosted):
+            result = main_functions.update_ghost_post_image(
+                "p1",
+                feature_image="https://example.com/feature.png",
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+
+        assert result["success"] is True
+        assert result["feature_image"] == hosted
+        assert len(puts) == 1
+
+
+class TestPipelineTimings:
+    """create_ghost_blog_post reports per-stage durations"""
+
+    def test_timings_returned(self):
+        result = main_functions.create_ghost_blog_post(
+            title="Hello", content="**Body**", auto_format=False, is_test=True
+        )
+
+        assert result["success"] is True
+        assert set(result["timings"]) == {"markdown_render", "total"}
+        assert result["timings"]["total"] >= result["timings"]["markdown_render"] >= 0
+
+    def test_progress_events(self):
+        events = []
+        main_functions.create_ghost_blog_post(
+            title="Hello",
+            content="Body",
+            auto_format=False,
+            is_test=True,
+            progress_callback=lambda event, data: events.append((event, data)),
+        )
+
+        assert [data["status"] for _, data in events] == ["started", "finished"]
+        assert events[1][1]["stage"] == "markdown_render"
+        assert events[1][1]["duration"] >= 0
+
+    def test_create_and_upload_timed(self):
+        created = {"id": "p1", "url": f"{GHOST_URL}/p1/"}
+        with patch.object(
+            main_functions,
+            "ghost_request",
+            return_value=make_response(201, {"posts": [created]}),
+        ):
+            result = main_functions.create_ghost_blog_post(
+                title="Hello",
+                content="Body",
+                auto_format=False,
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+
+        assert result["success"] is True
+        assert {"markdown_render", "post_create", "total"} <= set(result["timings"])
+
+
+class TestConcurrentPipeline:
+    """Image branch runs alongside text formatting and uploads only once"""
+
+    def test_branches_overlap_and_upload_once(self, tmp_path):
+        image_path = tmp_path / "feature.png"
+        image_path.write_bytes(b"\x89PNG")
+        hosted_url = f"{GHOST_URL}/content/images/2024/01/feature.png"
+        created = {"id": "p1", "url": f"{GHOST_URL}/p1/"}
+        posted = []
+
+        def slow_format(*args, **kwargs):
+            time.sleep(0.2)
+            return "Formatted body"
+
+        def slow_upload(image, api_url, token):
+            time.sleep(0.2)
+            return hosted_url
+
+        def fake_request(method, url, **kwargs):
+            posted.append(json.loads(kwargs["data"]))
+            return make_response(201, {"posts": [created]})
+
+        with patch.object(
+            main_functions, "gemini_chat_simple", side_effect=slow_format
+        ), patch.object(
+            main_functions, "upload_image_to_ghost", side_effect=slow_upload
+        ) as upload, patch.object(
+            main_functions, "ghost_request", side_effect=fake_request
+        ):
+            result = main_functions.create_ghost_blog_post(
+                title="Hello",
+                content="Body",
+                feature_image=str(image_path),
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+
+        assert result["success"] is True
+        assert result["feature_image"] == hosted_url
+        assert upload.call_count == 1
+        assert posted[0]["posts"][0]["feature_image"] == hosted_url
+        timings = result["timings"]
+        assert timings["text_format"] >= 0.2 and timings["image_upload"] >= 0.2
+        assert timings["total"] < timings["text_format"] + timings["image_upload"]
+
+
+class TestImageBranchCancel:
+    """A failed text branch stops the image branch before it spends anything"""
+
+    def test_text_failure_cancels_generation_and_upload(self):
+        text_failed = threading.Event()
+        generator = MagicMock()
+
+        def chat(prompt, *args, **kwargs):
+            if prompt.startswith("Please format"):
+                return "Text"
+            # Still writing the image description when the text branch fails
+            text_failed.wait(5)
+            time.sleep(0.1)
+            return "A lighthouse"
+
+        def failing_render(*args, **kwargs):
+            text_failed.set()
+            raise RuntimeError("render failed")
+
+        with patch.object(
+            main_functions, "get_image_generator", return_value=generator
+        ), patch.object(
+            main_functions, "gemini_chat_simple", side_effect=chat
+        ), patch.object(
+            main_functions, "MarkdownIt", side_effect=failing_render
+        ), patch.object(
+            main_functions, "upload_image_to_ghost"
+        ) as upload:
+            result = main_functions.create_ghost_blog_post(
+                title="Hello",
+                content="Body",
+                use_generated_feature_image=True,
+                gemini_api_key="key-a",
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+            # Give the image branch time to reach its checkpoint
+            time.sleep(0.5)
+
+        assert result["success"] is False
+        generator.generate_image.assert_not_called()
+        upload.assert_not_called()
+
+
+class TestCombinedLLMCall:
+    """Formatting and the image description share one structured Gemini call"""
+
+    def _create(self, generator, handle, **kwargs):
+        with patch.object(
+            main_functions, "get_image_generator", return_value=generator
+        ), patch.object(
+            main_functions, "gemini_chat_simple", return_value="Separately formatted"
+        ) as chat, patch(
+            "ghost_blog_smart.smart_gateway.get_gemini_model", return_value=handle
+        ), patch.object(
+            main_functions, "general_ghost_post", return_value={"success": True}
+        ) as post:
+            result = main_functions.create_ghost_blog_post(
+                title="Hello",
+                content="Body",
+                use_generated_feature_image=True,
+                gemini_api_key="key-a",
+                **kwargs,
+            )
+        return result, chat, post.call_args.kwargs
+
+    def _generator(self):
+        generator = MagicMock()
+        generator.generate_image.return_value = {"success": False, "error": "skip"}
+        return generator
+
+    def test_single_call_feeds_both_branches(self):
+        handle = MagicMock()
+        handle.generate_content.return_value.text = json.dumps(
+            {"formatted_content": "## Formatted", "image_prompt": "A lighthouse"}
+        )
+        generator = self._generator()
+
+        result, chat, post_params = self._create(
+            generator, handle, combine_llm_calls=True
+        )
+
+        assert result["success"] is True
+        assert handle.generate_content.call_count == 1
+        chat.assert_not_called()
+        assert generator.generate_image.call_args.kwargs["prompt"] == "A lighthouse"
+        assert post_params["content"].strip() == "<h2>Formatted</h2>"
+
+    def test_falls_back_to_separate_calls(self):
+        handle = MagicMock()
+        generator = self._generator()
+
+        result, chat, post_params = self._create(
+            generator, handle, combine_llm_calls=False
+        )
+
+        assert result["success"] is True
+        handle.generate_content.assert_not_called()
+        assert chat.call_count == 2
+        assert "Separately formatted" in post_params["content"]
+
+    def _timed_create(self, **kwargs):
+        def slow_chat(prompt, *args, **kw):
+            # Formatting takes longer than writing the image description
+            time.sleep(0.3 if prompt.startswith("Please format") else 0.1)
+            return "Text"
+
+        def slow_combined(contents, **config):
+            time.sleep(0.3)
+            return MagicMock(
+                text=json.dumps(
+                    {"formatted_content": "Text", "image_prompt": "A lighthouse"}
+                )
+            )
+
+        def slow_generate(**kw):
+            time.sleep(0.2)
+            return {"success": False, "error": "skip"}
+
+        generator = MagicMock()
+        generator.generate_image.side_effect = slow_generate
+        handle = MagicMock()
+        handle.generate_content.side_effect = slow_combined
+
+        started = time.perf_counter()
+        result, chat, _ = self._create(generator, handle, **kwargs)
+        return time.perf_counter() - started, chat, handle
+
+    def test_default_keeps_text_and_image_overlapping(self):
+        elapsed, chat, handle = self._timed_create()
+
+        assert chat.call_count == 2
+        handle.generate_content.assert_not_called()
+        # max(format, image prompt + generation), not their sum
+        assert elapsed < 0.45
+
+    def test_combined_call_serializes_image_generation(self):
+        elapsed, chat, handle = self._timed_create(combine_llm_calls=True)
+
+        chat.assert_not_called()
+        assert handle.generate_content.call_count == 1
+        # Generation can only start once the combined call has returned
+        assert elapsed >= 0.5
+
+
+class TestInMemoryImages:
+    """Generated images can go from the provider to Ghost without temp files"""
+
+    def _png(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), (200, 10, 10)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def test_upload_accepts_bytes(self):
+        png = self._png()
+        hosted = f"{GHOST_URL}/content/images/image.png"
+        with patch.object(
+            main_functions,
+            "ghost_request",
+            return_value=make_response(201, {"images": [{"url": hosted}]}),
+        ) as request:
+            url = main_functions.upload_image_to_ghost(
+                memoryview(png), GHOST_URL, "token"
+            )
+
+        assert url == hosted
+        assert request.call_args.kwargs["files"]["file"] == (
+            "image.png",
+            png,
+            "image/png",
+        )
+
+    def test_upload_rejects_unreadable_bytes(self):
+        with patch.object(main_functions, "ghost_request") as request:
+            url = main_functions.upload_image_to_ghost(b"not an image", GHOST_URL, "t")
+
+        assert url == ""
+        request.assert_not_called()
+
+    def test_generated_bytes_uploaded_without_disk(self):
+        png = self._png()
+        generator = MagicMock()
+        generator.generate_image.return_value = {
+            "success": True,
+            "results": [
+                {"filepath": None, "filename": "blog_feature.png", "image_bytes": png}
+            ],
+        }
+        hosted = f"{GHOST_URL}/content/images/blog_feature.png"
+
+        with patch.object(
+            main_functions, "get_image_generator", return_value=generator
+        ), patch.object(
+            main_functions, "upload_image_to_ghost", return_value=hosted
+        ) as upload, patch.object(
+            main_functions, "general_ghost_post", return_value={"success": True}
+        ) as post:
+            main_functions.create_ghost_blog_post(
+                title="Hello",
+                content="Body",
+                auto_format=False,
+                use_generated_feature_image=True,
+                image_generation_prompt="A lighthouse",
+                save_generated_images=False,
+                gemini_api_key="key-a",
+                ghost_admin_api_key=ADMIN_KEY,
+                ghost_api_url=GHOST_URL,
+            )
+
+        assert generator.generate_image.call_args.kwargs["save_to_disk"] is False
+        assert upload.call_args.args[0] == png
+        assert post.call_args.kwargs["feature_image"] == hosted
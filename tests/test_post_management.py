@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for post listing and batch helpers in post_management
+"""
+
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from ghost_blog_smart import concurrency, post_management
+
+ADMIN_KEY = "68aaca1251d63700017fb41c:" + "ab" * 32
+GHOST_URL = "https://blog.example.com"
+CREDS = {"ghost_admin_api_key": ADMIN_KEY, "ghost_api_url": GHOST_URL}
+
+
+def make_response(status_code=200, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    response.text = ""
+    return response
+
+
+def paged_archive(total, page_size):
+    """Fake Ghost posts browse endpoint serving `total` posts"""
+    calls = []
+
+    def fake_request(method, url, headers=None, params=None, **kwargs):
+        calls.append(dict(params))
+        page, limit = params["page"], params["limit"]
+        pages = max(1, -(-total // limit))
+        start = (page - 1) * limit
+        posts = [{"id": f"p{i}"} for i in range(start, min(start + limit, total))]
+        return make_response(
+            payload={
+                "posts": posts,
+                "meta": {
+                    "pagination": {
+                        "page": page,
+                        "limit": limit,
+                        "pages": pages,
+                        "total": total,
+                        "next": page + 1 if page < pages else None,
+                    }
+                },
+            }
+        )
+
+    return fake_request, calls
+
+
+class TestIterGhostPosts:
+    """Streaming pagination"""
+
+    def test_yields_every_post_across_pages(self):
+        fake_request, calls = paged_archive(total=5, page_size=2)
+        with patch.object(post_management, "ghost_request", side_effect=fake_request):
+            ids = [
+                p["id"]
+                for p in post_management.iter_ghost_posts(
+                    page_size=2, status="published", **CREDS
+                )
+            ]
+
+        assert ids == ["p0", "p1", "p2", "p3", "p4"]
+        assert [c["page"] for c in calls] == [1, 2, 3]
+        assert all(c["filter"] == "status:published" for c in calls)
+
+    def test_is_lazy(self):
+        fake_request, calls = paged_archive(total=10, page_size=2)
+        with patch.object(post_management, "ghost_request", side_effect=fake_request):
+            iterator = post_management.iter_ghost_posts(page_size=2, **CREDS)
+            next(iterator)
+
+        assert len(calls) == 1
+
+    def test_error_status_raises(self):
+        with patch.object(
+            post_management, "ghost_request", return_value=make_response(500)
+        ):
+            with pytest.raises(RuntimeError):
+                list(post_management.iter_ghost_posts(**CREDS))
+
+    def test_summary_uses_pagination(self):
+        fake_request, calls = paged_archive(total=3, page_size=100)
+        with patch.object(post_management, "ghost_request", side_effect=fake_request):
+            result = post_management.get_posts_summary(**CREDS)
+
+        assert result["success"] is True
+        assert result["total_posts"] == 3
+        assert calls[0]["limit"] == post_management.DEFAULT_PAGE_SIZE
+
+
+class TestGetAllPrefetch:
+    """Full-archive listing with concurrent page prefetch"""
+
+    def test_get_all_merges_pages_in_order(self):
+        fake_request, calls = paged_archive(total=7, page_size=2)
+        with patch.object(post_management, "ghost_request", side_effect=fake_request):
+            result = post_management.get_ghost_posts_advanced(
+                get_all=True, page_size=2, max_workers=3, **CREDS
+            )
+
+        assert result["success"] is True
+        assert [p["id"] for p in result["posts"]] == [f"p{i}" for i in range(7)]
+        assert result["total"] == 7
+        assert result["pages"] == 1
+        assert sorted(c["page"] for c in calls) == [1, 2, 3, 4]
+        assert all(c["limit"] == 2 for c in calls)
+
+    def test_get_all_page_failure_reported(self):
+        fake_request, _ = paged_archive(total=6, page_size=2)
+
+        def flaky(method, url, **kwargs):
+            if kwargs["params"]["page"] == 3:
+                return make_response(502)
+            return fake_request(method, url, **kwargs)
+
+        with patch.object(post_management, "ghost_request", side_effect=flaky):
+            result = post_management.get_ghost_posts_advanced(
+                get_all=True, page_size=2, **CREDS
+            )
+
+        assert result["success"] is False
+        assert "page 3" in result["message"]
+
+    def test_get_all_respects_per_host_cap(self):
+        fake_request, _ = paged_archive(total=10, page_size=2)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def tracked(method, url, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+            return fake_request(method, url, **kwargs)
+
+        original = dict(concurrency._concurrency_config)
+        concurrency.configure_batch_concurrency(max_per_host=1)
+        try:
+            with patch.object(post_management, "ghost_request", side_effect=tracked):
+                result = post_management.get_ghost_posts_advanced(
+                    get_all=True, page_size=2, max_workers=4, **CREDS
+                )
+        finally:
+            concurrency.configure_batch_concurrency(**original)
+
+        assert result["success"] is True
+        assert len(result["posts"]) == 10
+        assert max(peak) == 1
+
+
+class TestBatchGetPostDetails:
+    """Chunked id:[...] bulk fetch"""
+
+    def test_single_request_reports_missing(self):
+        def fake_request(method, url, headers=None, params=None, **kwargs):
+            assert params["filter"] == "id:['a','missing','b']"
+            return make_response(
+                payload={
+                    "posts": [
+                        {"id": "b", "html": "<p>two words</p>"},
+                        {"id": "a", "html": "<p>one</p>"},
+                    ]
+                }
+            )
+
+        with patch.object(
+            post_management, "ghost_request", side_effect=fake_request
+        ) as mock_request:
+            result = post_management.batch_get_post_details(
+                ["a", "missing", "b", "a"], **CREDS
+            )
+
+        assert mock_request.call_count == 1
+        assert list(result["posts"]) == ["a", "b"]
+        assert result["posts"]["b"]["word_count"] == 2
+        assert result["failed"] == [
+            {"id": "missing", "error": "Post not found: missing"}
+        ]
+
+    def test_ids_split_into_chunks(self):
+        post_ids = [f"id{i}" for i in range(post_management.BATCH_ID_CHUNK_SIZE + 1)]
+        with patch.object(
+            post_management,
+            "ghost_request",
+            return_value=make_response(payload={"posts": []}),
+        ) as mock_request:
+            result = post_management.batch_get_post_details(post_ids, **CREDS)
+
+        assert mock_request.call_count == 2
+        assert result["total_failed"] == len(post_ids)
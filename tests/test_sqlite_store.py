@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared SQLite store base
+"""
+
+from unittest.mock import patch
+
+from ghost_blog_smart import sqlite_store
+
+
+class CountingStore(sqlite_store.SQLiteStore):
+    schema = (
+        "CREATE TABLE IF NOT EXISTS items ("
+        "key TEXT PRIMARY KEY, created_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+    )
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.connects = 0
+
+    def _on_connect(self, conn):
+        self.connects += 1
+
+
+class TestSQLiteStore:
+    """Per-process connections, WAL mode and TTL/LRU eviction"""
+
+    def test_creates_directory_and_uses_wal(self, tmp_path):
+        store = CountingStore(str(tmp_path / "nested" / "store.sqlite3"))
+        with store._lock:
+            conn = store._connection()
+
+        assert (tmp_path / "nested").is_dir()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_reconnects_after_fork(self, tmp_path):
+        store = CountingStore(str(tmp_path / "store.sqlite3"))
+        first = store._connection()
+        assert store._connection() is first
+
+        with patch.object(sqlite_store.os, "getpid", return_value=-1):
+            second = store._connection()
+
+        assert second is not first
+        assert store.connects == 2
+
+    def test_evict_expired_and_lru(self, tmp_path):
+        store = CountingStore(str(tmp_path / "store.sqlite3"))
+        conn = store._connection()
+        conn.executemany(
+            "INSERT INTO items VALUES (?, ?, ?)",
+            [("old", 0, 0), ("a", 90, 91), ("b", 90, 95), ("c", 90, 93)],
+        )
+
+        sqlite_store.evict_expired_and_lru(conn, "items", 50, 2, now=100)
+
+        keys = [row[0] for row in conn.execute("SELECT key FROM items ORDER BY key")]
+        assert keys == ["b", "c"]
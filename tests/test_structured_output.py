@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for native structured output and local JSON repair
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from ghost_blog_smart import smart_gateway
+from ghost_blog_smart.smart_gateway import BLOG_STRUCTURE_SCHEMA
+from ghost_blog_smart.structured_output import (
+    coerce_to_schema,
+    repair_json,
+    validate_against_schema,
+)
+
+
+class TestRepairJson:
+    """Near-miss responses are fixed without another LLM call"""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('```json\n{"a": 1,}\n```', {"a": 1}),
+            ('Here you go: {"a": [1, 2]} Hope this helps!', {"a": [1, 2]}),
+            ('{"a": "line one\nline two"}', {"a": "line one\nline two"}),
+            ('{"a": "x", "tags": ["one", "tw', {"a": "x", "tags": ["one", "tw"]}),
+            ('{"a": "x", "b": {"c": 1', {"a": "x", "b": {"c": 1}}),
+            ('{"a": "x", "b":', {"a": "x"}),
+            ('{"a": "x", "ti', {"a": "x"}),
+        ],
+    )
+    def test_repairs(self, text, expected):
+        assert repair_json(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "   ", "no json here"])
+    def test_unrepairable(self, text):
+        with pytest.raises(ValueError):
+            repair_json(text)
+
+
+class TestSchemaChecks:
+    """Coercion and validation against BLOG_STRUCTURE_SCHEMA"""
+
+    def test_coerce_fixes_tags(self):
+        data = coerce_to_schema(
+            {
+                "title": "T",
+                "content": "C",
+                "excerpt": "E",
+                "tags": "a, b, c, d, e, f",
+                "use_ai_image": "true",
+            },
+            BLOG_STRUCTURE_SCHEMA,
+        )
+
+        assert data["tags"] == ["a", "b", "c", "d", "e"]
+        assert data["use_ai_image"] is True
+        assert validate_against_schema(data, BLOG_STRUCTURE_SCHEMA) == []
+
+    def test_validation_errors(self):
+        errors = validate_against_schema(
+            {"title": 1, "content": "C", "tags": []}, BLOG_STRUCTURE_SCHEMA
+        )
+
+        assert "$: missing required field 'excerpt'" in errors
+        assert "$.title: expected string, got int" in errors
+        assert "$.tags: expected at least 1 items" in errors
+
+
+class TestGatewayStructuredOutput:
+    """gemini_structured_output_with_schema uses native JSON mode"""
+
+    def _call(self, *texts):
+        responses = [SimpleNamespace(text=text) for text in texts]
+        handle = SimpleNamespace(calls=[])
+
+        def generate_content(contents, **config):
+            handle.calls.append(config)
+            return responses[len(handle.calls) - 1]
+
+        handle.generate_content = generate_content
+        with patch.object(
+            smart_gateway, "get_gemini_model", return_value=handle
+        ), patch.object(smart_gateway.time, "sleep") as sleep:
+            result = smart_gateway.gemini_structured_output_with_schema(
+                "sys",
+                "draft",
+                BLOG_STRUCTURE_SCHEMA,
+                model="gemini-2.5-flash",
+                api_key="key-a",
+                use_cache=False,
+            )
+        return result, handle.calls, sleep
+
+    def test_near_miss_repaired_in_one_call(self):
+        result, calls, sleep = self._call(
+            '```json\n{"title": "T", "content": "C", "excerpt": "E", '
+            '"tags": ["a", "b", "c", "d", "e", "f", "g"]'
+        )
+
+        assert result["success"] is True
+        assert result["data"]["tags"] == ["a", "b", "c", "d", "e"]
+        assert len(calls) == 1
+        assert calls[0]["response_mime_type"] == "application/json"
+        assert calls[0]["response_json_schema"] is BLOG_STRUCTURE_SCHEMA
+        sleep.assert_not_called()
+
+    def test_invalid_output_retried_without_backoff(self):
+        result, calls, sleep = self._call(
+            '{"title": "T"}',
+            '{"title": "T", "content": "C", "excerpt": "E", "tags": ["a"]}',
+        )
+
+        assert result["success"] is True
+        assert result["retries_used"] == 1
+        assert len(calls) == 2
+        sleep.assert_not_called()